@@ -2,13 +2,45 @@
 agent 패키지
 
 LangGraph 기반 사기 탐지 에이전트
+
+하위 모듈은 이름에 처음 접근할 때 import (PEP 562)
+→ agent.nodes.* 하나만 import해도 그래프 / 배치 모듈 전체를 로드하지 않음
 """
 
-from agent.state import AgentState
-from agent.graph import get_graph, create_scam_detection_graph
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from agent.state import AgentState
+    from agent.graph import (
+        create_scam_analysis_graph,
+        create_scam_detection_graph,
+        get_analysis_graph,
+        get_graph,
+    )
+    from agent.batch import detect_batch
+
+# 공개 이름 → 정의 모듈
+_EXPORTS = {
+    "AgentState": "agent.state",
+    "get_graph": "agent.graph",
+    "create_scam_detection_graph": "agent.graph",
+    "create_scam_analysis_graph": "agent.graph",
+    "get_analysis_graph": "agent.graph",
+    "detect_batch": "agent.batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "AgentState",
-    "get_graph",
-    "create_scam_detection_graph",
-]
\ No newline at end of file
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
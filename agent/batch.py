@@ -0,0 +1,190 @@
+"""
+배치 사기 탐지
+
+역할:
+- 여러 메시지를 그래프를 메시지마다 실행하지 않고 단계별로 한꺼번에 처리
+  1. 분류: 메시지별 키워드 분류 (순수 함수)
+  2. 패턴 매칭: 배치 전체를 executor 작업 1개로 처리
+  3. 벡터 검색: 캐시 미스 메시지만 임베딩 1회 배치 호출 + 검색 1회
+     (BM25 어휘 검색과 RRF 결합, 임베딩 실패 / 임베딩 서킷 open 시 BM25만 사용)
+  4. 위험도 분석: 메시지별 점수 산출
+  5. 대응 방안: generate=True면 생성 정책 → 생성 결과 캐시 → LLM(동시 실행 수 제한), 아니면 템플릿
+- 메시지별 오류는 해당 항목에만 기록 (배치 전체는 실패하지 않음)
+- 검색 단계(패턴 / 벡터 / BM25)는 BATCH_SEARCH_TIMEOUT 데드라인, 초과 / 실패 시 빈 결과로 진행하고
+  항목별 degraded_sources에 기록
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from agent.nodes.analyze import assess_risk
+from agent.nodes.classify import classify_message
+from agent.nodes.generate import (
+    PATH_LLM,
+    PATH_TEMPLATE,
+    generate_fallback_response,
+    generate_recommendation,
+    select_generation_path,
+)
+from agent.nodes.retrieve import (
+    _fetch_with_deadline,
+    analyze_realtime_patterns,
+    search_lexical,
+    search_vector_store_batch,
+)
+from infrastructure.circuit_breaker import is_circuit_available
+from infrastructure.vector_store.lexical_index import reciprocal_rank_fusion
+from langchain_core.documents import Document
+
+BatchItem = Tuple[str, Optional[str]]
+
+
+def _analyze_patterns_batch(items: List[BatchItem]) -> List[Any]:
+    """배치 패턴 분석 (항목별 예외는 결과 자리에 담아 반환)"""
+    results: List[Any] = []
+    for message, sender in items:
+        try:
+            results.append(analyze_realtime_patterns(message, sender))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _search_lexical_batch(messages: List[str], k: int) -> List[List[Document]]:
+    return [search_lexical(message, k) for message in messages]
+
+
+async def detect_batch(
+    items: List[BatchItem], generate: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    배치 사기 탐지
+
+    Args:
+        items: (메시지, 발신자) 리스트
+        generate: LLM으로 대응 방안 생성 여부 (False면 템플릿 응답)
+
+    Returns:
+        항목별 결과 (입력 순서), 실패 항목은 {"error": ...}
+        (결과 없이 진행한 검색 소스는 degraded_sources)
+    """
+    from app.config import settings
+
+    start_time = time.time()
+    messages = [message for message, _ in items]
+    n = len(items)
+
+    # 1. 분류
+    classifications = [classify_message(message) for message in messages]
+
+    # 2~3. 패턴 / 벡터 / BM25 검색을 배치 단위로 동시에 실행
+    # (임베딩 서킷 open이면 벡터 검색 생략, BM25만 사용)
+    use_dense = is_circuit_available("embedding")
+
+    # 데드라인 초과 / 실패 시 None (아래에서 항목별 빈 결과로 대체)
+    async def _dense() -> Optional[List[List[Document]]]:
+        if not use_dense:
+            return [[] for _ in messages]
+        return await _fetch_with_deadline(
+            "RAG 검색(배치)", search_vector_store_batch, messages, 5,
+            source="rag_batch", timeout=settings.BATCH_SEARCH_TIMEOUT, default=None,
+        )
+
+    async def _lexical() -> Optional[List[List[Document]]]:
+        if not settings.HYBRID_SEARCH_ENABLED and use_dense:
+            return [[] for _ in messages]
+        return await _fetch_with_deadline(
+            "BM25 검색(배치)", _search_lexical_batch, messages, 5,
+            source="bm25_batch", timeout=settings.BATCH_SEARCH_TIMEOUT, default=None,
+        )
+
+    # 패턴 분석도 배치 전체가 작업 1개이므로 단건 PATTERN_TIMEOUT이 아닌 배치 데드라인 적용
+    pattern_results, dense_lists, lexical_lists = await asyncio.gather(
+        _fetch_with_deadline(
+            "패턴 분석(배치)", _analyze_patterns_batch, items,
+            source="pattern_batch", timeout=settings.BATCH_SEARCH_TIMEOUT, default=None,
+        ),
+        _dense(),
+        _lexical(),
+    )
+
+    degraded_sources: List[str] = []
+    if pattern_results is None:
+        degraded_sources.append("patterns")
+        pattern_results = [([], {}) for _ in range(n)]
+    if dense_lists is None:
+        degraded_sources.append("vector")
+        dense_lists = [[] for _ in range(n)]
+    if lexical_lists is None:
+        degraded_sources.append("bm25")
+        lexical_lists = [[] for _ in range(n)]
+
+    # 4. 항목별 위험도 분석
+    prepared: List[Dict[str, Any]] = []
+    for idx, (message, sender) in enumerate(items):
+        try:
+            pattern_result = pattern_results[idx]
+            if isinstance(pattern_result, Exception):
+                raise pattern_result
+            pattern_docs, pattern_analysis = pattern_result
+
+            scam_type, confidence = classifications[idx]
+            rag_docs = reciprocal_rank_fusion(
+                [dense_lists[idx], lexical_lists[idx]], k=5, rrf_k=settings.RRF_K
+            )
+            similar_cases = rag_docs + pattern_docs
+            matched_patterns = pattern_analysis.get("scam_matches", [])
+
+            prepared.append(
+                {
+                    "message": message,
+                    "sender": sender,
+                    "scam_type": scam_type,
+                    "confidence": confidence,
+                    "similar_cases": similar_cases,
+                    "matched_patterns": matched_patterns,
+                    "degraded_sources": list(degraded_sources),
+                    **assess_risk(scam_type, confidence, matched_patterns, similar_cases),
+                }
+            )
+        except Exception as e:
+            prepared.append({"error": f"분석 실패: {e}"})
+
+    # 5. 대응 방안 (LLM은 동시 실행 수 제한)
+    semaphore = asyncio.Semaphore(settings.BATCH_LLM_CONCURRENCY)
+
+    async def _finish(state: Dict[str, Any]) -> Dict[str, Any]:
+        if "error" in state:
+            return state
+        try:
+            if generate:
+                # 생성 정책상 템플릿 대상은 LLM 슬롯을 기다리지 않음
+                needs_llm = select_generation_path(state) == PATH_LLM
+                async with semaphore if needs_llm else contextlib.nullcontext():
+                    generated = await generate_recommendation(state)
+            else:
+                generated = {
+                    "analysis": generate_fallback_response(
+                        scam_type=state["scam_type"],
+                        risk_level=state["risk_level"],
+                        risk_score=state["risk_score"],
+                        is_scam=state["is_scam"],
+                        risk_factors=state["risk_factors"],
+                    ),
+                    "generation_path": PATH_TEMPLATE,
+                    "prompt_tokens": None,
+                    "llm_model": None,
+                }
+
+            return {
+                **state,
+                **generated,
+                "recommendations": generated["analysis"],
+                "processing_time": time.time() - start_time,
+            }
+        except Exception as e:
+            return {"error": f"대응 방안 생성 실패: {e}"}
+
+    return list(await asyncio.gather(*(_finish(state) for state in prepared)))
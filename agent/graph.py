@@ -3,12 +3,104 @@ LangGraph 워크플로우 정의
 사기 탐지 에이전트의 핵심
 """
 
-from langgraph.graph import StateGraph, END
-from agent.state import AgentState
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from langgraph.graph import StateGraph, START, END
+from agent.state import AgentState, TraceInfo
 from agent.nodes.classify import classify_scam_type
-from agent.nodes.retrieve import retrieve_similar_cases
+from agent.nodes.screen import route_after_screen, screen_message
+from agent.nodes.retrieve import match_patterns, retrieve_similar_cases
 from agent.nodes.analyze import analyze_risk
 from agent.nodes.generate import recommend_actions
+from infrastructure.metrics import NODE_METRICS
+
+logger = logging.getLogger(__name__)
+
+Node = Callable[[AgentState], Awaitable[Dict[str, Any]]]
+
+
+# 실행 요약에서 제외할 키 (긴 본문 / 별도 기록)
+_SUMMARY_SKIP = ("analysis", "recommendations", "stage_timings", "traces")
+
+
+def _summarize(update: Dict[str, Any]) -> Optional[str]:
+    """노드 결과 요약 (TraceInfo.model_output_summary, 목록은 개수만)"""
+    parts = []
+    for key, value in update.items():
+        if key in _SUMMARY_SKIP or value is None:
+            continue
+        if isinstance(value, (list, dict)):
+            parts.append(f"{key}={len(value)}")
+        elif isinstance(value, float):
+            parts.append(f"{key}={value:.2f}")
+        else:
+            parts.append(f"{key}={value}")
+    return ", ".join(parts)[:200] or None
+
+
+def _timed(name: str, node: Node) -> Node:
+    """
+    노드 계측 래퍼
+
+    - 소요 시간을 stage_timings에 기록 (병렬 브랜치별 지연 추적, LangSmith 트레이스에도 노출)
+    - 실행 / 대기 시간, 결과를 노드별 메트릭에 기록 (/metrics)
+    - TraceInfo 1개를 traces에 추가 (노드 안에서 폴백 처리된 오류 포함)
+    """
+
+    async def run(state: AgentState) -> Dict[str, Any]:
+        start = time.perf_counter()
+        with NODE_METRICS.track(name) as call:
+            update = await node(state)
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        trace = TraceInfo(
+            trace_id=state.get("trace_id") or "",
+            node_name=name,
+            latency_ms=elapsed_ms,
+            queue_ms=round(call.span.queue_wait * 1000, 1),
+            model_output_summary=_summarize(update),
+            errors=list(call.span.errors),
+        )
+        return {**update, "stage_timings": {name: elapsed_ms}, "traces": [trace]}
+
+    run.__name__ = node.__name__
+    run.__doc__ = node.__doc__
+    return run
+
+
+def _add_analysis_nodes(workflow: StateGraph) -> None:
+    """
+    analyze까지의 공통 구간
+
+    classify / patterns는 메시지만 필요 → START에서 병렬 브랜치로 분기.
+    SCREEN_ENABLED이면 두 브랜치가 screen에서 합류한 뒤 불명확한 경우만 retrieve,
+    아니면 retrieve도 같은 단계에서 병렬 실행하고 analyze에서 합류
+    (similar_cases / stage_timings는 AgentState 리듀서로 병합)
+    """
+    from app.config import settings
+
+    workflow.add_node("classify", _timed("classify", classify_scam_type))
+    workflow.add_node("patterns", _timed("patterns", match_patterns))
+    workflow.add_node("retrieve", _timed("retrieve", retrieve_similar_cases))
+    workflow.add_node("analyze", _timed("analyze", analyze_risk))
+
+    workflow.add_edge(START, "classify")
+    workflow.add_edge(START, "patterns")
+
+    if settings.SCREEN_ENABLED:
+        workflow.add_node("screen", _timed("screen", screen_message))
+        workflow.add_edge(["classify", "patterns"], "screen")
+        # 명백한 safe / scam은 retrieve 생략 (recommend도 템플릿 응답)
+        workflow.add_conditional_edges(
+            "screen",
+            route_after_screen,
+            {"retrieve": "retrieve", "analyze": "analyze"},
+        )
+        workflow.add_edge("retrieve", "analyze")
+    else:
+        workflow.add_edge(START, "retrieve")
+        workflow.add_edge(["classify", "patterns", "retrieve"], "analyze")
 
 
 def create_scam_detection_graph() -> StateGraph:
@@ -17,14 +109,18 @@ def create_scam_detection_graph() -> StateGraph:
 
     워크플로우:
     START
+      ↓ (병렬 브랜치)
+    classify (사기 유형 분류) ∥ patterns (실시간 패턴 매칭)
+      ↓ (합류)
+    screen (1차 선별 - 로컬 패턴 매칭 예비 점수)
+      ↓ uncertain              ↓ safe / scam
+    retrieve (유사 사례 검색 - RAG)   │
+      ↓                        │
+    analyze (위험도 분석) ←─────┘
       ↓
-    classify (사기 유형 분류)
-      ↓
-    retrieve (유사 사례 검색 - RAG)
-      ↓
-    analyze (위험도 분석)
-      ↓
-    recommend (대응 방안 생성)
+    recommend (대응 방안 생성, 선별 판정 시 템플릿)
+
+    SCREEN_ENABLED=false면 classify ∥ patterns ∥ retrieve → analyze
       ↓
     END
 
@@ -35,16 +131,10 @@ def create_scam_detection_graph() -> StateGraph:
     # 그래프 생성
     workflow = StateGraph(AgentState)
 
-    # 노드추가
-    workflow.add_node("classify", classify_scam_type)
-    workflow.add_node("retrieve", retrieve_similar_cases)
-    workflow.add_node("analyze", analyze_risk)
-    workflow.add_node("recommend", recommend_actions)
+    # 노드추가 + 엣지정의
+    _add_analysis_nodes(workflow)
+    workflow.add_node("recommend", _timed("recommend", recommend_actions))
 
-    # 엣지정의
-    workflow.set_entry_point("classify")
-    workflow.add_edge("classify", "retrieve")
-    workflow.add_edge("retrieve", "analyze")
     workflow.add_edge("analyze", "recommend")
     workflow.add_edge("recommend", END)
 
@@ -52,22 +142,46 @@ def create_scam_detection_graph() -> StateGraph:
     return workflow.compile()
 
 
+def create_scam_analysis_graph() -> StateGraph:
+    """
+    판정 전용 그래프 (스트리밍 API용)
+
+    (classify ∥ patterns) → screen → (retrieve) → analyze → END
+    대응 방안은 호출 측에서 LLM 스트리밍으로 생성
+
+    Returns:
+        컴파일된 StateGraph
+    """
+    workflow = StateGraph(AgentState)
+    _add_analysis_nodes(workflow)
+    workflow.add_edge("analyze", END)
+    return workflow.compile()
+
+
 # 전역 그래프를 인스턴스
 
 # 앱 시작 시 한번만 생성하는 함수
 _scam_detection_graph = None
+_scam_analysis_graph = None
 
 
 def get_graph():
     """그래프 싱글톤"""
     global _scam_detection_graph
     if _scam_detection_graph is None:
-        print("🔨 LangGraph 워크플로우 생성 중...")
         _scam_detection_graph = create_scam_detection_graph()
-        print("✅ LangGraph 워크플로우 준비 완료!")
+        logger.info("LangGraph 워크플로우 준비 완료")
     return _scam_detection_graph
 
 
+def get_analysis_graph():
+    """판정 전용 그래프 싱글톤 (recommend 제외)"""
+    global _scam_analysis_graph
+    if _scam_analysis_graph is None:
+        _scam_analysis_graph = create_scam_analysis_graph()
+    return _scam_analysis_graph
+
+
 if __name__ == "__main__":
     # 그래프 시각화 (선택)
     graph = create_scam_detection_graph()
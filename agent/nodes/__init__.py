@@ -5,12 +5,15 @@ LangGraph 워크플로우 노드들
 """
 
 from agent.nodes.classify import classify_scam_type
-from agent.nodes.retrieve import retrieve_similar_cases
+from agent.nodes.screen import screen_message
+from agent.nodes.retrieve import match_patterns, retrieve_similar_cases
 from agent.nodes.analyze import analyze_risk
 from agent.nodes.generate import recommend_actions
 
 __all__ = [
     "classify_scam_type",
+    "screen_message",
+    "match_patterns",
     "retrieve_similar_cases",
     "analyze_risk",
     "recommend_actions",
@@ -8,11 +8,14 @@
 - 사기 여부 판단
 """
 
+import logging
 import time
 from datetime import datetime
 from typing import Dict, List
 from agent.state import AgentState
 
+logger = logging.getLogger(__name__)
+
 NODE_NAME = "analyze"
 
 # 위험도 계산
@@ -150,6 +153,34 @@ def determine_scam(risk_level: str, risk_score: int) -> bool:
     return False
 
 
+def assess_risk(
+    scam_type: str,
+    confidence: float,
+    matched_patterns: List[Dict],
+    similar_cases: List,
+) -> Dict:
+    """
+    위험도 점수 / 레벨 / 사기 여부 일괄 산출 (단건 노드 / 배치 처리 공용)
+
+    Returns:
+        {"risk_level", "risk_score", "risk_factors", "is_scam"}
+    """
+    risk_score, risk_factors = calculate_risk_score(
+        scam_type=scam_type,
+        confidence=confidence,
+        matched_patterns=matched_patterns,
+        similar_cases=similar_cases,
+    )
+    risk_level = get_risk_level(risk_score)
+
+    return {
+        "risk_level": risk_level,
+        "risk_score": risk_score,
+        "risk_factors": risk_factors,
+        "is_scam": determine_scam(risk_level, risk_score),
+    }
+
+
 # ========== 메인 노드 함수 ========== #
 
 async def analyze_risk(state: AgentState) -> Dict:
@@ -162,48 +193,32 @@ async def analyze_risk(state: AgentState) -> Dict:
     Returns:
         업데이트된 상태
     """
-    print("\n" + "="*60)
-    print("⚠️  [3/4] 위험도 분석 중...")
-    print("="*60)
-    
     # 상태에서 정보 추출
     scam_type = state.get("scam_type", "알 수 없음")
     confidence = state.get("confidence", 0.5)
     matched_patterns = state.get("matched_patterns", [])
     similar_cases = state.get("similar_cases", [])
     
-    print(f"  → 사기 유형: {scam_type} (신뢰도: {confidence:.0%})")
-    print(f"  → 매칭 패턴: {len(matched_patterns)}개")
-    print(f"  → 유사 사례: {len(similar_cases)}개")
-    
-    # 위험도 점수 계산
-    risk_score, risk_factors = calculate_risk_score(
+    # 위험도 점수 / 레벨 / 사기 여부
+    assessment = assess_risk(
         scam_type=scam_type,
         confidence=confidence,
         matched_patterns=matched_patterns,
-        similar_cases=similar_cases
+        similar_cases=similar_cases,
+    )
+
+    logger.debug(
+        "위험도 분석",
+        extra={
+            "scam_type": scam_type,
+            "matched_patterns": len(matched_patterns),
+            "similar_cases": len(similar_cases),
+            "risk_level": assessment["risk_level"],
+            "risk_score": assessment["risk_score"],
+            "is_scam": assessment["is_scam"],
+            "risk_factors": assessment["risk_factors"],
+        },
     )
-    
-    # 위험도 레벨
-    risk_level = get_risk_level(risk_score)
-    
-    # 사기 여부 판단
-    is_scam = determine_scam(risk_level, risk_score)
-    
-    # 결과 출력
-    print(f"\n  📊 분석 결과:")
-    print(f"  → 위험도: {risk_level} ({risk_score}점)")
-    print(f"  → 사기 여부: {'🚨 예 (사기)' if is_scam else '✅ 아니오 (정상)'}")
-    
-    if risk_factors:
-        print(f"\n  🔍 위험 요인:")
-        for idx, factor in enumerate(risk_factors, 1):
-            print(f"    {idx}. {factor}")
     
     # 상태 업데이트
-    return {
-        "risk_level": risk_level,
-        "risk_score": risk_score,
-        "risk_factors": risk_factors,
-        "is_scam": is_scam
-    }
\ No newline at end of file
+    return assessment
\ No newline at end of file
@@ -6,25 +6,23 @@
 - 간단하고 빠르게 (복잡한 LLM 호출 없이)
 """
 
-from typing import Dict
+import logging
+from typing import Dict, Tuple
 from agent.state import AgentState
 
+logger = logging.getLogger(__name__)
 
-async def classify_scam_type(state: AgentState) -> Dict:
+
+def classify_message(message: str) -> Tuple[str, float]:
     """
-    사기 유형 분류 (간단 버전)
+    키워드 기반 사기 유형 분류 (단건 노드 / 배치 처리 공용)
 
     Args:
-        state: 에이전트 상태
+        message: 분석할 메시지
 
     Returns:
-        업데이트된 상태 (scam_type, confidence 추가)
+        (사기 유형, 신뢰도)
     """
-    print("\n" + "=" * 60)
-    print("🔍 [1/4] 사기 유형 분류 중...")
-    print("=" * 60)
-
-    message = state["message"]
     message_lower = message.lower()
 
     # 간닪한 키워드 기반 분류
@@ -101,8 +99,24 @@ async def classify_scam_type(state: AgentState) -> Dict:
         scam_type = "투자사기"
         confidence = 0.8
 
-    print(f"  → 분류: {scam_type}")
-    print(f"  → 신뢰도: {confidence:.2f}")
+    return scam_type, confidence
+
+
+async def classify_scam_type(state: AgentState) -> Dict:
+    """
+    사기 유형 분류 (간단 버전)
+
+    Args:
+        state: 에이전트 상태
+
+    Returns:
+        업데이트된 상태 (scam_type, confidence 추가)
+    """
+    scam_type, confidence = classify_message(state["message"])
+
+    logger.debug(
+        "사기 유형 분류", extra={"scam_type": scam_type, "confidence": round(confidence, 2)}
+    )
 
     # 상태 업데이트
     return {"scam_type": scam_type, "confidence": confidence}
@@ -7,10 +7,20 @@
 - 기존 scam_defense.py의 _generate_unified_answer() 로직 활용
 """
 
-from typing import Dict, List, Optional, Any
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple
 from agent.state import AgentState
+from infrastructure.circuit_breaker import CircuitOpenError, is_circuit_available
+from infrastructure.llm.router import ModelRoute, route_model
+from infrastructure.llm.tokens import estimate_tokens, truncate_to_tokens
 from langchain_core.documents import Document
 
+logger = logging.getLogger(__name__)
+
 
 # 문서 포매팅 유틸리티
 def format_documents(documents: List[Document], max_docs: int = 5) -> str:
@@ -96,7 +106,137 @@ UNIFIED_SYSTEM_PROMPT = """
 """
 
 
-def build_llm_prompt(
+# 프롬프트 스니펫 패킹: 섹션별 (최대 개수, 같은 순위일 때 우선순위 순서)
+_SNIPPET_SECTIONS = (
+    ("pattern", 3),  # 실시간 사기 DB 매칭 (정확 매칭)
+    ("rag", 3),  # Knowledge Base (RRF 순위)
+    ("news", 2),  # 최신 사기 뉴스
+)
+_SNIPPET_CHARS = 200
+_DEDUP_THRESHOLD = 0.8
+_MIN_MESSAGE_TOKENS = 128
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _shingles(text: str) -> Set[str]:
+    """중복 판정용 문자 3-gram 집합 (NFKC + 소문자 + 기호/공백 제거)"""
+    normalized = _NON_WORD_RE.sub("", unicodedata.normalize("NFKC", text).lower())
+    if len(normalized) <= 3:
+        return {normalized}
+    return {normalized[i : i + 3] for i in range(len(normalized) - 2)}
+
+
+def _is_near_duplicate(shingles: Set[str], accepted: List[Set[str]]) -> bool:
+    for other in accepted:
+        union = len(shingles | other)
+        if union and len(shingles & other) / union >= _DEDUP_THRESHOLD:
+            return True
+    return False
+
+
+def pack_snippets(
+    sections: Dict[str, List[Document]], token_budget: Optional[int]
+) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+    """
+    관련도 순 스니펫 패킹
+
+    - 후보: 섹션별 상위 N개 문서 (각 200자)
+    - 순서: 섹션 내 순위 → 같은 순위면 패턴 > RAG > 뉴스
+    - 이미 고른 스니펫과 거의 같은 내용(3-gram Jaccard 0.8 이상)은 제외
+    - 예산을 넘는 스니펫은 건너뛰고 더 짧은 다음 후보 시도
+
+    Args:
+        sections: {"pattern" | "rag" | "news": 문서 리스트 (관련도 순)}
+        token_budget: 스니펫에 쓸 토큰 예산 (None이면 무제한)
+
+    Returns:
+        (섹션별 스니펫 텍스트, {"snippets", "deduplicated", "dropped"})
+    """
+    candidates = []
+    for priority, (name, limit) in enumerate(_SNIPPET_SECTIONS):
+        for rank, doc in enumerate(sections.get(name, [])[:limit]):
+            meta = doc.metadata or {}
+            label = (
+                meta.get("scam_type")
+                or meta.get("source")
+                or meta.get("title")
+                or f"문서{rank + 1}"
+            )
+            content = doc.page_content.strip()[:_SNIPPET_CHARS]
+            candidates.append((rank, priority, name, f"[{label}] {content}", content))
+    candidates.sort(key=lambda c: (c[0], c[1]))
+
+    packed: Dict[str, List[str]] = {name: [] for name, _ in _SNIPPET_SECTIONS}
+    accepted: List[Set[str]] = []
+    remaining = token_budget
+    deduplicated = dropped = 0
+
+    for _, _, name, text, content in candidates:
+        shingles = _shingles(content)
+        if _is_near_duplicate(shingles, accepted):
+            deduplicated += 1
+            continue
+
+        cost = estimate_tokens(text) + 1  # 구분 줄바꿈
+        if remaining is not None and cost > remaining:
+            dropped += 1
+            continue
+
+        packed[name].append(text)
+        accepted.append(shingles)
+        if remaining is not None:
+            remaining -= cost
+
+    return packed, {
+        "snippets": len(accepted),
+        "deduplicated": deduplicated,
+        "dropped": dropped,
+    }
+
+
+def _render_prompt(
+    message: str,
+    sender: Optional[str],
+    scam_type: str,
+    risk_level: str,
+    risk_score: int,
+    pattern_analysis: str,
+    snippets: Dict[str, List[str]],
+) -> str:
+    def _section(name: str) -> str:
+        return "\n\n".join(snippets.get(name, [])) or "관련정보 없음"
+
+    news = ""
+    if snippets.get("news"):
+        news = f"""
+**최신 사기 뉴스:**
+{_section("news")}
+"""
+
+    return f"""
+**의심 메시지:**
+{message}
+
+**발신자:** {sender or '미제공'}
+
+**분석 결과:**
+- 사기 유형: {scam_type}
+- 위험도: {risk_level} ({risk_score}점)
+
+**실시간 패턴 분석:**
+{pattern_analysis}
+
+**Knowledge Base (과거 유사 사례):**
+{_section("rag")}
+
+**실시간 사기 DB 매칭:**
+{_section("pattern")}
+{news}
+위 정보를 바탕으로 즉시 대응 가이드를 작성하라.
+"""
+
+
+def assemble_llm_prompt(
     message: str,
     sender: Optional[str],
     scam_type: str,
@@ -104,9 +244,15 @@ def build_llm_prompt(
     risk_score: int,
     matched_patterns: List[Dict[str, Any]],
     similar_cases: List[Document],
-) -> str:
+    news_docs: Optional[List[Document]] = None,
+    token_budget: Optional[int] = None,
+) -> Tuple[str, Dict[str, int]]:
     """
-    LLM 프롬프트 구성
+    입력 토큰 예산 안에서 LLM 프롬프트 구성
+
+    메시지 / 분석 결과 / 패턴 분석은 항상 포함하고 (메시지가 예산을 넘으면 뒤를 자름),
+    남은 예산에 RAG / 패턴 / 뉴스 스니펫을 관련도 순으로 채움.
+    예산은 시스템 프롬프트 포함 입력 전체 기준
 
     Args:
         message: 의심 메시지
@@ -115,11 +261,17 @@ def build_llm_prompt(
         risk_level: 위험도 레벨
         risk_score: 위험도 점수
         matched_patterns: 매칭된 패턴
-        similar_cases: 유사 사례
+        similar_cases: 유사 사례 (RAG + 패턴 문서)
+        news_docs: 최신 뉴스 문서
+        token_budget: 입력 토큰 예산 (None이면 LLM_PROMPT_TOKEN_BUDGET, 0이면 무제한)
 
     Returns:
-        프롬프트 텍스트
+        (프롬프트 텍스트, {"prompt_tokens", "snippets", "deduplicated", "dropped"})
     """
+    if token_budget is None:
+        from app.config import settings
+
+        token_budget = settings.LLM_PROMPT_TOKEN_BUDGET
 
     # RAG 문서
     rag_docs = [
@@ -131,28 +283,72 @@ def build_llm_prompt(
         doc for doc in similar_cases if doc.metadata.get("origin") == "pattern_matching"
     ]
 
-    prompt = f"""
-**의심 메시지:**
-{message}
+    pattern_analysis = format_pattern_analysis(matched_patterns, risk_level, risk_score)
+    system_tokens = estimate_tokens(UNIFIED_SYSTEM_PROMPT)
 
-**발신자:** {sender or '미제공'}
-
-**분석 결과:**
-- 사기 유형: {scam_type}
-- 위험도: {risk_level} ({risk_score}점)
+    snippet_budget: Optional[int] = None
+    if token_budget:
+        # 스니펫 없는 골격이 예산을 넘으면 메시지 뒤를 잘라냄
+        skeleton = _render_prompt(
+            message, sender, scam_type, risk_level, risk_score, pattern_analysis, {}
+        )
+        overflow = system_tokens + estimate_tokens(skeleton) - token_budget
+        if overflow > 0:
+            message = truncate_to_tokens(
+                message, max(_MIN_MESSAGE_TOKENS, estimate_tokens(message) - overflow)
+            )
+            skeleton = _render_prompt(
+                message, sender, scam_type, risk_level, risk_score, pattern_analysis, {}
+            )
+        snippet_budget = max(0, token_budget - system_tokens - estimate_tokens(skeleton))
+
+    snippets, stats = pack_snippets(
+        {"pattern": pattern_docs, "rag": rag_docs, "news": news_docs or []},
+        snippet_budget,
+    )
+    prompt = _render_prompt(
+        message, sender, scam_type, risk_level, risk_score, pattern_analysis, snippets
+    )
 
-**실시간 패턴 분석:**
-{format_pattern_analysis(matched_patterns, risk_level, risk_score)}
+    return prompt, {"prompt_tokens": system_tokens + estimate_tokens(prompt), **stats}
 
-**Knowledge Base (과거 유사 사례):**
-{format_documents(rag_docs, max_docs=3)}
 
-**실시간 사기 DB 매칭:**
-{format_documents(pattern_docs, max_docs=3)}
+def build_llm_prompt(
+    message: str,
+    sender: Optional[str],
+    scam_type: str,
+    risk_level: str,
+    risk_score: int,
+    matched_patterns: List[Dict[str, Any]],
+    similar_cases: List[Document],
+    news_docs: Optional[List[Document]] = None,
+) -> str:
+    """
+    LLM 프롬프트 구성 (입력 토큰 예산 적용, assemble_llm_prompt 참고)
 
-위 정보를 바탕으로 즉시 대응 가이드를 작성하라.
-"""
+    Args:
+        message: 의심 메시지
+        sender: 발신자
+        scam_type: 사기 유형
+        risk_level: 위험도 레벨
+        risk_score: 위험도 점수
+        matched_patterns: 매칭된 패턴
+        similar_cases: 유사 사례
+        news_docs: 최신 뉴스 문서
 
+    Returns:
+        프롬프트 텍스트
+    """
+    prompt, _ = assemble_llm_prompt(
+        message=message,
+        sender=sender,
+        scam_type=scam_type,
+        risk_level=risk_level,
+        risk_score=risk_score,
+        matched_patterns=matched_patterns,
+        similar_cases=similar_cases,
+        news_docs=news_docs,
+    )
     return prompt
 
 def generate_fallback_response(
@@ -268,56 +464,336 @@ def generate_fallback_response(
     return response
 
 # LLM호출
-async def generate_with_llm(
-    prompt: str, system_prompt: str = UNIFIED_SYSTEM_PROMPT,
-    max_retries: int =2,
+async def _call_llm(
+    prompt: str,
+    system_prompt: str = UNIFIED_SYSTEM_PROMPT,
+    route: Optional[ModelRoute] = None,
 ) -> str:
+    """LLM 호출 (route가 있으면 해당 모델 / max_tokens, 실패 시 예외 그대로 전달)"""
+    from infrastructure.llm.provider import get_upstage_client
+
+    # 프로세스 전역 모델별 클라이언트 (연결 풀 공유)
+    llm = get_upstage_client(route.model if route else None)
+
+    response = await llm.generate(
+        prompt=prompt,
+        system_prompt=system_prompt,
+        max_tokens=route.max_tokens if route else None,
+    )
+
+    return response.strip()
+
+
+# 생성 결과 캐시 키
+def generation_signature(
+    message: str,
+    sender: Optional[str],
+    scam_type: str,
+    risk_level: str,
+    risk_score: int,
+    matched_patterns: List[Dict[str, Any]],
+    similar_cases: List[Document],
+    include_message: bool = True,
+    news_docs: Optional[List[Document]] = None,
+    model: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """
+    build_llm_prompt 입력의 정규화 시그니처 (생성 결과 캐시 키)
+
+    프롬프트에 실제로 들어가는 정보만 사용:
+    - 모델 설정 / 시스템 프롬프트 (model / max_tokens 미지정 시 LLM_MODEL / LLM_MAX_TOKENS)
+    - 사기 유형, 위험도 레벨 / 점수
+    - 매칭 패턴 집합 (pattern_id, 위험 등급, 매칭 키워드)
+    - 검색 문서 집합 (RAG / 패턴 문서 각 상위 3개, 뉴스 상위 2개, 내용 해시)
+    - 입력 토큰 예산 (예산이 바뀌면 프롬프트에 들어가는 스니펫이 달라짐)
+    - include_message=True면 정규화된 원문 메시지 + 발신자
+
+    Returns:
+        sha256 hex
+    """
+    from app.config import settings
+    from infrastructure.vector_store.embedding_cache import normalize_text
+    from infrastructure.vector_store.lexical_index import document_key
+
+    rag_docs = [
+        doc for doc in similar_cases if doc.metadata.get("origin") != "pattern_matching"
+    ]
+    pattern_docs = [
+        doc for doc in similar_cases if doc.metadata.get("origin") == "pattern_matching"
+    ]
+
+    payload: Dict[str, Any] = {
+        "model": model or settings.LLM_MODEL,
+        "temperature": settings.LLM_TEMPERATURE,
+        "max_tokens": max_tokens or settings.LLM_MAX_TOKENS,
+        "prompt_budget": settings.LLM_PROMPT_TOKEN_BUDGET,
+        "system": hashlib.sha256(UNIFIED_SYSTEM_PROMPT.encode("utf-8")).hexdigest(),
+        "scam_type": scam_type,
+        "risk_level": risk_level,
+        "risk_score": risk_score,
+        "patterns": sorted(
+            [
+                str(p.get("pattern_id") or p.get("scam_type", "")),
+                str(p.get("danger_level", "정보")),
+                sorted(p.get("matched_patterns", [])[:3]),
+            ]
+            for p in matched_patterns[:5]
+        ),
+        "rag_docs": sorted(document_key(doc) for doc in rag_docs[:3]),
+        "pattern_docs": sorted(document_key(doc) for doc in pattern_docs[:3]),
+        "news_docs": sorted(document_key(doc) for doc in (news_docs or [])[:2]),
+    }
+    if include_message:
+        payload["message"] = normalize_text(message)
+        payload["sender"] = normalize_text(sender or "")
+
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def route_from_state(state: AgentState) -> ModelRoute:
+    """분석이 끝난 상태에서 LLM 모델 / max_tokens 선택"""
+    return route_model(state.get("risk_level"), state.get("risk_score"))
+
+
+def signature_from_state(state: AgentState, route: Optional[ModelRoute] = None) -> str:
+    """분석이 끝난 상태에서 생성 결과 캐시 키 구성 (모델이 다르면 다른 키)"""
+    from app.config import settings
+
+    route = route or route_from_state(state)
+    return generation_signature(
+        message=state["message"],
+        sender=state.get("sender"),
+        scam_type=state.get("scam_type"),
+        risk_level=state.get("risk_level", "알 수 없음"),
+        risk_score=state.get("risk_score", 0),
+        matched_patterns=state.get("matched_patterns", []),
+        similar_cases=state.get("similar_cases", []),
+        include_message=settings.GENERATION_CACHE_INCLUDE_MESSAGE,
+        news_docs=state.get("news_docs", []),
+        model=route.model,
+        max_tokens=route.max_tokens,
+    )
+
+
+def build_prompt_from_state(state: AgentState) -> Tuple[str, Dict[str, int]]:
+    """분석이 끝난 상태에서 LLM 프롬프트 구성 (프롬프트, 패킹 통계)"""
+    return assemble_llm_prompt(
+        message=state["message"],
+        sender=state.get("sender"),
+        scam_type=state.get("scam_type"),
+        risk_level=state.get("risk_level", "알 수 없음"),
+        risk_score=state.get("risk_score", 0),
+        matched_patterns=state.get("matched_patterns", []),
+        similar_cases=state.get("similar_cases", []),
+        news_docs=state.get("news_docs", []),
+    )
+
+
+def fallback_from_state(state: AgentState) -> str:
+    """분석이 끝난 상태에서 템플릿 응답 구성"""
+    return generate_fallback_response(
+        scam_type=state.get("scam_type"),
+        risk_level=state.get("risk_level", "알 수 없음"),
+        risk_score=state.get("risk_score", 0),
+        is_scam=state.get("is_scam", False),
+        risk_factors=state.get("risk_factors", []),
+    )
+
+
+# 생성 경로 (응답의 generation_path)
+PATH_LLM = "llm"  # LLM 생성
+PATH_CACHE = "cache"  # 생성 결과 캐시 hit
+PATH_TEMPLATE_SAFE = "template_safe"  # 명백한 정상 → 템플릿
+PATH_TEMPLATE_HIGH_RISK = "template_high_risk"  # 고신뢰 고위험 패턴 매칭 → 템플릿
+PATH_TEMPLATE = "template"  # 생성 비활성 (배치 generate=false)
+PATH_FALLBACK = "fallback"  # LLM 실패 → 템플릿
+PATH_CIRCUIT_OPEN = "circuit_open"  # LLM 서킷 open → 호출 없이 템플릿
+
+_HIGH_DANGER_LEVELS = ("매우높음", "높음")
+
+
+def select_generation_path(state: AgentState) -> str:
     """
-    LLM으로 답변 생성
+    위험도 기반 생성 정책
+
+    - 위험도 GENERATION_SAFE_MAX_SCORE 이하: 명백한 정상 → 템플릿
+    - 위험도 GENERATION_HIGH_RISK_MIN_SCORE 이상 + 분류 신뢰도
+      GENERATION_HIGH_RISK_MIN_CONFIDENCE 이상 + 고위험 패턴 정확 매칭: 템플릿
+    - 그 외 애매한 중간 구간만 LLM
+    - 1차 선별(screen 노드)에서 명백하다고 판정된 경우는 판정대로 템플릿
+
+    Returns:
+        PATH_TEMPLATE_SAFE / PATH_TEMPLATE_HIGH_RISK / PATH_LLM
+    """
+    from app.config import settings
+
+    screened = state.get("screen_verdict")
+    if screened == "safe":
+        return PATH_TEMPLATE_SAFE
+    if screened == "scam":
+        return PATH_TEMPLATE_HIGH_RISK
+
+    if not settings.GENERATION_POLICY_ENABLED:
+        return PATH_LLM
+
+    risk_score = state.get("risk_score") or 0
+    if risk_score <= settings.GENERATION_SAFE_MAX_SCORE:
+        return PATH_TEMPLATE_SAFE
+
+    confidence = state.get("confidence") or 0.0
+    high_danger_match = any(
+        pattern.get("danger_level") in _HIGH_DANGER_LEVELS
+        for pattern in state.get("matched_patterns", [])
+    )
+    if (
+        risk_score >= settings.GENERATION_HIGH_RISK_MIN_SCORE
+        and confidence >= settings.GENERATION_HIGH_RISK_MIN_CONFIDENCE
+        and high_danger_match
+    ):
+        return PATH_TEMPLATE_HIGH_RISK
+
+    return PATH_LLM
+
+
+async def generate_recommendation(state: AgentState) -> Dict[str, Any]:
+    """
+    대응 방안 생성 (생성 정책 → 생성 결과 캐시 → LLM)
+
+    명확한 경우는 템플릿 응답, 캐시 hit이면 LLM 호출 없이 반환,
+    미스면 위험도로 고른 모델(route_from_state)로 LLM 호출 후 저장.
+    LLM 실패 시 템플릿 응답 (캐시에는 저장하지 않음),
+    해당 모델 서킷이 열려 있으면 프롬프트 구성 / 호출 없이 바로 템플릿 응답
 
     Args:
-        prompt: 사용자 프롬프트
-        system_prompt: 시스템 프롬프트
+        state: analyze까지 끝난 에이전트 상태
 
     Returns:
-        생성된 답변
+        {"analysis", "generation_path", "prompt_tokens", "llm_model"}
+        (prompt_tokens는 LLM 프롬프트를 만든 경우, llm_model은 LLM / 캐시 응답인 경우에만 값이 있음)
     """
+    from infrastructure.llm.generation_cache import get_generation_cache
+
+    def _result(
+        analysis: str,
+        path: str,
+        prompt_tokens: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "analysis": analysis,
+            "generation_path": path,
+            "prompt_tokens": prompt_tokens,
+            "llm_model": model,
+        }
+
+    path = select_generation_path(state)
+    if path != PATH_LLM:
+        return _result(fallback_from_state(state), path)
+
+    route = route_from_state(state)
+    cache = get_generation_cache()
+    signature = signature_from_state(state, route) if cache is not None else None
+
+    if cache is not None:
+        cached = cache.get(signature)
+        if cached is not None:
+            return _result(cached, PATH_CACHE, model=route.model)
+
+    if not is_circuit_available(f"llm.{route.model}"):
+        return _result(fallback_from_state(state), PATH_CIRCUIT_OPEN)
+
+    prompt, prompt_stats = build_prompt_from_state(state)
+    prompt_tokens = prompt_stats["prompt_tokens"]
     try:
-        from infrastructure.llm.client import UpstageClient
-        from app.config import settings
+        analysis = await _call_llm(prompt, route=route)
+    except CircuitOpenError:
+        return _result(fallback_from_state(state), PATH_CIRCUIT_OPEN, prompt_tokens)
+    except Exception as e:
+        logger.warning("LLM 호출 실패: %s", e, extra={"llm_model": route.model})
+        return _result(fallback_from_state(state), PATH_FALLBACK, prompt_tokens)
 
-        # LLM 클라이어트 생성
-        llm = UpstageClient(
-            api_key=settings.UPSTAGE_API_KEY,
-            model=settings.LLM_MODEL,
-            temperature=settings.LLM_TEMPERATURE,
-        )
+    if not analysis:
+        return _result(fallback_from_state(state), PATH_FALLBACK, prompt_tokens)
 
-        response = await llm.generate(prompt=prompt, system_prompt=system_prompt)
+    if cache is not None:
+        cache.set(signature, analysis)
+    return _result(analysis, PATH_LLM, prompt_tokens, route.model)
 
-        return response.strip()
 
-    except Exception as e:
-        print(f"  ⚠️ LLM 호출 실패: {e}")
+async def stream_recommendations(
+    state: AgentState, meta: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[str]:
+    """
+    대응 방안 스트리밍 생성 (SSE API용)
 
-        # 폴백 응답
-        return """
-⚠️ AI 분석 생성 중 오류가 발생했습니다.
+    생성 정책상 템플릿 대상이거나 생성 결과 캐시 hit이면 한 번에 내보냄.
+    LLM 서킷이 열려 있으면 템플릿 응답을 한 번에 내보냄.
+    첫 토큰 전에 실패하면 템플릿 응답을 한 번에 내보내고,
+    도중에 끊기면 중단 안내를 덧붙임
 
-**긴급 상담:**
-- 경찰청 사이버안전국: 국번없이 182
-- 금융감독원: 1332
-- 사이버캅 앱 다운로드
+    Args:
+        state: analyze까지 끝난 에이전트 상태
+        meta: 전달 시 생성 경로 / 프롬프트 토큰 수 / 모델을
+            meta["generation_path"], meta["prompt_tokens"], meta["llm_model"]에 기록
 
-**기본 대응 방법:**
-1. ❌ 절대 돈을 보내지 마세요
-2. ❌ 개인정보를 제공하지 마세요
-3. ❌ 링크를 클릭하지 마세요
-4. 📞 발신자 차단
-5. 📱 스크린샷 저장 후 신고
+    Yields:
+        대응 방안 텍스트 조각
+    """
+    from infrastructure.llm.generation_cache import get_generation_cache
+    from infrastructure.llm.provider import get_upstage_client
+
+    meta = meta if meta is not None else {}
+
+    meta["generation_path"] = select_generation_path(state)
+    if meta["generation_path"] != PATH_LLM:
+        yield fallback_from_state(state)
+        return
+
+    route = route_from_state(state)
+    cache = get_generation_cache()
+    signature = signature_from_state(state, route) if cache is not None else None
+
+    if cache is not None:
+        cached = cache.get(signature)
+        if cached is not None:
+            meta["generation_path"] = PATH_CACHE
+            meta["llm_model"] = route.model
+            yield cached
+            return
+
+    if not is_circuit_available(f"llm.{route.model}"):
+        meta["generation_path"] = PATH_CIRCUIT_OPEN
+        yield fallback_from_state(state)
+        return
+
+    prompt, prompt_stats = build_prompt_from_state(state)
+    meta["prompt_tokens"] = prompt_stats["prompt_tokens"]
+    meta["llm_model"] = route.model
+    tokens: List[str] = []
+    try:
+        async for token in get_upstage_client(route.model).stream(
+            prompt=prompt, system_prompt=UNIFIED_SYSTEM_PROMPT, max_tokens=route.max_tokens
+        ):
+            tokens.append(token)
+            yield token
+    except Exception as e:
+        logger.warning("LLM 스트리밍 실패: %s", e, extra={"llm_model": route.model})
+        meta["generation_path"] = (
+            PATH_CIRCUIT_OPEN if isinstance(e, CircuitOpenError) else PATH_FALLBACK
+        )
+        meta["llm_model"] = None
+        if tokens:
+            yield "\n\n⚠️ 응답 생성이 중단되었습니다. 긴급 시 182(경찰청) / 1332(금융감독원)로 문의하세요."
+        else:
+            yield fallback_from_state(state)
+        return
 
-의심되는 메시지는 반드시 전문가와 상담하세요.
-"""
+    # 끝까지 받은 응답만 저장
+    analysis = "".join(tokens).strip()
+    if cache is not None and analysis:
+        cache.set(signature, analysis)
 
 
 # 메인 노드 함수
@@ -336,54 +812,28 @@ async def recommend_actions(state: AgentState) -> Dict[str, Any]:
     Returns:
         업데이트된 상태
     """
-    print("\n" + "=" * 60)
-    print("💡 [4/4] 대응 방안 생성 중...")
-    print("=" * 60)
-
-    # 상태에서 정보 추출
-    message = state["message"]
-    sender = state.get("sender")
-    scam_type = state.get("scam_type")
-    risk_level = state.get("risk_level", "알 수 없음")
-    risk_score = state.get("risk_score", 0)
-    is_scam = state.get("is_scam", False)
-    risk_factors = state.get("risk_factors", [])
-    matched_patterns = state.get("matched_patterns", [])
-    similar_cases = state.get("similar_cases", [])
-
-    print(f"  → 위험도: {risk_level} ({risk_score}점)")
-    print(f"  → 사기 여부: {'예' if is_scam else '아니오'}")
-
-    # LLM 프롬포트구성
-    prompt = build_llm_prompt(
-        message=message,
-        sender=sender,
-        scam_type=scam_type,
-        risk_level=risk_level,
-        risk_score=risk_score,
-        matched_patterns=matched_patterns,
-        similar_cases=similar_cases,
+    # 생성 정책 → 캐시 → LLM (실패 시 템플릿)
+    result = await generate_recommendation(state)
+    analysis = result["analysis"]
+
+    logger.debug(
+        "대응 방안 생성",
+        extra={
+            "risk_level": state.get("risk_level"),
+            "risk_score": state.get("risk_score"),
+            "generation_path": result["generation_path"],
+            "prompt_tokens": result["prompt_tokens"],
+            "llm_model": result["llm_model"],
+            "analysis_chars": len(analysis),
+        },
     )
 
-    # LLM 호출
-    print(f"  → LLM 호출 중...")
-
-    analysis = await generate_with_llm(prompt)
-
-    if not analysis:
-        print("  → LLM 실패, fallback 사용")
-        analysis = generate_fallback_response(
-            scam_type=scam_type,
-            risk_level=risk_level,
-            risk_score=risk_score,
-            is_scam=is_scam,
-            risk_factors=risk_factors,
-        )
-
-    print(f"  → 분석 생성 완료 ({len(analysis)}자)")
-
     # 대응 방안은 analysis에 포함되어 있음
     recommendations = analysis
 
     # 상태 업데이트
-    return {"analysis": analysis, "recommendations": recommendations, "completed": True}
+    return {
+        **result,
+        "recommendations": recommendations,
+        "completed": True,
+    }
@@ -3,27 +3,33 @@
 
 역할:
 - ChromaDB에서 유사 사기 사례 검색 (벡터 검색)
+- BM25 어휘 검색 (컬렉션 문서, 임베딩 불필요) + 벡터 검색을 RRF로 결합
 - 실시간 패턴 분석 (scam_patterns.json)
-- 병렬 처리로 속도 최적화
+- asyncio 병렬 처리 + 소스별 데드라인으로 지연 상한 보장
+- 패턴 매칭(match_patterns)과 RAG 검색(retrieve_similar_cases)은 그래프의 별도 병렬 브랜치
+- 임베딩 서킷이 열려 있으면 벡터 검색을 건너뛰고 BM25 결과만 사용
+- 소스별(rag / bm25 / pattern / web) 실행 / 대기 시간, 타임아웃 / 실패 메트릭 (/metrics)
 
 기존 scam_defense.py의 로직 활용
 """
 
-import json
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import hashlib
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from agent.state import AgentState
+from infrastructure.cache import LRUCache, get_cache
+from infrastructure.circuit_breaker import is_circuit_available
+from infrastructure.executor import run_blocking
+from infrastructure.metrics import OUTCOME_ERROR, OUTCOME_TIMEOUT, SOURCE_METRICS
+from infrastructure.patterns import get_pattern_registry
+from infrastructure.vector_store.lexical_index import reciprocal_rank_fusion
 from langchain_core.documents import Document
 
-_BASE_DIR = Path(__file__).resolve().parents[2]
-_PATTERN_FILE = _BASE_DIR / "data" / "chroma_scam_defense" / "scam_patterns.json"
-_PATTERN_CACHE: Optional[Dict] = None
-_QUERY_CACHE: Dict[str, Tuple] = {}
-_CACHE_SIZE_LIMIT = 100
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
 
 _DANGER_LEVEL_ORDER = {
     "매우높음": 4,
@@ -34,51 +40,24 @@ _DANGER_LEVEL_ORDER = {
 }
 
 # ========== 유틸리티 함수 ========== #
-@lru_cache(maxsize=1)
-def _load_patterns() -> Dict:
-    """패턴 JSON 로드(싱글톤)"""
-    global _PATTERN_CACHE
-
-    if _PATTERN_CACHE is not None:
-        return _PATTERN_CACHE
-
-    try:
-        if _PATTERN_FILE.exists():
-            with open(_PATTERN_FILE, "r", encoding="utf-8") as f:
-                _PATTERN_CACHE = json.load(f)
-                print(
-                    f"  ✓ 패턴 로드: {len(_PATTERN_CACHE.get('financial_scams', []))}개"
-                )
-        else:
-            print(f"  ⚠️ 패턴 파일 없음: {_PATTERN_FILE}")
-            _PATTERN_CACHE = {}
-    except Exception as e:
-        print(f"  ⚠️ 패턴 로드 실패: {e}")
-        _PATTERN_CACHE = {}
-    return _PATTERN_CACHE
-
-
-@lru_cache(maxsize=2048)
-def _digits_only(value: Optional[str]) -> str:
-    """숫자만 추출 (캐시)"""
-    return "".join(ch for ch in (value or "") if ch.isdigit())
-
-
 # 쿼리 해리 생성
-def _hash_query(query: str, sender: Optional[str]) -> str:
-    """쿼리 해시 생성 (캐시 키)."""
-    key = f"{query}|{sender or ''}"
+def _hash_query(query: str, sender: Optional[str], version: int = 0) -> str:
+    """쿼리 해시 생성 (캐시 키).
+
+    패턴 인덱스 버전을 포함하여 리로드 이전 결과는 자동 무효화"""
+    key = f"v{version}|{query}|{sender or ''}"
     return hashlib.md5(key.encode()).hexdigest()
 
 
-def _clean_cache():
-    """캐시 크기 제한."""
-    global _QUERY_CACHE
-    if len(_QUERY_CACHE) > _CACHE_SIZE_LIMIT:
-        # 가장 오래된 절반 제거
-        keys = list(_QUERY_CACHE.keys())
-        for key in keys[: _CACHE_SIZE_LIMIT // 2]:
-            _QUERY_CACHE.pop(key, None)
+def _get_source_cache(source: str) -> LRUCache:
+    """소스별 결과 캐시 (pattern / vector)"""
+    from app.config import settings
+
+    size, ttl = {
+        "pattern": (settings.PATTERN_CACHE_SIZE, settings.PATTERN_CACHE_TTL),
+        "vector": (settings.VECTOR_CACHE_SIZE, settings.VECTOR_CACHE_TTL),
+    }[source]
+    return get_cache(f"retrieve.{source}", maxsize=size, ttl=ttl)
 
 
 # ========== 실시간 패턴 분석  ========== #
@@ -87,56 +66,68 @@ def analyze_realtime_patterns(
 ) -> Tuple[List[Document], Dict]:
     """실시간 패턴 분석 (기존 scam_defense.py 로직)
 
+    컴파일된 PatternIndex로 메시지를 한 번만 순회하여
+    사기 패턴 / 발신자 패턴 / 키워드 / 공식 연락처를 모두 찾음.
+    요청 처리 중에는 시작 시점의 패턴 스냅샷을 그대로 사용
+
     Args:
         query: 분석할 메시지
         sender: 발신자 정보
 
     Returns:
         (패턴 문서 리스트, 분석 결과)"""
+    # 패턴 스냅샷 (리로드 중에도 일관된 인덱스 사용)
+    snapshot = get_pattern_registry().current()
+    index = snapshot.index
+
     # 캐시 확인
-    cache_key = _hash_query(query, sender)
-    if cache_key in _QUERY_CACHE:
-        return _QUERY_CACHE[cache_key]
+    cache = _get_source_cache("pattern")
+    cache_key = _hash_query(query, sender, snapshot.version)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    # 패턴로드
-    dataset = _load_patterns()
-    if not dataset:
+    if not index.dataset:
         result = ([], {})
-        _QUERY_CACHE[cache_key] = result
+        cache.set(cache_key, result)
         return result
 
-    query_lower = query.strip().lower()
-    if not query_lower:
+    if not query.strip():
         result = ([], {})
-        _QUERY_CACHE[cache_key] = result
+        cache.set(cache_key, result)
         return result
 
-    sender_lower = (sender or "").strip().lower()
-    query_digits = _digits_only(query)
-    sender_digits = _digits_only(sender)
+    match_result = index.match(query, sender)
 
     pattern_docs = []
     scam_matches = []
     highest_score = -1
     highest_level = None
 
-    # 1. 사기 패턴 매칭
-    for scam in dataset.get("financial_scams", [])[:20]:  # 최대 20개만
-        patterns = [
-            p for p in scam.get("patterns", []) if p and p.lower() in query_lower
-        ]
-        # 발신자 패턴매칭
-        sender_patterns = [
-            p
-            for p in scam.get("sender_patterns", [])
-            if p
-            and (
-                p.lower() in query_lower or (sender_lower and p.lower() in sender_lower)
-            )
-        ]
-
-        if not patterns and not sender_patterns:
-            continue
+    # 1. 사기 패턴 매칭 (패턴 ID별로 그룹화, 첫 등장 순서 유지)
+    grouped: Dict[str, Dict[str, List]] = {}
+    for hit in match_result.by_kind("pattern", "sender"):
+        entry = grouped.setdefault(
+            hit.pattern_id, {"patterns": [], "sender_patterns": [], "offsets": []}
+        )
+        bucket = entry["patterns"] if hit.kind == "pattern" else entry["sender_patterns"]
+        if hit.keyword not in bucket:
+            bucket.append(hit.keyword)
+        if hit.kind == "pattern":
+            entry["offsets"].append([hit.start, hit.end])
+
+    # 위험도 높은 순으로 정렬 (결과 상한 내에서 고위험 매칭 우선)
+    ordered = sorted(
+        grouped.items(),
+        key=lambda item: _DANGER_LEVEL_ORDER.get(
+            index.scams[item[0]].get("danger_level", "정보"), -1
+        ),
+        reverse=True,
+    )
+
+    for scam_id, entry in ordered:
+        scam = index.scams[scam_id]
+        patterns = entry["patterns"]
 
         scam_type = scam.get("type", "알 수 없음")
         danger = scam.get("danger_level", "정보")
@@ -149,7 +140,7 @@ def analyze_realtime_patterns(
         # 간소화된 문서 생성
         content = f"유형: {scam_type} | 위험도: {danger}"
         if patterns:
-            content += f"\n패턴: {', '.join(patterns[:3])}"  # 최대 3개
+            content += f"\n패턴: {', '.join(patterns[:3])}"  # 표시는 최대 3개
 
         pattern_docs.append(
             Document(
@@ -158,6 +149,7 @@ def analyze_realtime_patterns(
                     "source": "실시간패턴",
                     "scam_type": scam_type,
                     "danger_level": danger,
+                    "pattern_id": scam_id,
                     "origin": "pattern_matching",
                 },
             )
@@ -165,43 +157,50 @@ def analyze_realtime_patterns(
 
         scam_matches.append(
             {
+                "pattern_id": scam_id,
                 "scam_type": scam_type,
                 "danger_level": danger,
-                "matched_patterns": patterns[:3],  # 축소
+                "matched_patterns": patterns,
+                "offsets": entry["offsets"],
             }
         )
 
-    # 2. 키워드 매칭 (간소화)
-    keyword_matches = {}
-    for risk_level, keywords in (dataset.get("keywords") or {}).items():
-        hits = [k for k in keywords[:10] if k and k.lower() in query_lower]  # 최대 10개
-        if hits:
-            keyword_matches[risk_level] = hits[:3]  # 축소
-            score = _DANGER_LEVEL_ORDER.get(risk_level, -1)
-            if score > highest_score:
-                highest_score = score
-                highest_level = risk_level
-
-    # 3. 공식 연락처 (간소화)
+    # 2. 키워드 매칭
+    keyword_matches: Dict[str, List[str]] = {}
+    for hit in match_result.by_kind("keyword"):
+        risk_level = hit.pattern_id.split(":", 1)[1]
+        hits = keyword_matches.setdefault(risk_level, [])
+        if hit.keyword not in hits:
+            hits.append(hit.keyword)
+
+    for risk_level in keyword_matches:
+        score = _DANGER_LEVEL_ORDER.get(risk_level, -1)
+        if score > highest_score:
+            highest_score = score
+            highest_level = risk_level
+
+    # 3. 공식 연락처 (기관명 또는 번호 매칭)
     legitimate_matches = []
-    for org, phone in list((dataset.get("legitimate_contacts") or {}).items())[
-        :5
-    ]:  # 최대 5개
-        norm_phone = _digits_only(phone)
-        if (org and org.lower() in query_lower) or (
-            norm_phone and (norm_phone in query_digits or norm_phone in sender_digits)
-        ):
-            legitimate_matches.append({"organization": org, "phone": phone})
-            pattern_docs.append(
-                Document(
-                    page_content=f"{org} 공식: {phone}",
-                    metadata={"source": "공식연락처", "origin": "web_search"},
-                )
+    seen_orgs = set()
+    for hit in match_result.by_kind("contact", "contact_phone"):
+        org = hit.pattern_id.split(":", 1)[1]
+        if org in seen_orgs:
+            continue
+        seen_orgs.add(org)
+
+        phone = index.contacts.get(org, "")
+        legitimate_matches.append({"organization": org, "phone": phone})
+        pattern_docs.append(
+            Document(
+                page_content=f"{org} 공식: {phone}",
+                metadata={"source": "공식연락처", "origin": "web_search"},
             )
+        )
 
     # 결과 요약
     pattern_analysis = {
         "query": query.strip()[:100],  # 축소
+        "pattern_version": snapshot.version,
         "sender": (sender or "").strip()[:50],
         "risk_summary": {
             "highest_level": highest_level,
@@ -216,8 +215,7 @@ def analyze_realtime_patterns(
     result = (pattern_docs[:5], pattern_analysis)  # 최대 5개 문서
 
     # 캐시 저장
-    _QUERY_CACHE[cache_key] = result
-    _clean_cache()
+    cache.set(cache_key, result)
 
     return result
 
@@ -234,137 +232,250 @@ def search_vector_store(query: str, k: int = 5) -> List[Document]:
     Returns:
         유사 문서 리스트
     """
+    cache = _get_source_cache("vector")
+    cache_key = _hash_query(f"{query}|k={k}", None)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        from infrastructure.vector_store.scam_repository import ScamPatternRepository
-        from app.config import settings
+        from infrastructure.vector_store.provider import get_vector_repository
 
-        # 리포지토리 생성
-        repo = ScamPatternRepository(
-            persist_directory=settings.CHROMA_PATH
-        )
+        # 워커 전역 리포지토리 재사용
+        repo = get_vector_repository()
 
         results = repo.search(query=query, k=k)
+        if results:
+            cache.set(cache_key, results)
         return results
     except ImportError as e:
-        print(f"  ⚠️ ChromaDB 모듈 임포트 실패: {e}")
+        logger.warning("ChromaDB 모듈 임포트 실패: %s", e)
         raise
     except Exception as e:
-        print(f"  ⚠️ ChromaDB 검색 실패: {e}")
+        logger.warning("ChromaDB 검색 실패: %s", e)
         raise
 
-#웹크롤링
-def search_web_news(query: str, max_count:int = 3)-> List[Document]:
+def search_vector_store_batch(queries: List[str], k: int = 5) -> List[List[Document]]:
     """
-    웹에서 최신 사기 뉴스 검색
-    
+    여러 쿼리 벡터 검색 (배치 API용)
+
+    캐시 미스 쿼리만 모아 임베딩 1회 배치 호출 + 검색 1회로 처리
+
     Args:
-        query: 검색 쿼리
-        max_count: 최대 뉴스 개수
-    
+        queries: 검색 쿼리 리스트
+        k: 쿼리당 문서 수
+
     Returns:
-        뉴스 Document 리스트
+        쿼리별 유사 문서 리스트 (입력 순서)
     """
-    try:
-        from scripts.web_crawler import ScamNewsCrawler
-        crawler = ScamNewsCrawler()
-
-        keywords =[]
-        if "보이스피싱" in query or "금융감독원" in query or "검찰" in query:
-            keywords.append("보이스피싱")
-        if "대출" in query:
-            keywords.append("대출사기")
-        if "투자" in query or "코인" in query:
-            keywords.append("투자사기")
-        
-        # 기본 키워드
-        if not keywords:
-            keywords = ["금융사기"]
-
-        all_news = []
-        for keyword in keywords[:2]:
-            news = crawler.crawl_naver_news(keyword, max_count=max_count)
-            all_news.extend(news)
-
-        documents = crawler.convert_to_documents(all_news[:max_count])
-
-        return documents
-    
-    except Exception as e:
-        print(f"  ⚠️ 웹 크롤링 실패: {e}")
-        return []
+    cache = _get_source_cache("vector")
+    keys = [_hash_query(f"{query}|k={k}", None) for query in queries]
+    results: List[Optional[List[Document]]] = [cache.get(key) for key in keys]
 
+    # 같은 메시지는 한 번만 검색
+    pending: Dict[str, List[int]] = {}
+    for idx, (query, cached) in enumerate(zip(queries, results)):
+        if cached is None:
+            pending.setdefault(query, []).append(idx)
 
-async def retrieve_similar_cases(state: AgentState) -> Dict:
+    if pending:
+        from infrastructure.vector_store.provider import get_vector_repository
+
+        found = get_vector_repository().search_batch(list(pending), k=k)
+        for indices, docs in zip(pending.values(), found):
+            if docs:
+                cache.set(keys[indices[0]], docs)
+            for idx in indices:
+                results[idx] = docs
+
+    return [docs or [] for docs in results]
+
+
+def search_lexical(query: str, k: int = 5) -> List[Document]:
     """
-    유사 사례 검색 노드 (RAG + 패턴 매칭 + 웹 크롤링)
+    BM25 어휘 검색 (임베딩 호출 없음)
 
-    병렬 처리:
-    - RAG 검색 (ChromaDB)
-    - 실시간 패턴 분석 (JSON)
-    - 웹크롤링(naver news)
+    임베딩이 느리거나 장애여도 같은 컬렉션 문서에서 결과 반환
 
     Args:
-        state: 에이전트 상태
+        query: 검색 쿼리
+        k: 검색할 문서 수
 
     Returns:
-        업데이트된 상태
+        BM25 점수순 문서 리스트
     """
-    print("\n" + "=" * 60)
-    print("📚 [2/4] 유사 사례 검색 및 패턴 매칭 중...")
-    print("=" * 60)
+    from infrastructure.vector_store.provider import get_vector_repository
 
-    message = state["message"]
-    sender = state.get("sender")
+    return get_vector_repository().lexical_search(query, k=k)
 
-    print(f"  → 검색 쿼리: {message[:50]}...")
-    if sender:
-        print(f"  → 발신자: {sender}")
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        # rag검색
-        rag_future = executor.submit(search_vector_store, message, 5)
-        # 패턴검색
-        pattern_future = executor.submit(analyze_realtime_patterns, message, sender)
+# 최신 뉴스 (로컬 색인)
+def _news_keywords(query: str) -> List[str]:
+    """메시지에서 뉴스 검색 키워드 도출"""
+    keywords = []
+    if "보이스피싱" in query or "금융감독원" in query or "검찰" in query:
+        keywords.append("보이스피싱")
+    if "대출" in query:
+        keywords.append("대출사기")
+    if "투자" in query or "코인" in query:
+        keywords.append("투자사기")
 
-        #웹크롤링
-        web_future = executor.submit(search_web_news,message, 2)
+    # 기본 키워드
+    if not keywords:
+        keywords = ["금융사기"]
+    return keywords
 
-        # 결과 수집 (타임아웃 1초)
-        try:
-            rag_docs = rag_future.result(timeout=1.0)
-        except Exception as e:
-            print(f"  ⚠️ RAG 검색 실패: {e}")
-            rag_docs = []
 
+def search_web_news(query: str, max_count: int = 3) -> List[Document]:
+    """
+    최신 사기 뉴스 검색
+
+    백그라운드 갱신기(infrastructure.news)가 주기적으로 크롤링한
+    로컬 색인에서 조회만 수행 (요청 시 외부 HTTP 호출 없음)
+
+    Args:
+        query: 검색 쿼리
+        max_count: 최대 뉴스 개수
+
+    Returns:
+        뉴스 Document 리스트
+    """
+    with SOURCE_METRICS.track("web") as call:
         try:
-            pattern_docs, pattern_analysis = pattern_future.result(timeout=2.0)
+            from infrastructure.news import get_news_store
+
+            return get_news_store().lookup(_news_keywords(query)[:2], max_count=max_count)
         except Exception as e:
-            print(f"  ⚠️ 패턴 분석 실패: {e}")
-            pattern_docs, pattern_analysis = [], {}
+            logger.warning("뉴스 색인 조회 실패: %s", e)
+            call.fail(OUTCOME_ERROR, f"뉴스 색인 조회 실패: {e}")
+            return []
+
+
+async def _fetch_with_deadline(
+    name: str,
+    func: Callable[..., T],
+    *args: Any,
+    source: str,
+    timeout: float,
+    default: T,
+) -> T:
+    """
+    블로킹 검색 함수를 공유 executor에서 데드라인 내 실행
 
+    데드라인 초과 시 대기 중인 작업은 취소, 실행 중인 작업은 결과를 버리고
+    기본값 반환 (요청 지연이 데드라인을 넘지 않음).
+    실행 / 대기 시간과 결과는 source 레이블로 메트릭에 기록
+    """
+    with SOURCE_METRICS.track(source) as call:
         try:
-            web_docs = web_future.result(timeout=5.0)
+            return await run_blocking(func, *args, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "%s 타임아웃 (%.1f초 초과, 결과 폐기)", name, timeout, extra={"source": source}
+            )
+            call.fail(OUTCOME_TIMEOUT, f"{name} 타임아웃 ({timeout:.1f}초)")
         except Exception as e:
-            print(f"  ⚠️ 웹 크롤링 실패: {e}")
-            web_docs = []
+            logger.warning("%s 실패: %s", name, e, extra={"source": source})
+            call.fail(OUTCOME_ERROR, f"{name} 실패: {e}")
+    return default
+
 
-    print(f"  → RAG: {len(rag_docs)}개 유사 사례")
-    print(f"  → 패턴: {len(pattern_docs)}개 매칭")
-    print(f"  → 웹: {len(web_docs)}개 최신 뉴스")
+async def match_patterns(state: AgentState) -> Dict:
+    """
+    실시간 패턴 매칭 노드 (classify / retrieve와 병렬 브랜치)
 
-    # 패턴분석 결과출력
-    if pattern_analysis:
-        risk = pattern_analysis.get("risk_summary", {})
-        if level := risk.get("highest_level"):
-            print(f"  → 위험도: {level}")
-        if matches := pattern_analysis.get("scam_matches"):
-            print(f"  → {len(matches)}개 사기 유형 매칭")
+    Args:
+        state: 에이전트 상태 (message, sender만 사용)
 
-    # 전체 문서 (RAG + 패턴)
-    all_similar_cases = rag_docs + pattern_docs
+    Returns:
+        업데이트된 상태 (similar_cases에 패턴 문서 추가, matched_patterns, pattern_analysis)
+    """
+    from app.config import settings
+
+    pattern_docs, pattern_analysis = await _fetch_with_deadline(
+        "패턴 분석", analyze_realtime_patterns, state["message"], state.get("sender"),
+        source="pattern", timeout=settings.PATTERN_TIMEOUT, default=([], {}),
+    )
+
+    logger.debug(
+        "패턴 매칭",
+        extra={
+            "pattern_docs": len(pattern_docs),
+            "scam_matches": len(pattern_analysis.get("scam_matches", [])),
+            "highest_level": pattern_analysis.get("risk_summary", {}).get("highest_level"),
+        },
+    )
 
-    # 상태 업데이트
     return {
-        "similar_cases": all_similar_cases,
+        "similar_cases": pattern_docs,
         "matched_patterns": pattern_analysis.get("scam_matches", []),
+        "pattern_analysis": pattern_analysis,
+    }
+
+
+async def retrieve_similar_cases(state: AgentState) -> Dict:
+    """
+    유사 사례 검색 노드 (RAG + 최신 뉴스)
+
+    asyncio 병렬 처리 (소스별 데드라인):
+    - RAG 검색 (ChromaDB 벡터 + BM25, RRF 결합)
+    - 최신 뉴스 (백그라운드 크롤링된 로컬 색인 조회)
+    실시간 패턴 분석은 별도 브랜치(match_patterns)
+
+    Args:
+        state: 에이전트 상태
+
+    Returns:
+        업데이트된 상태 (similar_cases에 RAG 문서 추가, news_docs)
+    """
+    message = state["message"]
+
+    from app.config import settings
+
+    # 임베딩 서킷 open → 벡터 검색 생략, BM25만 사용 (HYBRID_SEARCH_ENABLED와 무관)
+    use_dense = is_circuit_available("embedding")
+    if not use_dense:
+        logger.debug("임베딩 서킷 open → BM25 검색만 사용")
+
+    async def _dense() -> List[Document]:
+        if not use_dense:
+            return []
+        return await _fetch_with_deadline(
+            "RAG 검색", search_vector_store, message, 5,
+            source="rag", timeout=settings.RAG_TIMEOUT, default=[],
+        )
+
+    async def _lexical() -> List[Document]:
+        if settings.HYBRID_SEARCH_ENABLED or not use_dense:
+            return await _fetch_with_deadline(
+                "BM25 검색", search_lexical, message, 5,
+                source="bm25", timeout=settings.RAG_TIMEOUT, default=[],
+            )
+        return []
+
+    # 벡터 / BM25 검색을 동시에 실행, 소스별 데드라인 초과 시 결과 폐기
+    dense_docs, lexical_docs = await asyncio.gather(_dense(), _lexical())
+
+    # 벡터 검색이 실패/타임아웃이면 BM25 결과만으로 대체
+    rag_docs = reciprocal_rank_fusion(
+        [dense_docs, lexical_docs], k=5, rrf_k=settings.RRF_K
+    )
+
+    # 최신 뉴스는 로컬 색인 조회 (메모리 조회라 executor 불필요)
+    web_docs = search_web_news(message, 2)
+
+    logger.debug(
+        "유사 사례 검색",
+        extra={
+            "rag_docs": len(rag_docs),
+            "dense_docs": len(dense_docs),
+            "lexical_docs": len(lexical_docs),
+            "news_docs": len(web_docs),
+        },
+    )
+
+    # 상태 업데이트 (패턴 문서는 patterns 브랜치가 추가, 리듀서로 병합)
+    return {
+        "similar_cases": rag_docs,
+        "news_docs": web_docs,
     }
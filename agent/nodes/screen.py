@@ -0,0 +1,150 @@
+"""
+1차 선별 노드 (조건부 라우팅)
+
+역할:
+- classify / patterns 브랜치 합류 지점에서 로컬 패턴 매칭만으로 예비 위험도 산출
+  (벡터 검색 / 뉴스 / LLM 없음)
+- 명백한 경우는 retrieve를 건너뛰고 analyze → 템플릿 응답으로 바로 종료
+  - safe: 사기 패턴 / 고위험 키워드 매칭 없음 + 예비 점수 SCREEN_SAFE_MAX_SCORE 이하
+    (발신 번호는 판단에 쓰지 않음: 공식 번호(1332 등) 발신자 위조가 보이스피싱의 전형적 수법)
+  - scam: 예비 점수 SCREEN_SCAM_MIN_SCORE 이상 + 고위험(매우높음/높음) 패턴 매칭
+  - 그 외(uncertain)만 retrieve → analyze → LLM 전체 경로
+- RAG 유사 사례 가산점은 최대 15점이라 safe 기준(기본 40점)에서 사기 판정이 뒤집히지 않음
+- 단계 생략 카운터 (/api/v1/stats)
+"""
+
+import logging
+from typing import Any, Dict
+
+from agent.nodes.analyze import assess_risk
+from agent.state import AgentState
+
+logger = logging.getLogger(__name__)
+
+VERDICT_SAFE = "safe"
+VERDICT_SCAM = "scam"
+VERDICT_UNCERTAIN = "uncertain"
+
+# 선별로 끝나면 생략되는 단계 (벡터/BM25/뉴스 검색, LLM 생성)
+SHORT_CIRCUIT_SKIPPED = ["retrieve", "llm"]
+
+_HIGH_DANGER_LEVELS = ("매우높음", "높음")
+# 키워드 매칭 위험 등급 (scam_patterns.json keywords) 중 safe 판정을 막는 등급
+_HIGH_RISK_KEYWORD_LEVELS = ("high_risk",) + _HIGH_DANGER_LEVELS
+
+_stats: Dict[str, Any] = {
+    "screened": 0,
+    "verdicts": {VERDICT_SAFE: 0, VERDICT_SCAM: 0, VERDICT_UNCERTAIN: 0},
+    "skipped": {stage: 0 for stage in SHORT_CIRCUIT_SKIPPED},
+}
+
+
+def _has_high_risk_keywords(pattern_analysis: Dict[str, Any]) -> bool:
+    """고위험 등급 키워드 매칭 여부"""
+    keyword_matches = pattern_analysis.get("keyword_matches") or {}
+    return any(keyword_matches.get(level) for level in _HIGH_RISK_KEYWORD_LEVELS)
+
+
+def screen_verdict(
+    scam_type: str,
+    confidence: float,
+    pattern_analysis: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    예비 위험도로 선별 판정
+
+    Returns:
+        {"verdict", "screen_score"}
+    """
+    from app.config import settings
+
+    matched_patterns = pattern_analysis.get("scam_matches", [])
+    screen_score = assess_risk(
+        scam_type=scam_type,
+        confidence=confidence,
+        matched_patterns=matched_patterns,
+        similar_cases=[],
+    )["risk_score"]
+
+    if not matched_patterns:
+        # 점수 상한은 항상 적용 (RAG 가산점을 더해도 사기 판정으로 뒤집히지 않는 범위만 safe)
+        if screen_score <= settings.SCREEN_SAFE_MAX_SCORE and not _has_high_risk_keywords(
+            pattern_analysis
+        ):
+            return {"verdict": VERDICT_SAFE, "screen_score": screen_score}
+    elif screen_score >= settings.SCREEN_SCAM_MIN_SCORE and any(
+        p.get("danger_level") in _HIGH_DANGER_LEVELS for p in matched_patterns
+    ):
+        return {"verdict": VERDICT_SCAM, "screen_score": screen_score}
+
+    return {"verdict": VERDICT_UNCERTAIN, "screen_score": screen_score}
+
+
+async def screen_message(state: AgentState) -> Dict[str, Any]:
+    """
+    1차 선별 노드
+
+    Args:
+        state: classify / patterns 브랜치까지 끝난 에이전트 상태
+
+    Returns:
+        업데이트된 상태 (screen_verdict, skipped_stages)
+    """
+    from app.config import settings
+
+    if not settings.SCREEN_ENABLED:
+        return {"screen_verdict": None, "skipped_stages": []}
+
+    # 패턴 분석이 실패 / 타임아웃이면 (빈 결과) 판단 근거가 없으므로 전체 경로
+    pattern_analysis = state.get("pattern_analysis")
+    if not pattern_analysis:
+        logger.debug("1차 선별: 패턴 분석 결과 없음 → 전체 경로")
+        _stats["screened"] += 1
+        _stats["verdicts"][VERDICT_UNCERTAIN] += 1
+        return {"screen_verdict": VERDICT_UNCERTAIN, "skipped_stages": []}
+    result = screen_verdict(
+        scam_type=state.get("scam_type") or "알 수 없음",
+        confidence=state.get("confidence") or 0.5,
+        pattern_analysis=pattern_analysis,
+    )
+    verdict = result["verdict"]
+
+    _stats["screened"] += 1
+    _stats["verdicts"][verdict] += 1
+
+    short_circuit = verdict != VERDICT_UNCERTAIN
+    logger.debug(
+        "1차 선별",
+        extra={
+            "screen_score": result["screen_score"],
+            "screen_verdict": verdict,
+            "skipped_stages": SHORT_CIRCUIT_SKIPPED if short_circuit else [],
+        },
+    )
+
+    if not short_circuit:
+        return {"screen_verdict": verdict, "skipped_stages": []}
+
+    for stage in SHORT_CIRCUIT_SKIPPED:
+        _stats["skipped"][stage] += 1
+
+    return {"screen_verdict": verdict, "skipped_stages": list(SHORT_CIRCUIT_SKIPPED)}
+
+
+def route_after_screen(state: AgentState) -> str:
+    """조건부 엣지: 명백하면 analyze로 바로, 아니면 retrieve"""
+    if state.get("screen_verdict") in (VERDICT_SAFE, VERDICT_SCAM):
+        return "analyze"
+    return "retrieve"
+
+
+def get_screen_stats() -> Dict[str, Any]:
+    """선별 판정 / 단계 생략 통계"""
+    screened = _stats["screened"]
+    short_circuited = screened - _stats["verdicts"][VERDICT_UNCERTAIN]
+    return {
+        "screened": screened,
+        "verdicts": dict(_stats["verdicts"]),
+        "short_circuit_rate": round(short_circuited / screened, 4) if screened else 0.0,
+        "skipped": dict(_stats["skipped"]),
+    }
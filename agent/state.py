@@ -1,18 +1,28 @@
 """
 LangGraph 상태 정의
 에이전트가 워크플로우를 진행하며 공유하는 상태
+
+병렬 브랜치(classify / patterns / retrieve)가 같은 키를 갱신하는 경우
+Annotated 리듀서로 병합 (덮어쓰기 대신 누적)
 """
 
-from typing import TypedDict, List, Optional, Dict, Any
+import operator
+from typing import Annotated, TypedDict, List, Optional, Dict, Any
 from langchain_core.documents import Document
 
-#실행정보추적
+
+def merge_timings(left: Optional[Dict[str, float]], right: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """노드별 소요 시간 병합 리듀서 (병렬 브랜치 결과를 합침)"""
+    return {**(left or {}), **(right or {})}
+
+#실행정보추적 (graph._timed가 노드마다 1개씩 기록)
 class TraceInfo(TypedDict):
     trace_id: str
     node_name: str
     latency_ms: float
+    queue_ms: float  # executor 작업자 / LLM 슬롯 대기 누적 (병렬 대기는 합산)
     model_output_summary: Optional[str]
-    errors: List[str]
+    errors: List[str]  # 폴백으로 처리된 소스 타임아웃 / 실패 등
 
 
 class AgentState(TypedDict):
@@ -33,9 +43,15 @@ class AgentState(TypedDict):
     scam_type: Optional[str]
     confidence: Optional[float]
 
-    # 검색 결과
-    similar_cases: List[Document]
+    # 1차 선별 결과 (screen 노드)
+    screen_verdict: Optional[str]  # safe / scam / uncertain (선별 미사용 시 None)
+    skipped_stages: Annotated[List[str], operator.add]  # 선별로 생략된 단계 (retrieve / llm)
+
+    # 검색 결과 (patterns / retrieve 브랜치가 각자 추가)
+    similar_cases: Annotated[List[Document], operator.add]  # 패턴 문서 + RAG 문서
     matched_patterns: List[Dict]
+    pattern_analysis: Optional[Dict[str, Any]]  # 실시간 패턴 분석 요약 (공식 연락처 등, screen 노드 입력)
+    news_docs: List[Document]  # 최신 사기 뉴스 (프롬프트 참고용, 위험도 계산에는 미사용)
 
     # 분석 결과
     risk_level: Optional[str]  # 위험도 레벨 (analyze 노드)
@@ -46,7 +62,13 @@ class AgentState(TypedDict):
     # 최종 결과
     analysis: Optional[str]  # AI 분석 내용
     recommendations: Optional[str]  # 대응 방안 (recommend 노드)
+    generation_path: Optional[str]  # 대응 방안 생성 경로 (llm / cache / template_* / fallback / circuit_open)
+    prompt_tokens: Optional[int]  # LLM 입력 토큰 수 (로컬 추정, 시스템 프롬프트 포함)
+    llm_model: Optional[str]  # 대응 방안을 생성한 LLM 모델 (위험도 기반 라우팅, LLM / 캐시 경로만)
 
     # 메타 정보
+    trace_id: Optional[str]  # 요청 추적 ID (TraceInfo 연결용)
+    traces: Annotated[List[TraceInfo], operator.add]  # 노드별 실행 정보
     processing_time: Optional[float]  # 처리 시간
+    stage_timings: Annotated[Dict[str, float], merge_timings]  # 노드별 소요 시간 (ms)
     completed: bool  # 완료 여부
@@ -6,17 +6,29 @@ FastAPI 애플리케이션 관련 모듈
 
 from app.config import settings, get_settings
 from app.schemas import(
+    BatchDetectItem,
+    BatchDetectRequest,
+    BatchDetectResponse,
     DetectScamRequest,
     DetectScamResponse,
+    DetectVerdictEvent,
     ErrorResponse,
     HealthCheckResponse,
+    PatternReloadResponse,
+    SystemStatsResponse,
 )
 
 __all__ = [
     "settings",
     "get_settings",
+    "BatchDetectItem",
+    "BatchDetectRequest",
+    "BatchDetectResponse",
     "DetectScamRequest",
     "DetectScamResponse",
+    "DetectVerdictEvent",
     "ErrorResponse",
     "HealthCheckResponse",
+    "PatternReloadResponse",
+    "SystemStatsResponse",
 ]
\ No newline at end of file
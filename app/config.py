@@ -11,7 +11,7 @@ Pydantic Settings를 사용한 환경변수 관리
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -23,11 +23,33 @@ class Settings(BaseSettings):
         default="Scam Detection Agent", description="애플리케이션 이름"
     )
     APP_VERSION: str = Field(default="1.0.0", description="버전")
-    DEBUG: bool = Field(default=False, description="디버그 모드")
+    DEBUG: bool = Field(default=False, description="디버그 모드 (로그 레벨 DEBUG, 요청별 상세 로그)")
+
+    # 로깅 (JSON 한 줄 로그, 큐 기반 비동기 출력)
+    LOG_LEVEL: str = Field(default="INFO", description="로그 레벨 (DEBUG가 켜져 있으면 무시하고 DEBUG)")
+    LOG_FORMAT: Literal["json", "text"] = Field(default="json", description="로그 출력 형식")
+    LOG_DEBUG_SAMPLE_RATE: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="요청별 DEBUG 상세 로그를 남길 요청 비율 (요청 단위 샘플링)",
+    )
 
     # API 설정
     API_HOST: str = Field(default="0.0.0.0", description="API 호스트")
     API_PORT: int = Field(default=8000, description="API 포트")
+    METRICS_ENABLED: bool = Field(
+        default=True, description="GET /metrics (Prometheus 텍스트 형식) 노출 여부"
+    )
+
+    # 워커 시작 예열 (패턴 / 그래프 / 벡터 리포지토리 / LLM 연결, /health/ready)
+    STARTUP_WARMUP_BLOCKING: bool = Field(
+        default=False,
+        description="True면 예열이 끝난 뒤 요청 수신 시작 (False면 백그라운드 예열, 준비 전 /health/ready는 503)",
+    )
+    STARTUP_STAGE_TIMEOUT: float = Field(
+        default=60.0, gt=0.0, description="예열 단계별 최대 대기 시간 (초, 초과 시 실패로 기록)"
+    )
 
     #  Upstage API
     UPSTAGE_API_KEY: str = Field(..., description="Upstage API 키 (필수)")
@@ -39,11 +61,98 @@ class Settings(BaseSettings):
     )
 
     LLM_MAX_TOKENS: int = Field(default=2000, ge=1, description="LLM 최대 토큰")
+    LLM_PROMPT_TOKEN_BUDGET: int = Field(
+        default=1200,
+        ge=0,
+        description="LLM 입력 토큰 예산 (시스템 프롬프트 포함, 로컬 추정 기준, 0이면 무제한)",
+    )
+
+    # 1차 선별 (명백한 safe / scam은 검색 / LLM 생략)
+    SCREEN_ENABLED: bool = Field(default=True, description="1차 선별 조건부 라우팅 사용 여부")
+    SCREEN_SAFE_MAX_SCORE: int = Field(
+        default=40,
+        ge=0,
+        le=44,
+        description="사기 패턴 매칭이 없고 예비 점수가 이 값 이하면 safe (RAG 가산점 15점을 더해도 60 미만이 되도록 44 이하)",
+    )
+    SCREEN_SCAM_MIN_SCORE: int = Field(
+        default=85, ge=0, le=100, description="예비 점수 이상 + 고위험 패턴 매칭이면 scam"
+    )
+
+    # 서킷 브레이커 (Upstage LLM / 임베딩 연속 실패 시 호출 차단 → 템플릿 응답 / BM25 검색)
+    CIRCUIT_BREAKER_ENABLED: bool = Field(default=True, description="외부 API 서킷 브레이커 사용 여부")
+    CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        default=5, ge=1, description="서킷을 여는 연속 실패 횟수"
+    )
+    CIRCUIT_RECOVERY_TIMEOUT: float = Field(
+        default=30.0, gt=0.0, description="서킷 open 유지 시간 (초, 이후 시험 호출)"
+    )
+    CIRCUIT_HALF_OPEN_MAX_CALLS: int = Field(
+        default=1, ge=1, description="half_open 상태에서 허용하는 동시 시험 호출 수"
+    )
+
+    # 모델 라우팅 (고위험은 LLM_MODEL, 나머지는 경량 모델)
+    LLM_ROUTING_ENABLED: bool = Field(
+        default=True, description="위험도 기반 모델 라우팅 사용 여부 (false면 항상 LLM_MODEL)"
+    )
+    LLM_LIGHT_MODEL: str = Field(default="solar-mini", description="안전 / 낮음 / 중간 위험도용 경량 모델")
+    LLM_LIGHT_MAX_TOKENS: int = Field(default=800, ge=1, description="경량 모델 최대 토큰")
+    LLM_ROUTING_HEAVY_MIN_SCORE: int = Field(
+        default=60, ge=0, le=100, description="이 점수 이상(또는 높음 / 매우높음)이면 LLM_MODEL 사용"
+    )
+
+    # 생성 정책 (명확한 경우는 템플릿 응답, 애매한 중간 구간만 LLM)
+    GENERATION_POLICY_ENABLED: bool = Field(
+        default=True, description="위험도 기반 생성 정책 사용 여부 (false면 항상 LLM)"
+    )
+    GENERATION_SAFE_MAX_SCORE: int = Field(
+        default=19, ge=0, le=100, description="이 점수 이하는 명백한 정상으로 보고 템플릿 응답"
+    )
+    GENERATION_HIGH_RISK_MIN_SCORE: int = Field(
+        default=90, ge=0, le=100, description="이 점수 이상 + 고위험 패턴 매칭이면 템플릿 응답"
+    )
+    GENERATION_HIGH_RISK_MIN_CONFIDENCE: float = Field(
+        default=0.85, ge=0.0, le=1.0, description="고위험 템플릿 응답에 필요한 최소 분류 신뢰도"
+    )
+
+    # 생성 결과 캐시 (같은 분석 결과면 LLM 호출 생략)
+    GENERATION_CACHE_ENABLED: bool = Field(default=True, description="LLM 생성 결과 캐시 사용 여부")
+    GENERATION_CACHE_PATH: Optional[str] = Field(
+        default="data/cache/generations.sqlite3",
+        description="생성 결과 캐시 SQLite 경로 (비우면 메모리만 사용)",
+    )
+    GENERATION_CACHE_MEMORY_SIZE: int = Field(default=512, ge=1, description="생성 결과 메모리 캐시 크기")
+    GENERATION_CACHE_MAX_ENTRIES: int = Field(
+        default=20_000, ge=1, description="생성 결과 디스크 캐시 최대 항목 수"
+    )
+    GENERATION_CACHE_TTL: float = Field(
+        default=86400.0, ge=0.0, description="생성 결과 캐시 유효 시간 (초, 0이면 만료 없음)"
+    )
+    GENERATION_CACHE_INCLUDE_MESSAGE: bool = Field(
+        default=True,
+        description="캐시 키에 원문 메시지 / 발신자 포함 여부 (false면 분석 결과만으로 키 구성 → 같은 캠페인 변형 문자끼리 공유)",
+    )
 
     # Embedding 설정
     EMBEDDING_MODEL: str = Field(
         default="solar-embedding-1-large", description="Embedding 모델명"
     )
+    EMBEDDING_TIMEOUT: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description="원격 임베딩 호출 타임아웃 (초, SDK 재시도 없음, 미설정 시 RAG_TIMEOUT)",
+    )
+
+    # 임베딩 캐시 (메모리 LRU + SQLite 영구 캐시)
+    EMBEDDING_CACHE_ENABLED: bool = Field(default=True, description="쿼리 임베딩 캐시 사용 여부")
+    EMBEDDING_CACHE_PATH: Optional[str] = Field(
+        default="data/cache/embeddings.sqlite3",
+        description="임베딩 캐시 SQLite 경로 (비우면 메모리만 사용)",
+    )
+    EMBEDDING_CACHE_MEMORY_SIZE: int = Field(default=2048, ge=1, description="임베딩 메모리 캐시 크기")
+    EMBEDDING_CACHE_MAX_ENTRIES: int = Field(
+        default=100_000, ge=1, description="임베딩 디스크 캐시 최대 항목 수"
+    )
 
     # ChromaDB 설정
     CHROMA_PATH: str = Field(
@@ -54,17 +163,102 @@ class Settings(BaseSettings):
         default="scam_defense", description="ChromaDB 컬렉션명"
     )
 
+    # 벡터 검색 백엔드 (mmap: scripts/export_vector_index.py로 내보낸 인덱스, 워커 간 페이지 캐시 공유)
+    VECTOR_BACKEND: Literal["chroma", "mmap"] = Field(
+        default="chroma", description="벡터 검색 백엔드"
+    )
+    VECTOR_INDEX_PATH: str = Field(
+        default="data/vector_index", description="메모리 매핑 벡터 인덱스 디렉토리"
+    )
+
     # 데이터경로
     SCAM_PATTERNS_FILE: str = Field(
-        default="data/scam_defense/scam_patterns.json",
+        default="data/chroma_scam_defense/scam_patterns.json",
         description="사기 패턴 JSON 파일 경로",
     )
+    PATTERN_RELOAD_INTERVAL: float = Field(
+        default=5.0, ge=0.0, description="패턴 파일 변경 감시 주기 (초, 0이면 비활성화)"
+    )
+
+    # 검색 결과 캐시 (LRU + TTL, TTL 0이면 만료 없음)
+    PATTERN_CACHE_SIZE: int = Field(default=2048, ge=1, description="패턴 매칭 결과 캐시 크기")
+    PATTERN_CACHE_TTL: float = Field(default=0.0, ge=0.0, description="패턴 매칭 결과 캐시 TTL (초)")
+    VECTOR_CACHE_SIZE: int = Field(default=1024, ge=1, description="벡터 검색 결과 캐시 크기")
+    VECTOR_CACHE_TTL: float = Field(default=600.0, ge=0.0, description="벡터 검색 결과 캐시 TTL (초)")
+
+    # 하이브리드 검색 (BM25 + 벡터, RRF 결합)
+    HYBRID_SEARCH_ENABLED: bool = Field(default=True, description="BM25 어휘 검색 병행 여부")
+    RRF_K: int = Field(default=60, ge=1, description="RRF 순위 완화 상수")
+
+    # 최신 뉴스 색인 (백그라운드 크롤링)
+    NEWS_REFRESH_ENABLED: bool = Field(default=True, description="뉴스 색인 백그라운드 갱신 사용 여부")
+    NEWS_REFRESH_INTERVAL: float = Field(default=1800.0, ge=10.0, description="뉴스 색인 갱신 주기 (초)")
+    NEWS_MAX_PER_KEYWORD: int = Field(default=10, ge=1, description="키워드당 수집 뉴스 수")
+    NEWS_STORE_PATH: Optional[str] = Field(
+        default="data/cache/news_index.json", description="뉴스 색인 저장 경로 (비우면 메모리만 사용)"
+    )
+
+    # 관리자 API
+    ADMIN_API_KEY: Optional[str] = Field(
+        default=None, description="관리자 API 키 (X-Admin-Key 헤더, 미설정 시 관리자 API 비활성화)"
+    )
 
     # 타임아웃 설정
     REQUEST_TIMEOUT: int = Field(default=30, ge=1, description="API 요청 타임아웃 (초)")
 
     LLM_TIMEOUT: int = Field(default=25, ge=1, description="LLM API 타임아웃 (초)")
 
+    # LLM HTTP 연결 풀 (프로세스 전역 클라이언트 1개가 공유)
+    LLM_MAX_CONNECTIONS: int = Field(default=32, ge=1, description="LLM API 최대 동시 연결 수")
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=16, ge=0, description="유지할 keep-alive 연결 수"
+    )
+    LLM_KEEPALIVE_EXPIRY: float = Field(
+        default=60.0, ge=0.0, description="유휴 keep-alive 연결 유지 시간 (초)"
+    )
+    LLM_CONNECT_TIMEOUT: float = Field(default=5.0, gt=0.0, description="LLM API 연결 타임아웃 (초)")
+
+    # LLM 호출 제한 (워커 내 모든 LLM 호출 공유, 대기열 초과 시 즉시 폴백)
+    LLM_MAX_CONCURRENCY: int = Field(default=8, ge=1, description="LLM 최대 동시 호출 수")
+    LLM_QUEUE_SIZE: int = Field(default=64, ge=0, description="LLM 호출 최대 대기 요청 수")
+    LLM_QUEUE_TIMEOUT: float = Field(
+        default=5.0, gt=0.0, description="LLM 슬롯 / 한도 대기 최대 시간 (초, 초과 시 폴백)"
+    )
+    LLM_REQUESTS_PER_MINUTE: int = Field(default=0, ge=0, description="분당 LLM 요청 한도 (0이면 제한 없음)")
+    LLM_TOKENS_PER_MINUTE: int = Field(default=0, ge=0, description="분당 LLM 토큰 한도 (0이면 제한 없음)")
+    LLM_RATE_LIMIT_RETRIES: int = Field(
+        default=2, ge=0, description="429 응답 재시도 횟수 (Retry-After 준수)"
+    )
+
+    # LLM 요청 헤징 (느린 호출에 같은 요청 1회 추가, 먼저 온 응답 사용)
+    LLM_HEDGE_ENABLED: bool = Field(default=False, description="LLM 요청 헤징 사용 여부")
+    LLM_HEDGE_PERCENTILE: float = Field(
+        default=0.95, gt=0.0, lt=1.0, description="헤지 시점 (최근 성공 요청 지연의 백분위, 헤지 포함 요청 단위)"
+    )
+    LLM_HEDGE_MIN_DELAY: float = Field(default=1.0, ge=0.0, description="최소 헤지 대기 시간 (초)")
+    LLM_HEDGE_MAX_RATIO: float = Field(
+        default=0.1, ge=0.0, le=1.0, description="일반 호출 대비 최대 추가 호출 비율"
+    )
+
+    # 검색 소스별 데드라인 (초과 시 결과 폐기)
+    RAG_TIMEOUT: float = Field(default=1.0, gt=0.0, description="RAG 검색 데드라인 (초)")
+    PATTERN_TIMEOUT: float = Field(default=2.0, gt=0.0, description="패턴 분석 데드라인 (초)")
+
+    # 블로킹 작업용 공유 스레드 풀 크기
+    BLOCKING_MAX_WORKERS: int = Field(default=16, ge=1, description="공유 executor 최대 스레드 수")
+
+    # 동시 요청 병합 (같은 메시지 / 발신자의 동시 요청은 그래프 실행 1회 공유)
+    DETECT_COALESCE_ENABLED: bool = Field(default=True, description="동시 탐지 요청 병합 사용 여부")
+
+    # 배치 탐지 API
+    BATCH_MAX_ITEMS: int = Field(default=100, ge=1, description="배치 요청당 최대 메시지 수")
+    BATCH_SEARCH_TIMEOUT: float = Field(
+        default=5.0, gt=0.0, description="배치 패턴 분석 / 임베딩 + 벡터 검색 / BM25 검색 데드라인 (초)"
+    )
+    BATCH_LLM_CONCURRENCY: int = Field(
+        default=4, ge=1, description="배치 내 LLM 생성 동시 실행 수 (generate=true)"
+    )
+
     # LangSmith
     LANGCHAIN_TRACING_V2: bool = Field(
         default=False, description="LangSmith 추적 활성화"
@@ -124,9 +318,11 @@ def print_settings():
     print(f"  이름: {s.APP_NAME}")
     print(f"  버전: {s.APP_VERSION}")
     print(f"  디버그: {s.DEBUG}")
+    print(f"  로그: {s.LOG_LEVEL} ({s.LOG_FORMAT}, DEBUG 샘플링 {s.LOG_DEBUG_SAMPLE_RATE:.0%})")
 
     print(f"\n[API]")
     print(f"  호스트: {s.API_HOST}:{s.API_PORT}")
+    print(f"  시작 예열: {'동기' if s.STARTUP_WARMUP_BLOCKING else '백그라운드'} (단계별 {s.STARTUP_STAGE_TIMEOUT}초)")
 
     print(f"\n[LLM]")
     print(f"  모델: {s.LLM_MODEL}")
@@ -29,9 +29,7 @@ class GraphMamager:
         """그래프 초기화"""
         if self._graph is None:
             from agent.graph import get_graph
-            print("\n🔨 LangGraph 워크플로우 초기화 중...")
             self._graph = get_graph()
-            print("LangGraph 워크플로우 준비 완료!\n")
         return self._graph
     
     def get_graph(self):
@@ -2,27 +2,81 @@
 FastAPI 메인 서버
 
 금융 사기 탐지 AI 에이전트 REST API
+
+모듈 import는 가볍게 유지 (워커 부팅 시간, scripts/benchmark_import.py로 측정):
+agent(langgraph / langchain_core), chromadb, langchain_upstage는 시작 예열(app.startup)이
+백그라운드에서 import → 핸들러는 예열이 끝난 모듈을 함수 안에서 가져다 씀
 """
 
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.routing import APIRouter
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.exceptions import RequestValidationError
 
 from app.schemas import (
+    BatchDetectItem,
+    BatchDetectRequest,
+    BatchDetectResponse,
     DetectScamRequest,
     DetectScamResponse,
+    DetectVerdictEvent,
     ErrorResponse,
-    HealthCheckResponse
+    HealthCheckResponse,
+    PatternReloadResponse,
+    ReadinessResponse,
+    SystemStatsResponse,
 )
 from app.config import settings
-from agent.graph import get_graph
+from app.startup import STAGE_PENDING, STAGE_RUNNING, get_startup_warmup
+from infrastructure.cache import get_cache_stats
+from infrastructure.circuit_breaker import OPEN, get_circuit_breaker_stats
+from infrastructure.executor import shutdown_executor
+from infrastructure.log import current_trace_id, new_trace_id, request_context, setup_logging
+from infrastructure.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    HTTP_REQUEST_DURATION,
+    NODE_METRICS,
+    render_metrics,
+)
+from infrastructure.singleflight import get_singleflight, get_singleflight_stats
+from infrastructure.llm.generation_cache import (
+    close_generation_cache,
+    get_generation_cache_stats,
+)
+from infrastructure.llm.provider import (
+    close_llm_client,
+    get_llm_hedge_stats,
+    get_llm_limiter_stats,
+    get_llm_model_stats,
+)
+from infrastructure.news import get_news_refresher
+from infrastructure.patterns import get_pattern_registry
+from infrastructure.vector_store.embedding_cache import (
+    close_embeddings,
+    get_embedding_cache_stats,
+    normalize_text,
+)
+from infrastructure.vector_store.provider import (
+    close_vector_repository,
+    is_vector_repository_ready,
+)
+
+# 로깅 초기화 (JSON / 큐 기반 출력, 레벨은 DEBUG / LOG_LEVEL)
+setup_logging()
+logger = logging.getLogger(__name__)
+
 
 def setup_langsmith():
     """LangSmith 추적 활성화 (API 키가 있을 경우)"""
@@ -31,14 +85,41 @@ def setup_langsmith():
         os.environ["LANGCHAIN_API_KEY"] = settings.LANGCHAIN_API_KEY
         os.environ["LANGCHAIN_PROJECT"] = settings.LANGCHAIN_PROJECT or "scam-detection"
         
-        print("✅ LangSmith 추적 활성화")
-        print(f"   프로젝트: {settings.LANGCHAIN_PROJECT}")
+        logger.info("LangSmith 추적 활성화", extra={"project": settings.LANGCHAIN_PROJECT})
     else:
-        print("⚠️  LangSmith API key not found - tracing disabled")
+        logger.info("LangSmith API key not found - tracing disabled")
 
 # LangSmith 초기화 (FastAPI 앱 생성 전에 실행)
 setup_langsmith()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 리소스 관리"""
+    # 시작 예열: 패턴 인덱스 / 그래프 / 벡터 리포지토리 / LLM 연결 (워커당 1회)
+    # 기본은 백그라운드 실행 → 바로 요청 수신, 준비 여부는 /health/ready
+    warmup = get_startup_warmup()
+    task = warmup.start()
+    if settings.STARTUP_WARMUP_BLOCKING:
+        await task
+
+    # 최신 뉴스 색인 백그라운드 갱신
+    news_refresher = get_news_refresher()
+    if settings.NEWS_REFRESH_ENABLED:
+        news_refresher.start()
+
+    yield
+
+    await warmup.stop()
+    await news_refresher.stop()
+    get_pattern_registry().stop_watcher()
+    close_vector_repository()
+    close_embeddings()
+    await close_llm_client()
+    close_generation_cache()
+    shutdown_executor()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     description="""
@@ -53,7 +134,8 @@ app = FastAPI(
     - 💡 맞춤형 대응 방안 제공
     """,
     version=settings.APP_VERSION,
-    license_info={"name":"MIT"}
+    license_info={"name":"MIT"},
+    lifespan=lifespan,
 )
 
 #CORS 설정
@@ -65,6 +147,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def instrument_request(request: Request, call_next) -> Response:
+    """
+    요청 계측
+
+    - 로그 컨텍스트: trace_id (X-Request-ID 헤더가 있으면 사용, 응답 X-Trace-ID로 반환)
+      + DEBUG 상세 로그 샘플링 결정
+    - 요청 처리 시간 히스토그램 (스트리밍은 응답 헤더까지, 라우트 템플릿 기준 레이블)
+    """
+    start = time.perf_counter()
+    status = 500
+    try:
+        with request_context(request.headers.get("x-request-id")) as trace_id:
+            response = await call_next(request)
+        status = response.status_code
+        response.headers["X-Trace-ID"] = trace_id
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - start,
+            request.method,
+            getattr(route, "path", "unmatched"),
+            str(status),
+        )
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc: RequestValidationError):
     """요청 검증 실패 핸들러"""
@@ -89,12 +198,8 @@ async def validation_exception_handler(request, exc: RequestValidationError):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc: Exception):
     """일반 예외 핸들러"""
-    print(f"❌ 서버 오류: {exc}")
+    logger.error("서버 오류: %s", exc, exc_info=settings.DEBUG)
 
-    if settings.DEBUG:
-        import traceback
-        traceback.print_exc()
-    
     return JSONResponse(
         status_code=500,
         content={
@@ -104,39 +209,104 @@ async def general_exception_handler(request, exc: Exception):
         }
     )
 
-# 런타임 초기화 (그래프 캐시)
-# ============================================================================
+logger.info(
+    "서버 시작 (예열은 백그라운드, 준비 여부는 /health/ready)",
+    extra={
+        "app": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "host": f"{settings.API_HOST}:{settings.API_PORT}",
+        "debug": settings.DEBUG,
+        "llm_model": settings.LLM_MODEL,
+        "chroma_path": settings.CHROMA_PATH,
+    },
+)
 
-print("\n" + "="*60)
-print("🚀 금융 사기 탐지 AI 에이전트 서버 시작")
-print("="*60)
+router = APIRouter()
 
-print("\n[1/2] LangGraph 워크플로우 로드 중...")
-try:
-    from agent.graph import get_graph
-    GRAPH = get_graph()
-    print("✅ 워크플로우 로드 완료")
-except Exception as e:
-    print(f"❌ 워크플로우 로드 실패: {e}")
-    GRAPH = None
-
-print(f"\n[2/2] 서버 설정")
-print(f"  - 애플리케이션: {settings.APP_NAME}")
-print(f"  - 버전: {settings.APP_VERSION}")
-print(f"  - 호스트: {settings.API_HOST}:{settings.API_PORT}")
-print(f"  - 디버그: {settings.DEBUG}")
-print(f"  - LLM 모델: {settings.LLM_MODEL}")
-print(f"  - LLM 온도: {settings.LLM_TEMPERATURE}")
-print(f"  - ChromaDB: {settings.CHROMA_PATH}")
-
-print("\n" + "="*60)
-print("✅ 서버 준비 완료!")
-print("="*60)
-print(f"\n📍 API 문서: http://localhost:{settings.API_PORT}/docs")
-print(f"📍 헬스체크: http://localhost:{settings.API_PORT}/health")
-print(f"📍 탐지 API: http://localhost:{settings.API_PORT}/api/v1/detect\n")
 
-router = APIRouter()
+def _require_graph() -> None:
+    """
+    그래프 준비 확인 (시작 예열의 graph 단계가 끝나기 전이면 503)
+
+    단계가 실패 / 타임아웃이면 요청 시 다시 생성 시도 (get_graph / get_analysis_graph)
+    """
+    if get_startup_warmup().stage_status("graph") in (STAGE_PENDING, STAGE_RUNNING):
+        raise HTTPException(
+            status_code=503,
+            detail="AI 에이전트가 초기화 중입니다. 잠시 후 다시 시도해주세요."
+        )
+
+
+def _initial_state(req: DetectScamRequest) -> Dict[str, Any]:
+    """그래프 초기 상태"""
+    return {
+        "message": req.message,
+        "sender": req.sender,
+        "scam_type": None,
+        "confidence": None,
+        "similar_cases": [],
+        "matched_patterns": [],
+        "pattern_analysis": None,
+        "news_docs": [],
+        "risk_level": None,
+        "risk_score": None,
+        "risk_factors": [],
+        "is_scam": None,
+        "analysis": None,
+        "recommendations": None,
+        "generation_path": None,
+        "prompt_tokens": None,
+        "llm_model": None,
+        "screen_verdict": None,
+        "skipped_stages": [],
+        "stage_timings": {},
+        "trace_id": current_trace_id() or new_trace_id(),
+        "traces": [],
+        "completed": False,
+    }
+
+
+def _coalesce_key(req: DetectScamRequest) -> str:
+    """동시 요청 병합 키 (정규화된 메시지 + 발신자)"""
+    raw = f"{normalize_text(req.message)}\0{normalize_text(req.sender or '')}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def _invoke_coalesced(name: str, graph: Any, req: DetectScamRequest) -> Dict[str, Any]:
+    """
+    그래프 실행 (같은 메시지의 동시 요청은 실행 1회를 공유)
+
+    DETECT_COALESCE_ENABLED가 꺼져 있으면 요청마다 실행
+    """
+    if not settings.DETECT_COALESCE_ENABLED:
+        return await graph.ainvoke(_initial_state(req))
+    return await get_singleflight(name).run(
+        _coalesce_key(req), lambda: graph.ainvoke(_initial_state(req))
+    )
+
+
+def _to_response(result: Dict[str, Any], processing_time: float) -> DetectScamResponse:
+    """그래프 결과 → API 응답"""
+    return DetectScamResponse(
+        success=True,
+        is_scam=result.get("is_scam", False),
+        scam_type=result.get("scam_type", "알 수 없음"),
+        confidence=result.get("confidence", 0.5),
+        risk_level=result.get("risk_level", "알 수 없음"),
+        risk_score=result.get("risk_score", 0),
+        risk_factors=result.get("risk_factors", []),
+        analysis=result.get("analysis", "분석 결과 없음"),
+        recommendations=result.get("recommendations", "대응 방안 없음"),
+        processing_time=round(processing_time, 2),
+        matched_patterns_count=len(result.get("matched_patterns", [])),
+        similar_cases_count=len(result.get("similar_cases", [])),
+        generation_path=result.get("generation_path"),
+        prompt_tokens=result.get("prompt_tokens"),
+        llm_model=result.get("llm_model"),
+        screen_verdict=result.get("screen_verdict"),
+        skipped_stages=result.get("skipped_stages") or [],
+        stage_timings=result.get("stage_timings") or {},
+    )
 
 @app.get("/", tags=["System"])
 def root():
@@ -153,7 +323,11 @@ def root():
         "endpoints": {
             "docs": "/docs",
             "health": "/health",
-            "detect": "/api/v1/detect"
+            "health_live": "/health/live",
+            "health_ready": "/health/ready",
+            "detect": "/api/v1/detect",
+            "detect_stream": "/api/v1/detect/stream",
+            "detect_batch": "/api/v1/detect/batch",
         },
         "features": [
             "실시간 사기 메시지 분석",
@@ -175,16 +349,61 @@ def health():
     """
     헬스 체크 엔드포인트
     
+    서킷이 하나라도 open이면 degraded (템플릿 응답 / BM25 검색으로 동작 중)
+
     Returns:
         HealthCheckResponse: 서버 상태 정보
     """
+    breakers = get_circuit_breaker_stats()
+    warmup = get_startup_warmup()
+    if not warmup.ready:
+        status = "intializing"
+    elif any(b["state"] == OPEN for b in breakers.values()):
+        status = "degraded"
+    else:
+        status = "healthy"
+
     return HealthCheckResponse(
-        status="healthy" if GRAPH is not None else "intializing",
+        status=status,
         version=settings.APP_VERSION,
         timestamp=datetime.now().isoformat(),
-        graph_loaded=GRAPH is not None,
+        graph_loaded=warmup.stage_ok("graph"),
+        vector_store_ready=is_vector_repository_ready(),
         upstage_configured=bool(settings.UPSTAGE_API_KEY),
         langsmith_enabled=bool(settings.LANGCHAIN_API_KEY),
+        circuit_breakers=breakers,
+    )
+
+
+@app.get(
+    "/health/live",
+    tags=["System"],
+    summary="활성 상태 확인 (liveness)",
+    description="프로세스가 요청에 응답하는지만 확인 (예열 진행 여부와 무관하게 200)",
+)
+def health_live() -> Dict[str, str]:
+    """liveness 프로브 (실패 시 재시작 대상)"""
+    return {"status": "alive"}
+
+
+@app.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "예열 진행 중 / 필수 단계 실패"}},
+    tags=["System"],
+    summary="준비 상태 확인 (readiness)",
+    description="시작 예열 단계별 상태. 필수 단계(patterns, graph) 성공 + 모든 단계 종료 시 200, 아니면 503",
+)
+def health_ready() -> JSONResponse:
+    """
+    readiness 프로브 (준비 전에는 트래픽을 보내지 않음)
+
+    vector_store / llm 단계 실패는 준비 완료를 막지 않음 (BM25 검색 / 템플릿 응답으로 동작)
+    """
+    readiness = ReadinessResponse(**get_startup_warmup().stats())
+    return JSONResponse(
+        status_code=200 if readiness.ready else 503,
+        content=readiness.model_dump(),
     )
 @router.post(
     "/api/v1/detect",
@@ -206,7 +425,9 @@ def health():
                         "recommendations": "즉시 신고하세요...",
                         "processing_time": 3.45,
                         "matched_patterns_count": 3,
-                        "similar_cases_count": 5
+                        "similar_cases_count": 5,
+                        "generation_path": "llm",
+                        "llm_model": "solar-pro"
                     }
                 }
             }
@@ -245,80 +466,368 @@ async def detect_scam(req: DetectScamRequest) -> DetectScamResponse:
     """
     
     # 그래프 준비 확인
-    if GRAPH is None:
-        raise HTTPException(
-            status_code=503,
-            detail="AI 에이전트가 초기화 중입니다. 잠시 후 다시 시도해주세요."
-        )
-    
-    # 초기 상태 생성
-    initial_state: Dict[str, Any] = {
-        "message": req.message,
-        "sender": req.sender,
-        "scam_type": None,
-        "confidence": None,
-        "similar_cases": [],
-        "matched_patterns": [],
-        "risk_level": None,
-        "risk_score": None,
-        "risk_factors": [],
-        "is_scam": None,
-        "analysis": None,
-        "recommendations": None,
-        "processing_time": None,
-        "completed": False,
-    }
-    
+    _require_graph()
+    from agent.graph import get_graph
+
     # AI 실행
     start_time = time.time()
     
     try:
-        print(f"\n📨 새로운 분석 요청")
-        print(f"  메시지: {req.message[:50]}...")
-        if req.sender:
-            print(f"  발신자: {req.sender}")
-        
-        # LangGraph 비동기 실행
-        result = await GRAPH.ainvoke(initial_state)
+        logger.debug(
+            "분석 요청", extra={"message_preview": req.message[:50], "sender": req.sender}
+        )
+
+        # LangGraph 비동기 실행 (같은 메시지의 동시 요청은 실행 1회 공유)
+        result = await _invoke_coalesced("detect", get_graph(), req)
         
         processing_time = time.time() - start_time
         
-        print(f"✅ 분석 완료 ({processing_time:.2f}초)")
-        print(f"  → 사기 여부: {'예' if result.get('is_scam') else '아니오'}")
-        print(f"  → 위험도: {result.get('risk_level')} ({result.get('risk_score')}점)\n")
+        logger.info(
+            "분석 완료",
+            extra={
+                "processing_time": round(processing_time, 3),
+                "is_scam": result.get("is_scam"),
+                "risk_level": result.get("risk_level"),
+                "risk_score": result.get("risk_score"),
+                "generation_path": result.get("generation_path"),
+            },
+        )
         
         # 응답 생성
-        return DetectScamResponse(
-            success=True,
-            is_scam=result.get("is_scam", False),
-            scam_type=result.get("scam_type", "알 수 없음"),
-            confidence=result.get("confidence", 0.5),
-            risk_level=result.get("risk_level", "알 수 없음"),
-            risk_score=result.get("risk_score", 0),
-            risk_factors=result.get("risk_factors", []),
-            analysis=result.get("analysis", "분석 결과 없음"),
-            recommendations=result.get("recommendations", "대응 방안 없음"),
-            processing_time=round(processing_time, 2),
-            matched_patterns_count=len(result.get("matched_patterns", [])),
-            similar_cases_count=len(result.get("similar_cases", [])),
-        )
+        return _to_response(result, processing_time)
         
     except ValueError as e:
-        print(f"❌ 입력 검증 실패: {e}")
+        logger.warning("입력 검증 실패: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     
     except Exception as e:
-        print(f"❌ 분석 실패: {e}")
-        
-        if settings.DEBUG:
-            import traceback
-            traceback.print_exc()
-        
+        logger.error("분석 실패: %s", e, exc_info=settings.DEBUG)
+
         raise HTTPException(
             status_code=500,
             detail=f"분석 중 오류가 발생했습니다: {str(e)}" if settings.DEBUG else "분석 중 오류가 발생했습니다."
         )
 
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post(
+    "/api/v1/detect/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "SSE 스트림 (verdict → token … → summary)",
+            "content": {"text/event-stream": {}},
+        },
+        503: {"model": ErrorResponse, "description": "서비스 준비 중"},
+    },
+    tags=["Detection"],
+    summary="사기 메시지 탐지 (스트리밍)",
+    description="""
+    `/api/v1/detect`와 같은 분석을 Server-Sent Events로 전송합니다.
+
+    **이벤트 순서:**
+    1. `verdict`: 위험도 분석 완료 직후 판정 (is_scam, risk_score, risk_level 등)
+    2. `token`: LLM 대응 방안 텍스트 조각 (`{"text": "..."}`)
+    3. `summary`: 최종 결과 (`/api/v1/detect` 응답과 같은 형식)
+
+    오류 시 `error` 이벤트(`{"error": "..."}`)를 보내고 스트림을 종료합니다.
+    """,
+)
+async def detect_scam_stream(req: DetectScamRequest) -> StreamingResponse:
+    """
+    스트리밍 사기 탐지 엔드포인트
+
+    판정은 검색 + 분석 지연만에 도착하고, 대응 방안은 토큰 단위로 이어서 전송
+
+    Args:
+        req: DetectScamRequest (message, sender)
+
+    Returns:
+        StreamingResponse (text/event-stream)
+    """
+    _require_graph()
+    from agent.graph import get_analysis_graph
+    from agent.nodes.generate import stream_recommendations
+
+    async def events() -> AsyncIterator[str]:
+        start_time = time.time()
+        logger.debug("스트리밍 분석 요청", extra={"message_preview": req.message[:50]})
+
+        try:
+            # (classify ∥ patterns) → screen → (retrieve) → analyze (같은 메시지의 동시 요청은 실행 1회 공유)
+            state = await _invoke_coalesced("detect_stream", get_analysis_graph(), req)
+
+            verdict = DetectVerdictEvent(
+                is_scam=state.get("is_scam", False),
+                scam_type=state.get("scam_type", "알 수 없음"),
+                confidence=state.get("confidence", 0.5),
+                risk_level=state.get("risk_level", "알 수 없음"),
+                risk_score=state.get("risk_score", 0),
+                risk_factors=state.get("risk_factors", []),
+                matched_patterns_count=len(state.get("matched_patterns", [])),
+                similar_cases_count=len(state.get("similar_cases", [])),
+                elapsed=round(time.time() - start_time, 3),
+            )
+            logger.debug(
+                "판정 전송",
+                extra={
+                    "elapsed": verdict.elapsed,
+                    "risk_level": verdict.risk_level,
+                    "risk_score": verdict.risk_score,
+                },
+            )
+            yield _sse("verdict", verdict.model_dump())
+
+            # 대응 방안 토큰 스트리밍
+            parts = []
+            meta: Dict[str, Any] = {}
+            recommend_start = time.perf_counter()
+            with NODE_METRICS.track("recommend"):
+                async for token in stream_recommendations(state, meta):
+                    parts.append(token)
+                    yield _sse("token", {"text": token})
+
+            analysis = "".join(parts).strip()
+            state = {
+                **state,
+                "analysis": analysis,
+                "recommendations": analysis,
+                "generation_path": meta.get("generation_path"),
+                "prompt_tokens": meta.get("prompt_tokens"),
+                "llm_model": meta.get("llm_model"),
+                "stage_timings": {
+                    **(state.get("stage_timings") or {}),
+                    "recommend": round((time.perf_counter() - recommend_start) * 1000, 1),
+                },
+            }
+
+            processing_time = time.time() - start_time
+            logger.info(
+                "스트리밍 분석 완료",
+                extra={
+                    "processing_time": round(processing_time, 3),
+                    "risk_level": state.get("risk_level"),
+                    "risk_score": state.get("risk_score"),
+                    "generation_path": state.get("generation_path"),
+                },
+            )
+            yield _sse("summary", _to_response(state, processing_time).model_dump())
+
+        except Exception as e:
+            logger.error("스트리밍 분석 실패: %s", e, exc_info=settings.DEBUG)
+            yield _sse(
+                "error",
+                {"error": f"분석 중 오류가 발생했습니다: {e}" if settings.DEBUG else "분석 중 오류가 발생했습니다."},
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/api/v1/detect/batch",
+    response_model=BatchDetectResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "배치 크기 초과"},
+        422: {"model": ErrorResponse, "description": "입력 데이터 검증 실패"},
+        503: {"model": ErrorResponse, "description": "서비스 준비 중"},
+    },
+    tags=["Detection"],
+    summary="사기 메시지 배치 탐지",
+    description="""
+    여러 메시지를 한 번의 요청으로 분석합니다.
+
+    **처리 방식:**
+    - 분류 / 패턴 매칭을 배치 전체에 대해 수행
+    - 임베딩은 캐시 미스 메시지만 모아 1회 배치 호출, 벡터 검색도 한 번에 수행
+    - `generate=false`(기본)면 템플릿 대응 방안, `true`면 생성 정책에 따라 LLM 생성 (동시 실행 수 제한)
+    - 항목별 오류는 해당 항목의 `error`에 기록
+    - 검색 단계가 `BATCH_SEARCH_TIMEOUT`을 넘으면 빈 결과로 진행하고 `degraded_sources`에 기록
+    """,
+)
+async def detect_scam_batch(req: BatchDetectRequest) -> BatchDetectResponse:
+    """
+    배치 사기 탐지 엔드포인트
+
+    Args:
+        req: BatchDetectRequest (items, generate)
+
+    Returns:
+        BatchDetectResponse: 항목별 결과
+    """
+    if len(req.items) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"배치 크기는 최대 {settings.BATCH_MAX_ITEMS}개입니다. (요청: {len(req.items)}개)",
+        )
+
+    _require_graph()
+    from agent.batch import detect_batch
+
+    start_time = time.time()
+    logger.debug("배치 분석 요청", extra={"items": len(req.items), "generate": req.generate})
+
+    outputs = await detect_batch(
+        [(item.message, item.sender) for item in req.items], generate=req.generate
+    )
+
+    results = []
+    for idx, output in enumerate(outputs):
+        if "error" in output:
+            results.append(BatchDetectItem(index=idx, success=False, error=output["error"]))
+            continue
+        results.append(
+            BatchDetectItem(
+                index=idx,
+                success=True,
+                result=DetectScamResponse(
+                    success=True,
+                    is_scam=output["is_scam"],
+                    scam_type=output["scam_type"],
+                    confidence=output["confidence"],
+                    risk_level=output["risk_level"],
+                    risk_score=output["risk_score"],
+                    risk_factors=output["risk_factors"],
+                    analysis=output["analysis"],
+                    recommendations=output["recommendations"],
+                    processing_time=round(output["processing_time"], 2),
+                    matched_patterns_count=len(output["matched_patterns"]),
+                    similar_cases_count=len(output["similar_cases"]),
+                    generation_path=output.get("generation_path"),
+                    prompt_tokens=output.get("prompt_tokens"),
+                    llm_model=output.get("llm_model"),
+                ),
+                degraded_sources=output.get("degraded_sources") or [],
+            )
+        )
+
+    processing_time = time.time() - start_time
+    succeeded = sum(1 for item in results if item.success)
+    logger.info(
+        "배치 분석 완료",
+        extra={
+            "processing_time": round(processing_time, 3),
+            "items": len(results),
+            "succeeded": succeeded,
+            "degraded": sum(1 for item in results if item.degraded_sources),
+        },
+    )
+
+    return BatchDetectResponse(
+        success=True,
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        processing_time=round(processing_time, 2),
+        results=results,
+    )
+
+
+@app.get(
+    "/api/v1/stats",
+    response_model=SystemStatsResponse,
+    tags=["System"],
+    summary="런타임 통계",
+    description="캐시 hit/miss/eviction 카운터 및 패턴 인덱스 상태",
+)
+def stats() -> SystemStatsResponse:
+    """
+    런타임 통계 엔드포인트
+
+    실제 트래픽 기준으로 캐시 크기/TTL을 조정하는 데 사용
+    """
+    from agent.nodes.screen import get_screen_stats
+
+    return SystemStatsResponse(
+        timestamp=datetime.now().isoformat(),
+        caches=get_cache_stats(),
+        pattern_index=get_pattern_registry().stats(),
+        embedding_cache=get_embedding_cache_stats(),
+        generation_cache=get_generation_cache_stats(),
+        llm_models=get_llm_model_stats(),
+        llm_limiter=get_llm_limiter_stats(),
+        llm_hedging=get_llm_hedge_stats(),
+        screening=get_screen_stats(),
+        coalescing=get_singleflight_stats(),
+        news_index=get_news_refresher().stats(),
+    )
+
+
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    tags=["System"],
+    summary="Prometheus 메트릭",
+    description="노드 / 데이터 소스 / LLM 모델별 지연 히스토그램, 결과 카운터, 대기열 게이지",
+)
+def metrics() -> PlainTextResponse:
+    """
+    Prometheus 스크레이프 엔드포인트 (text/plain; version=0.0.4)
+
+    METRICS_ENABLED가 꺼져 있으면 404
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="메트릭이 비활성화되어 있습니다.")
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+def _verify_admin_key(x_admin_key: Optional[str]) -> None:
+    """
+    관리자 API 키 확인
+
+    ADMIN_API_KEY 미설정 시 관리자 API 비활성화 (404), 키 불일치 시 403
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=404, detail="관리자 API가 비활성화되어 있습니다.")
+    if not x_admin_key or not hmac.compare_digest(
+        x_admin_key.encode("utf-8"), settings.ADMIN_API_KEY.encode("utf-8")
+    ):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+
+
+@router.post(
+    "/api/v1/admin/patterns/reload",
+    response_model=PatternReloadResponse,
+    responses={
+        403: {"model": ErrorResponse, "description": "관리자 권한 없음"},
+        404: {"model": ErrorResponse, "description": "관리자 API 비활성화 (ADMIN_API_KEY 미설정)"},
+    },
+    tags=["Admin"],
+    summary="사기 패턴 리로드",
+    description="scam_patterns.json을 다시 읽어 패턴 인덱스를 교체합니다 (재시작 불필요).",
+)
+async def reload_patterns(
+    x_admin_key: Optional[str] = Header(None),
+) -> PatternReloadResponse:
+    """
+    패턴 인덱스 리로드 (관리자)
+
+    새 인덱스는 백그라운드 스레드에서 컴파일되고 완료 후 원자적으로 교체됨
+    """
+    _verify_admin_key(x_admin_key)
+
+    registry = get_pattern_registry()
+    reloaded = await asyncio.to_thread(registry.reload, True)
+    stats = registry.stats()
+
+    return PatternReloadResponse(
+        success=stats["last_error"] is None,
+        reloaded=reloaded,
+        version=stats["version"],
+        digest=stats["digest"],
+        patterns=stats["patterns"],
+        loaded_at=stats["loaded_at"],
+        error=stats["last_error"],
+    )
+
+
 app.include_router(router)
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ Pydantic 모델을 사용한 타입 안전성
 """
 
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 #요청 스키마
 class DetectScamRequest(BaseModel):
@@ -53,7 +53,9 @@ class DetectScamResponse(BaseModel):
                     "recommendations": "즉시 신고하세요...",
                     "processing_time": 3.45,
                     "matched_patterns_count": 3,
-                    "similar_cases_count": 5
+                    "similar_cases_count": 5,
+                    "generation_path": "llm",
+                    "llm_model": "solar-pro"
                 }
             ]
         }
@@ -80,6 +82,89 @@ class DetectScamResponse(BaseModel):
     processing_time: float = Field(..., description="처리 시간 (초)", ge=0.0)
     matched_patterns_count: int = Field(..., description="매칭된 패턴 수", ge=0)
     similar_cases_count: int = Field(..., description="유사 사례 수", ge=0)
+    generation_path: Optional[str] = Field(
+        None,
+        description="대응 방안 생성 경로 (llm / cache / template_safe / template_high_risk / template / fallback / circuit_open)",
+    )
+    prompt_tokens: Optional[int] = Field(
+        None, description="LLM 입력 토큰 수 (로컬 추정, LLM 프롬프트를 만든 경우만)", ge=0
+    )
+    llm_model: Optional[str] = Field(
+        None, description="대응 방안을 생성한 LLM 모델 (위험도 기반 라우팅, llm / cache 경로만)"
+    )
+    screen_verdict: Optional[str] = Field(
+        None, description="1차 선별 판정 (safe / scam / uncertain, 선별 미사용 / 배치는 None)"
+    )
+    skipped_stages: List[str] = Field(
+        default_factory=list, description="1차 선별로 생략된 단계 (retrieve / llm)"
+    )
+    stage_timings: Dict[str, float] = Field(
+        default_factory=dict,
+        description="그래프 노드별 소요 시간 (ms, classify / patterns / retrieve는 병렬 브랜치)",
+    )
+
+class DetectVerdictEvent(BaseModel):
+    """스트리밍 탐지 판정 이벤트 (analyze 완료 직후 전송)"""
+
+    is_scam: bool = Field(..., description="사기 여부")
+    scam_type: str = Field(..., description="사기 유형")
+    confidence: float = Field(..., description="분류 신뢰도 (0-1)", ge=0.0, le=1.0)
+    risk_level: str = Field(..., description="위험도 레벨")
+    risk_score: int = Field(..., description="위험도 점수 (0-100)", ge=0, le=100)
+    risk_factors: List[str] = Field(default_factory=list, description="위험 요인 목록")
+    matched_patterns_count: int = Field(..., description="매칭된 패턴 수", ge=0)
+    similar_cases_count: int = Field(..., description="유사 사례 수", ge=0)
+    elapsed: float = Field(..., description="요청 시작부터 판정까지 걸린 시간 (초)", ge=0.0)
+
+
+class BatchDetectRequest(BaseModel):
+    """배치 사기 탐지 요청"""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "items": [
+                        {"message": "금융감독원입니다. 안전계좌로 이체하세요.", "sender": "02-1234-5678"},
+                        {"message": "[택배] 배송지 확인 http://bit.ly/xxx"},
+                    ],
+                    "generate": False,
+                }
+            ]
+        }
+    )
+
+    items: List[DetectScamRequest] = Field(
+        ..., description="분석할 메시지 목록 (최대 BATCH_MAX_ITEMS개)", min_length=1
+    )
+    generate: bool = Field(
+        default=False, description="LLM 대응 방안 생성 여부 (false면 템플릿 응답)"
+    )
+
+
+class BatchDetectItem(BaseModel):
+    """배치 항목별 결과"""
+
+    index: int = Field(..., description="요청 items 내 위치", ge=0)
+    success: bool = Field(..., description="항목 처리 성공 여부")
+    result: Optional[DetectScamResponse] = Field(None, description="분석 결과 (성공 시)")
+    error: Optional[str] = Field(None, description="오류 내용 (실패 시)")
+    degraded_sources: List[str] = Field(
+        default_factory=list,
+        description="데드라인 초과 / 실패로 결과 없이 분석한 검색 소스 (patterns / vector / bm25)",
+    )
+
+
+class BatchDetectResponse(BaseModel):
+    """배치 사기 탐지 응답"""
+
+    success: bool = Field(..., description="요청 성공 여부 (항목별 실패와 무관)")
+    total: int = Field(..., description="요청 메시지 수", ge=0)
+    succeeded: int = Field(..., description="성공 항목 수", ge=0)
+    failed: int = Field(..., description="실패 항목 수", ge=0)
+    processing_time: float = Field(..., description="전체 처리 시간 (초)", ge=0.0)
+    results: List[BatchDetectItem] = Field(default_factory=list, description="항목별 결과 (입력 순서)")
+
 
 class ErrorResponse(BaseModel):
     """에러 응답"""
@@ -95,5 +180,69 @@ class HealthCheckResponse(BaseModel):
     version: str = Field(..., description="API 버전")
     timestamp: str = Field(..., description="현재 시각 (ISO 8601)")
     graph_loaded: bool = Field(..., description="그래프 로드 여부")
+    vector_store_ready: bool = Field(default=False, description="벡터 리포지토리 생성 및 예열 완료 여부")
     upstage_configured: bool = Field(default=False, description="Upstage API 설정 여부")
     langsmith_enabled: bool = Field(default=False, description="LangSmith 활성화 여부")
+    circuit_breakers: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="외부 API 서킷 브레이커 상태 (embedding / llm.<모델명>: closed / open / half_open)",
+    )
+
+
+class ReadinessResponse(BaseModel):
+    """준비 상태 응답 (시작 예열 단계별 상태)"""
+
+    ready: bool = Field(..., description="요청 처리 준비 완료 여부 (필수 단계 성공 + 모든 단계 종료)")
+    elapsed_ms: Optional[float] = Field(None, description="예열 시작 후 경과 시간 (ms, 완료 시 총 소요 시간)")
+    stages: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="단계별 상태 (status: pending / running / ok / failed, elapsed_ms, error, required)",
+    )
+
+
+class PatternReloadResponse(BaseModel):
+    """패턴 리로드 응답"""
+
+    success: bool = Field(..., description="리로드 성공 여부")
+    reloaded: bool = Field(..., description="새 인덱스로 교체되었는지 여부 (내용 변경 없으면 False)")
+    version: int = Field(..., description="현재 패턴 인덱스 버전")
+    digest: Optional[str] = Field(None, description="패턴 파일 해시 (sha256 앞 12자)")
+    patterns: int = Field(..., description="등록된 패턴 수", ge=0)
+    loaded_at: Optional[str] = Field(None, description="인덱스 로드 시각 (ISO 8601)")
+    error: Optional[str] = Field(None, description="마지막 로드 오류")
+
+
+class SystemStatsResponse(BaseModel):
+    """런타임 통계 응답"""
+
+    timestamp: str = Field(..., description="현재 시각 (ISO 8601)")
+    caches: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="캐시별 hit/miss/eviction 통계"
+    )
+    pattern_index: Dict[str, Any] = Field(
+        default_factory=dict, description="패턴 인덱스 상태"
+    )
+    embedding_cache: Optional[Dict[str, Any]] = Field(
+        None, description="쿼리 임베딩 캐시 통계 (메모리/디스크 hit rate, 원격 호출 수)"
+    )
+    generation_cache: Optional[Dict[str, Any]] = Field(
+        None, description="LLM 생성 결과 캐시 통계 (hit rate, 메모리/디스크)"
+    )
+    llm_models: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="모델별 LLM 호출 통계 (요청 / 실패 수, 지연, 토큰 사용량)"
+    )
+    llm_limiter: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None, description="모델별 LLM 호출 제한기 통계 (동시 실행 수, 대기열 깊이, 대기 시간, 429 횟수)"
+    )
+    llm_hedging: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None, description="모델별 LLM 요청 헤징 통계 (헤지 시점, 헤지 / 승리 횟수, 추가 호출 비율)"
+    )
+    screening: Dict[str, Any] = Field(
+        default_factory=dict, description="1차 선별 통계 (판정별 건수, 단계 생략 횟수)"
+    )
+    coalescing: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="동시 요청 병합 통계 (실행 / 병합 요청 수)"
+    )
+    news_index: Dict[str, Any] = Field(
+        default_factory=dict, description="최신 뉴스 색인 상태 (키워드별 뉴스 수, 마지막 갱신 시각)"
+    )
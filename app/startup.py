@@ -0,0 +1,207 @@
+"""
+워커 시작 예열
+
+역할:
+- 무거운 import / 리소스 준비를 lifespan의 백그라운드 태스크로 실행
+  → 워커는 바로 요청 수신 (/health/live), 준비가 끝나면 /health/ready가 200
+- 단계 (동기 작업은 스레드에서, 필수 단계 → 나머지 순서로 두 단계씩 동시 실행):
+  - patterns: 패턴 인덱스 컴파일 + 파일 변경 감시 시작
+  - graph: agent 모듈 import (langgraph / langchain_core) + 그래프 2종 컴파일
+  - vector_store: 벡터 리포지토리 생성 (chromadb import) + 임베딩 연결 / BM25 / 인덱스 예열
+  - llm: langchain_upstage import + 모델별 클라이언트 생성 + 연결 1개 미리 맺기
+- 단계별 상태 / 소요 시간 / 오류 기록 (/health/ready)
+- 준비 완료: 필수 단계(patterns, graph) 성공 + 모든 단계 종료
+  (vector_store / llm 실패는 BM25 검색 / 템플릿 응답으로 동작하므로 준비 완료를 막지 않음)
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+STAGE_PENDING = "pending"
+STAGE_RUNNING = "running"
+STAGE_OK = "ok"
+STAGE_FAILED = "failed"
+
+# 실패하면 요청을 처리할 수 없는 단계
+REQUIRED_STAGES = ("patterns", "graph")
+
+StageFunc = Callable[[], Union[None, Awaitable[None]]]
+
+
+def _load_patterns() -> None:
+    from app.config import settings
+    from infrastructure.patterns import get_pattern_registry
+
+    registry = get_pattern_registry()
+    registry.current()
+    registry.start_watcher(interval=settings.PATTERN_RELOAD_INTERVAL)
+
+
+def _build_graphs() -> None:
+    from agent.graph import get_analysis_graph, get_graph
+
+    get_graph()
+    get_analysis_graph()
+
+
+def _init_vector_store() -> None:
+    from infrastructure.vector_store.provider import (
+        init_vector_repository,
+        is_vector_repository_ready,
+    )
+
+    init_vector_repository()
+    if not is_vector_repository_ready():
+        raise RuntimeError("벡터 검색 예열 실패 (BM25 검색으로 동작)")
+
+
+async def _warm_llm() -> None:
+    from app.config import settings
+    from infrastructure.llm.provider import warm_llm_client
+
+    warmed = await warm_llm_client(timeout=settings.LLM_CONNECT_TIMEOUT)
+    logger.debug("LLM 연결 예열", extra={"connections": warmed})
+
+
+STAGES: Dict[str, StageFunc] = {
+    "patterns": _load_patterns,
+    "graph": _build_graphs,
+    "vector_store": _init_vector_store,
+    "llm": _warm_llm,
+}
+
+# 동시에 실행할 단계 묶음 (필수 단계 먼저)
+# 묶음 안에서는 서로 다른 무거운 패키지를 import (같은 모듈 동시 import 경합 최소화)
+_WAVES = (("patterns", "graph"), ("vector_store", "llm"))
+
+
+class StartupWarmup:
+    """
+    시작 예열 실행기 (워커당 1개)
+
+    Example:
+        warmup = get_startup_warmup()
+        warmup.start()          # lifespan에서 백그라운드 실행
+        warmup.ready            # /health/ready
+        await warmup.stop()     # 종료 시 (진행 중이면 취소)
+    """
+
+    def __init__(self, stage_timeout: float = 60.0) -> None:
+        self.stage_timeout = stage_timeout
+        self._stages: Dict[str, Dict[str, Any]] = {
+            name: {"status": STAGE_PENDING, "elapsed_ms": None, "error": None}
+            for name in STAGES
+        }
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """필수 단계 성공 + 모든 단계 종료"""
+        return all(
+            stage["status"] in (STAGE_OK, STAGE_FAILED) for stage in self._stages.values()
+        ) and all(self.stage_ok(name) for name in REQUIRED_STAGES)
+
+    def stage_status(self, name: str) -> str:
+        return self._stages[name]["status"]
+
+    def stage_ok(self, name: str) -> bool:
+        return self.stage_status(name) == STAGE_OK
+
+    async def _run_stage(self, name: str, func: StageFunc) -> None:
+        stage = self._stages[name]
+        stage["status"] = STAGE_RUNNING
+        start = time.perf_counter()
+        work = func() if asyncio.iscoroutinefunction(func) else asyncio.to_thread(func)
+        try:
+            await asyncio.wait_for(work, timeout=self.stage_timeout)
+            stage["status"] = STAGE_OK
+        except asyncio.TimeoutError:
+            # 스레드 작업은 취소되지 않고 계속 진행 (끝나면 이후 요청이 결과 사용)
+            stage["status"] = STAGE_FAILED
+            stage["error"] = f"{self.stage_timeout}초 초과"
+        except asyncio.CancelledError:
+            stage["status"] = STAGE_FAILED
+            stage["error"] = "취소됨"
+            raise
+        except Exception as e:
+            stage["status"] = STAGE_FAILED
+            stage["error"] = str(e)
+        finally:
+            stage["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+        if stage["status"] == STAGE_OK:
+            logger.info("예열 단계 완료: %s", name, extra={"elapsed_ms": stage["elapsed_ms"]})
+        else:
+            log = logger.error if name in REQUIRED_STAGES else logger.warning
+            log(
+                "예열 단계 실패: %s (%s)",
+                name,
+                stage["error"],
+                extra={"elapsed_ms": stage["elapsed_ms"]},
+            )
+
+    async def run(self) -> None:
+        """모든 단계 실행 (단계 실패는 기록만, 예외 전파 없음)"""
+        self._started = time.perf_counter()
+        for wave in _WAVES:
+            await asyncio.gather(*(self._run_stage(name, STAGES[name]) for name in wave))
+        self._finished = time.perf_counter()
+        logger.info(
+            "시작 예열 완료",
+            extra={
+                "ready": self.ready,
+                "elapsed_ms": self.stats()["elapsed_ms"],
+                "stages": {name: stage["status"] for name, stage in self._stages.items()},
+            },
+        )
+
+    def start(self) -> "asyncio.Task[None]":
+        """백그라운드 실행 시작 (이미 시작했으면 기존 태스크)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="startup-warmup")
+        return self._task
+
+    async def stop(self) -> None:
+        """진행 중인 예열 취소"""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """준비 여부 + 단계별 상태 (/health/ready)"""
+        elapsed_ms = None
+        if self._started is not None:
+            end = self._finished if self._finished is not None else time.perf_counter()
+            elapsed_ms = round((end - self._started) * 1000, 1)
+        return {
+            "ready": self.ready,
+            "elapsed_ms": elapsed_ms,
+            "stages": {
+                name: {**stage, "required": name in REQUIRED_STAGES}
+                for name, stage in self._stages.items()
+            },
+        }
+
+
+_warmup: Optional[StartupWarmup] = None
+
+
+def get_startup_warmup() -> StartupWarmup:
+    """전역 예열 실행기"""
+    global _warmup
+    if _warmup is None:
+        from app.config import settings
+
+        _warmup = StartupWarmup(stage_timeout=settings.STARTUP_STAGE_TIMEOUT)
+    return _warmup
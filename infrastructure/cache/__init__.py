@@ -0,0 +1,15 @@
+"""
+infrastructure.cache 패키지
+
+캐시 모듈 (인메모리 LRU / SQLite 영구 캐시)
+"""
+
+from infrastructure.cache.lru import LRUCache, get_cache, get_cache_stats
+from infrastructure.cache.sqlite_store import SQLiteCache
+
+__all__ = [
+    "LRUCache",
+    "SQLiteCache",
+    "get_cache",
+    "get_cache_stats",
+]
@@ -0,0 +1,176 @@
+"""
+LRU + TTL 캐시
+
+역할:
+- 최근 사용 순서 기반 LRU 제거 (한 건씩)
+- 선택적 TTL (만료 항목은 조회 시 제거)
+- 스레드 안전 (ThreadPoolExecutor 워커 / 이벤트 루프 모두에서 사용 가능)
+- hit / miss / eviction / expiration 카운터
+
+락 구간은 dict 연산뿐이라 이벤트 루프를 막지 않음
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[V]):
+    """
+    스레드 안전 LRU/TTL 캐시
+
+    Example:
+        cache = LRUCache(maxsize=1000, ttl=300, name="vector")
+        cache.set(key, docs)
+        docs = cache.get(key)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        name: str = "cache",
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            maxsize: 최대 항목 수
+            ttl: 항목 유효 시간 (초, None 또는 0이면 만료 없음)
+            name: 캐시 이름 (통계 표시용)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl if ttl and ttl > 0 else None
+
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], V]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """
+        조회 (hit 시 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+            default: 없을 때 반환값
+            count: hit/miss 카운터 반영 여부
+        """
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+
+            if item is not _MISSING:
+                expires_at, value = item
+                if expires_at is not None and expires_at <= time.monotonic():
+                    del self._data[key]
+                    self.expirations += 1
+                else:
+                    self._data.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    return value
+
+            if count:
+                self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """
+        저장 (용량 초과 시 가장 오래 사용되지 않은 항목부터 제거)
+
+        Args:
+            key: 캐시 키
+            value: 값
+            ttl: 항목별 TTL (None이면 캐시 기본값)
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = (expires_at, value)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거"""
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def clear(self) -> None:
+        """전체 비우기 (카운터는 유지)"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"LRUCache(name={self.name}, size={len(self._data)}, "
+            f"maxsize={self.maxsize}, ttl={self.ttl})"
+        )
+
+
+# ========== 이름 기반 캐시 레지스트리 ========== #
+_CACHES: Dict[str, LRUCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_cache(name: str, maxsize: int = 1024, ttl: Optional[float] = None) -> LRUCache:
+    """
+    이름으로 공유 캐시 조회 (없으면 생성)
+
+    Args:
+        name: 캐시 이름
+        maxsize: 최대 항목 수 (최초 생성 시에만 적용)
+        ttl: TTL 초 (최초 생성 시에만 적용)
+    """
+    cache = _CACHES.get(name)
+    if cache is None:
+        with _CACHES_LOCK:
+            cache = _CACHES.get(name)
+            if cache is None:
+                cache = LRUCache(maxsize=maxsize, ttl=ttl, name=name)
+                _CACHES[name] = cache
+    return cache
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """등록된 모든 캐시 통계"""
+    return {name: cache.stats() for name, cache in list(_CACHES.items())}
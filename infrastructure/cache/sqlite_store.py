@@ -0,0 +1,207 @@
+"""
+SQLite 영구 캐시
+
+역할:
+- 재시작 후에도 유지되는 key-value 캐시 (디스크)
+- WAL 모드로 여러 uvicorn 워커가 같은 파일을 공유
+- 최대 항목 수 초과 시 가장 오래 사용되지 않은 항목부터 제거
+- 선택적 TTL
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = Path(__file__).resolve().parents[2]
+
+
+class SQLiteCache:
+    """
+    SQLite 기반 영구 캐시 (bytes 값)
+
+    Example:
+        store = SQLiteCache("data/cache/embeddings.sqlite3", max_entries=100_000)
+        store.set("key", b"...")
+        value = store.get("key")
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 100_000,
+        ttl: Optional[float] = None,
+        name: str = "sqlite",
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로 (상대 경로는 프로젝트 루트 기준)
+            max_entries: 최대 항목 수
+            ttl: 항목 유효 시간 (초, None 또는 0이면 만료 없음)
+            name: 캐시 이름 (통계 표시용)
+        """
+        path = Path(path)
+        self.path = path if path.is_absolute() else _BASE_DIR / path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl if ttl and ttl > 0 else None
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=5.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed_at)"
+        )
+
+        # 제거는 용량의 1% 단위로 묶어서 수행 (매 쓰기마다 정리하지 않음)
+        self._evict_batch = max(1, max_entries // 100)
+        self._writes_since_check = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and created_at + self.ttl <= now
+
+    def get(self, key: str) -> Optional[bytes]:
+        """조회 (hit 시 접근 시각 갱신)"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """여러 키 한 번에 조회"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        now = time.time()
+        found: Dict[str, bytes] = {}
+        try:
+            with self._lock:
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start : start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, value, created_at FROM cache WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                    for key, value, created_at in rows:
+                        if not self._expired(created_at, now):
+                            found[key] = value
+
+                if found:
+                    self._conn.executemany(
+                        "UPDATE cache SET accessed_at = ? WHERE key = ?",
+                        [(now, key) for key in found],
+                    )
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("캐시 조회 실패 (%s): %s", self.name, e)
+            return {}
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def set(self, key: str, value: bytes) -> None:
+        """저장"""
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[str, bytes]) -> None:
+        """여러 항목 한 번에 저장"""
+        if not items:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(key, value, now, now) for key, value in items.items()],
+                )
+                self._writes_since_check += len(items)
+                if self._writes_since_check >= self._evict_batch:
+                    self._writes_since_check = 0
+                    self._evict_locked()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("캐시 저장 실패 (%s): %s", self.name, e)
+
+    def _evict_locked(self) -> None:
+        """용량 초과분 / 만료 항목 제거 (락 보유 상태에서 호출)"""
+        if self.ttl is not None:
+            cur = self._conn.execute(
+                "DELETE FROM cache WHERE created_at <= ?", (time.time() - self.ttl,)
+            )
+            self.evictions += max(cur.rowcount, 0)
+
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            cur = self._conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            )
+            self.evictions += max(cur.rowcount, 0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        return count
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        lookups = self.hits + self.misses
+        try:
+            size = len(self)
+        except sqlite3.Error:
+            size = -1
+        return {
+            "name": self.name,
+            "path": str(self.path),
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
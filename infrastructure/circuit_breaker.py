@@ -0,0 +1,240 @@
+"""
+서킷 브레이커 (Upstage LLM / 임베딩 호출 보호)
+
+역할:
+- 외부 API가 연속 실패하면 일정 시간 호출 자체를 차단 (타임아웃까지 기다리지 않음)
+  → LLM은 템플릿 응답, 임베딩은 BM25 어휘 검색만으로 즉시 대체
+- 상태: closed(정상) → 연속 실패 failure_threshold회 → open(차단)
+  → recovery_timeout 경과 → half_open(시험 호출 half_open_max_calls개만 허용)
+  → 성공이면 closed, 실패면 다시 open
+- 스레드 안전 (임베딩은 executor 스레드에서 호출)
+- 이름 기반 레지스트리 (/health에 상태 노출, /metrics에 상태 게이지)
+"""
+
+import contextlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+from infrastructure.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출 차단 (즉시 폴백으로 전환)"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+
+    Example:
+        breaker = CircuitBreaker("embedding", failure_threshold=5, recovery_timeout=30)
+        with breaker.protect():
+            vector = embeddings.embed_query(text)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            name: 이름 (통계 / 로그 표시용)
+            failure_threshold: open으로 전환할 연속 실패 횟수
+            recovery_timeout: open 유지 시간 (초, 이후 half_open 시험 호출)
+            half_open_max_calls: half_open 상태의 동시 시험 호출 수
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+        self.successes = 0
+        self.total_failures = 0
+        self.rejected = 0
+        self.opened = 0
+
+    def _current(self, now: float) -> str:
+        """시간 경과를 반영한 상태 (락 보유 상태에서 호출)"""
+        if self._state == OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current(time.monotonic())
+
+    def available(self) -> bool:
+        """지금 호출하면 허용되는지 (상태만 확인, 시험 호출 슬롯은 잡지 않음)"""
+        with self._lock:
+            state = self._current(time.monotonic())
+            return state == CLOSED or (
+                state == HALF_OPEN and self._probes < self.half_open_max_calls
+            )
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open이면 시험 호출 슬롯 획득)"""
+        with self._lock:
+            state = self._current(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.successes += 1
+            self._failures = 0
+            if self._state != CLOSED:
+                logger.info("서킷 복구: %s → closed", self.name)
+            self._state = CLOSED
+            self._probes = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.total_failures += 1
+            self._failures += 1
+            state = self._current(time.monotonic())
+            if state == HALF_OPEN or (
+                state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+                self.opened += 1
+                logger.warning(
+                    "서킷 차단: %s → open (연속 실패 %s회, %.0f초 후 재시도)",
+                    self.name,
+                    self._failures,
+                    self.recovery_timeout,
+                )
+
+    def _release(self) -> None:
+        """결과 없이 끝난 호출 (취소 / 무시 예외) → 시험 호출 슬롯만 반환"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    @contextlib.contextmanager
+    def protect(self, ignore: Tuple[Type[BaseException], ...] = ()) -> Iterator[None]:
+        """
+        호출 보호 구간
+
+        Args:
+            ignore: 실패로 세지 않을 예외 (로컬 대기열 초과 등)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있음 (호출하지 않음)
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} 서킷 open (외부 API 장애로 호출 차단)")
+        try:
+            yield
+        except ignore:
+            self._release()
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # 취소 / 스트림 조기 종료는 성공도 실패도 아님
+            self._release()
+            raise
+        else:
+            self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """브레이커 상태 / 카운터"""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current(now)
+            retry_in = (
+                round(max(0.0, self.recovery_timeout - (now - self._opened_at)), 1)
+                if state == OPEN
+                else None
+            )
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "retry_in": retry_in,
+                "successes": self.successes,
+                "failures": self.total_failures,
+                "rejected": self.rejected,
+                "opened": self.opened,
+            }
+
+
+# ========== 이름 기반 레지스트리 ========== #
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> Optional[CircuitBreaker]:
+    """
+    이름으로 공유 브레이커 조회 (없으면 설정값으로 생성)
+
+    CIRCUIT_BREAKER_ENABLED가 꺼져 있으면 None
+    """
+    from app.config import settings
+
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return None
+
+    breaker = _BREAKERS.get(name)
+    if breaker is None:
+        with _BREAKERS_LOCK:
+            breaker = _BREAKERS.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    name,
+                    failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                    recovery_timeout=settings.CIRCUIT_RECOVERY_TIMEOUT,
+                    half_open_max_calls=settings.CIRCUIT_HALF_OPEN_MAX_CALLS,
+                )
+                _BREAKERS[name] = breaker
+    return breaker
+
+
+def is_circuit_available(name: str) -> bool:
+    """브레이커가 호출을 허용하는 상태인지 (브레이커 미사용 / 미생성이면 True)"""
+    breaker = _BREAKERS.get(name)
+    return breaker is None or breaker.available()
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """등록된 모든 브레이커 상태"""
+    return {name: breaker.stats() for name, breaker in list(_BREAKERS.items())}
+
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+REGISTRY.gauge_callback(
+    "scam_circuit_breaker_state",
+    "Circuit breaker state (0=closed, 1=half_open, 2=open)",
+    ("name",),
+    lambda: {(name,): _STATE_VALUES[breaker.state] for name, breaker in list(_BREAKERS.items())},
+)
@@ -0,0 +1,85 @@
+"""
+공유 블로킹 작업 실행기
+
+역할:
+- 프로세스 전역 ThreadPoolExecutor (크기 제한) 하나를 모든 노드가 공유
+- 요청마다 executor를 만들고 `with` 블록에서 전부 기다리던 방식 대체
+- 데드라인 초과 시 대기 중인 작업은 취소, 실행 중인 작업은 결과 폐기
+- 작업자 대기 시간(제출 → 실행 시작)을 현재 메트릭 구간에 기록 (infrastructure.metrics)
+- 호출 측 contextvars(로그 trace_id / DEBUG 샘플링, 메트릭 구간)를 복사해 작업 스레드에서 실행
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, TypeVar
+
+from infrastructure.metrics import note_queue_wait
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """전역 executor (최초 호출 시 생성)"""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                from app.config import settings
+
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.BLOCKING_MAX_WORKERS,
+                    thread_name_prefix="blocking",
+                )
+    return _executor
+
+
+async def run_blocking(
+    func: Callable[..., T], *args: Any, timeout: Optional[float] = None
+) -> T:
+    """
+    블로킹 함수를 공유 executor에서 실행
+
+    Args:
+        func: 블로킹 함수
+        *args: 함수 인자
+        timeout: 데드라인 (초, None이면 무제한)
+
+    Returns:
+        함수 결과
+
+    Raises:
+        asyncio.TimeoutError: 데드라인 초과 (작업은 취소 또는 폐기됨)
+    """
+    loop = asyncio.get_running_loop()
+    submitted = time.perf_counter()
+    started: List[float] = []
+    # run_in_executor는 contextvars를 복사하지 않음 (asyncio.to_thread와 달리)
+    context = contextvars.copy_context()
+
+    def call() -> T:
+        started.append(time.perf_counter())
+        return context.run(func, *args)
+
+    future = loop.run_in_executor(get_executor(), call)
+    try:
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout=timeout)
+    finally:
+        # 실행 전에 데드라인이 지났으면 전체가 대기 시간
+        note_queue_wait((started[0] if started else time.perf_counter()) - submitted)
+
+
+def shutdown_executor() -> None:
+    """전역 executor 종료 (대기 중인 작업 취소, 실행 중인 작업은 기다리지 않음)"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -2,12 +2,79 @@
 infrastructure.llm 패키지
 
 LLM 클라이언트 모듈
+
+하위 모듈은 이름에 처음 접근할 때 import (PEP 562)
+→ 패키지 import만으로 langchain_upstage 등 무거운 의존성을 로드하지 않음
 """
 
-from infrastructure.llm.client import UpstageClient, create_llm_client, get_llm_client
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from infrastructure.llm.client import (
+        LLMQueueFullError,
+        LLMRateLimiter,
+        ModelUsage,
+        RequestHedger,
+        UpstageClient,
+        create_llm_client,
+        get_llm_client,
+        load_chat_model_class,
+    )
+    from infrastructure.llm.generation_cache import (
+        GenerationCache,
+        close_generation_cache,
+        get_generation_cache,
+        get_generation_cache_stats,
+    )
+    from infrastructure.llm.provider import (
+        close_llm_client,
+        get_llm_hedge_stats,
+        get_llm_limiter_stats,
+        get_llm_model_stats,
+        get_upstage_client,
+        init_llm_client,
+        warm_llm_client,
+    )
+    from infrastructure.llm.router import ModelRoute, route_model, routed_models
+
+# 공개 이름 → 정의 모듈
+_EXPORTS = {
+    "LLMQueueFullError": "infrastructure.llm.client",
+    "LLMRateLimiter": "infrastructure.llm.client",
+    "ModelUsage": "infrastructure.llm.client",
+    "RequestHedger": "infrastructure.llm.client",
+    "UpstageClient": "infrastructure.llm.client",
+    "create_llm_client": "infrastructure.llm.client",
+    "get_llm_client": "infrastructure.llm.client",
+    "load_chat_model_class": "infrastructure.llm.client",
+    "GenerationCache": "infrastructure.llm.generation_cache",
+    "close_generation_cache": "infrastructure.llm.generation_cache",
+    "get_generation_cache": "infrastructure.llm.generation_cache",
+    "get_generation_cache_stats": "infrastructure.llm.generation_cache",
+    "close_llm_client": "infrastructure.llm.provider",
+    "get_llm_hedge_stats": "infrastructure.llm.provider",
+    "get_llm_limiter_stats": "infrastructure.llm.provider",
+    "get_llm_model_stats": "infrastructure.llm.provider",
+    "get_upstage_client": "infrastructure.llm.provider",
+    "init_llm_client": "infrastructure.llm.provider",
+    "warm_llm_client": "infrastructure.llm.provider",
+    "ModelRoute": "infrastructure.llm.router",
+    "route_model": "infrastructure.llm.router",
+    "routed_models": "infrastructure.llm.router",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
-__all__ =[
-    "UpstageClient",
-    "create_llm_client",
-    "get_llm_client",
-]
\ No newline at end of file
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
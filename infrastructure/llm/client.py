@@ -6,21 +6,455 @@ Upstage LLM 클라이언트
 - 비동기 호출 (asyncio)
 - Timeout 관리
 - 간단한 에러 처리
+- keep-alive 연결 풀(httpx) 주입 (infrastructure.llm.provider가 프로세스 전역 1개 관리)
+- 호출 제한기 (동시 실행 수 + 분당 요청/토큰 버킷 + 제한된 대기열, 429 Retry-After 백오프)
+- 요청 헤징 (최근 지연 백분위까지 응답이 없으면 같은 요청 1회 추가, 먼저 온 응답 사용)
+- 요청별 max_tokens 지정 / 모델별 지연 / 토큰 사용량 통계 (모델 라우팅: infrastructure.llm.router)
+- 서킷 브레이커 (연속 실패 시 호출 차단 → 타임아웃까지 기다리지 않고 즉시 폴백)
+- 모델별 호출 시간 / 슬롯 대기 시간 / 결과 / 토큰 메트릭 (infrastructure.metrics, /metrics)
+- langchain_upstage는 첫 클라이언트 생성 시 import (모듈 import 비용 최소화)
 """
 
 import asyncio
-from typing import Optional, List
+import contextlib
+import functools
+import logging
+import random
+import time
+import warnings
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Deque, Dict, Optional, List
 
-from langchain_upstage import ChatUpstage
-from langchain_core.messages import HumanMessage, SystemMessage, BaseMessage
+import httpx
 
-# Pydantic 모델 rebuild (langchain_upstage의 BaseCache 의존성 해결)
-try:
-    ChatUpstage.model_rebuild()
-    print("✓ ChatUpstage 모델 rebuild 성공")
-except Exception as e:
-    print(f"⚠️ ChatUpstage 모델 rebuild 실패: {e}")
-    # rebuild 실패해도 계속 진행 (이후 사용 시 재시도)
+from infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from infrastructure.metrics import LLM_METRICS, LLM_TOKENS, OUTCOME_TIMEOUT, note_queue_wait
+from infrastructure.llm.tokens import estimate_tokens
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_upstage import ChatUpstage
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def load_chat_model_class() -> "type[ChatUpstage]":
+    """
+    ChatUpstage 클래스 (최초 클라이언트 생성 시 import)
+
+    langchain_upstage import와 Pydantic 모델 rebuild(BaseCache 의존성 해결)는
+    수백 ms가 걸리므로 모듈 import 시점이 아니라 첫 생성 시 프로세스당 1회만 수행
+    (워커 부팅 시간 단축, 서버에서는 시작 예열 단계에서 미리 수행)
+    """
+    from langchain_core.caches import BaseCache  # noqa: F401  (model_rebuild 네임스페이스)
+    from langchain_core.callbacks import Callbacks  # noqa: F401
+    from langchain_upstage import ChatUpstage
+
+    try:
+        ChatUpstage.model_rebuild()
+        logger.debug("ChatUpstage 모델 rebuild 성공")
+    except Exception as e:
+        logger.warning("ChatUpstage 모델 rebuild 실패: %s", e)
+        # rebuild 실패해도 계속 진행 (이후 사용 시 재시도)
+    return ChatUpstage
+
+
+class LLMQueueFullError(Exception):
+    """LLM 호출 대기열 초과 / 대기 시간 초과 (즉시 폴백 응답으로 전환)"""
+
+
+class _TokenBucket:
+    """
+    분당 한도 토큰 버킷 (예약 방식)
+
+    먼저 차감하고 부족분이 다시 채워질 때까지의 대기 시간을 반환.
+    이벤트 루프 안에서만 사용 (await 없는 구간이라 락 불필요)
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """amount만큼 예약하고 필요한 대기 시간(초) 반환"""
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        self.level -= min(amount, self.capacity)
+        return 0.0 if self.level >= 0 else -self.level / self.rate
+
+    def refund(self, amount: float) -> None:
+        """예약 반환 (실제 사용량이 예약보다 적을 때)"""
+        self.level = min(self.capacity, self.level + amount)
+
+
+class LLMRateLimiter:
+    """
+    LLM 호출 제한기 (프로세스 내 모든 LLM 호출이 공유)
+
+    - 동시 실행 수 제한 (세마포어)
+    - 분당 요청 수 / 토큰 수 버킷 (0이면 제한 없음)
+    - 429 응답의 Retry-After 동안 신규 호출 보류
+    - 대기열(빈 슬롯을 기다리는 요청)이 가득 차거나 queue_timeout 안에
+      슬롯 / 한도를 못 얻으면 LLMQueueFullError
+    - 대기열 깊이 / 대기 시간 통계
+
+    Example:
+        limiter = LLMRateLimiter(max_concurrency=8, requests_per_minute=100)
+        async with limiter.slot(tokens=1500) as settle:
+            response = await llm.ainvoke(messages)
+            settle(used_tokens)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_queue: int = 64,
+        queue_timeout: float = 5.0,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            max_concurrency: 최대 동시 호출 수
+            max_queue: 최대 대기 요청 수 (초과 시 즉시 거절)
+            queue_timeout: 슬롯 + 한도 대기 최대 시간 (초)
+            requests_per_minute: 분당 요청 한도 (0이면 제한 없음)
+            tokens_per_minute: 분당 토큰 한도 (0이면 제한 없음)
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._blocked_until = 0.0
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.queue_peak = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.rate_limited = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _reserve(self, tokens: int) -> float:
+        """요청 / 토큰 버킷 예약 + 429 보류 시간 → 필요한 대기 시간"""
+        delay = max(0.0, self._blocked_until - time.monotonic())
+        if self._requests is not None:
+            delay = max(delay, self._requests.reserve(1))
+        if self._tokens is not None and tokens > 0:
+            delay = max(delay, self._tokens.reserve(tokens))
+        return delay
+
+    def _refund(self, requests: int, tokens: int) -> None:
+        if self._requests is not None and requests > 0:
+            self._requests.refund(requests)
+        if self._tokens is not None and tokens > 0:
+            self._tokens.refund(tokens)
+
+    async def _acquire(self, tokens: int, start: float) -> None:
+        """슬롯 + 분당 한도 확보 (실패 시 LLMQueueFullError, 슬롯은 반환된 상태)"""
+        if not self._semaphore.locked():
+            # 빈 슬롯이 있으면 대기열을 거치지 않음
+            await self._semaphore.acquire()
+        else:
+            if self.waiting >= self.max_queue:
+                self.rejected += 1
+                raise LLMQueueFullError(f"LLM 대기열 초과 ({self.waiting}/{self.max_queue})")
+
+            self.waiting += 1
+            self.queue_peak = max(self.queue_peak, self.waiting)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                raise LLMQueueFullError(f"LLM 슬롯 대기 시간 초과 ({self.queue_timeout}초)")
+            finally:
+                self.waiting -= 1
+
+        # 분당 한도 / 429 보류 대기 (슬롯은 확보한 상태)
+        try:
+            delay = self._reserve(tokens)
+            if time.monotonic() + delay > start + self.queue_timeout:
+                self._refund(1, tokens)
+                self.timeouts += 1
+                raise LLMQueueFullError(f"LLM 호출 한도 대기 필요 ({delay:.1f}초)")
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    @contextlib.asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[Callable[[Optional[int]], None]]:
+        """
+        호출 슬롯 획득
+
+        Args:
+            tokens: 예상 토큰 수 (입력 + 최대 출력, 토큰 버킷 예약량)
+
+        Yields:
+            settle(실제 사용 토큰) - 예약보다 적게 쓴 토큰을 버킷에 반환
+
+        Raises:
+            LLMQueueFullError: 대기열 초과 / 대기 시간 초과
+        """
+        start = time.monotonic()
+        try:
+            await self._acquire(tokens, start)
+        finally:
+            # 거절 / 대기 시간 초과도 대기 시간으로 기록 (메트릭 구간)
+            note_queue_wait(time.monotonic() - start)
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        self.in_flight += 1
+
+        def settle(used_tokens: Optional[int]) -> None:
+            if used_tokens is not None and used_tokens < tokens:
+                self._refund(0, tokens - used_tokens)
+
+        try:
+            yield settle
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def has_capacity(self) -> bool:
+        """대기 없이 바로 호출 가능한지 (빈 슬롯 있음 + 429 보류 아님)"""
+        return not self._semaphore.locked() and self._blocked_until <= time.monotonic()
+
+    def note_rate_limited(self, retry_after: float) -> None:
+        """429 수신 → retry_after 동안 신규 호출 보류"""
+        self.rate_limited += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        """제한기 통계 (대기열 깊이 / 대기 시간)"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "queue_peak": self.queue_peak,
+            "max_queue": self.max_queue,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "rate_limited": self.rate_limited,
+            "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+            "avg_wait_ms": round(self.wait_total / self.acquired * 1000, 2) if self.acquired else 0.0,
+            "max_wait_ms": round(self.wait_max * 1000, 2),
+        }
+
+
+class RequestHedger:
+    """
+    요청 헤징 정책 (꼬리 지연 완화)
+
+    - 최근 성공 요청 지연(헤지 포함 요청 단위)을 window개까지 보관, percentile 지연을 헤지 시점으로 사용
+      (샘플이 min_samples개 미만이면 헤징하지 않음)
+    - 추가 호출 예산: 일반 호출 1건당 max_ratio만큼 적립, 헤지 1건당 1 소모
+      (적립 상한 burst → 지연 급증 구간에도 호출량이 두 배가 되지 않음)
+
+    Example:
+        hedger = RequestHedger(percentile=0.95, max_ratio=0.1)
+        delay = hedger.delay()          # None이면 헤징 안 함
+        if hedger.try_acquire(): ...    # 헤지 호출 시작
+        hedger.observe(latency)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 1.0,
+        max_ratio: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+        burst: float = 5.0,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            percentile: 헤지 시점 백분위 (0-1)
+            min_delay: 최소 헤지 대기 시간 (초)
+            max_ratio: 일반 호출 대비 최대 추가 호출 비율
+            window: 지연 샘플 보관 개수
+            min_samples: 헤징 시작에 필요한 최소 샘플 수
+            burst: 추가 호출 예산 적립 상한
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.burst = burst
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._credit = 0.0
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.skipped = 0
+
+    def observe(self, latency: float) -> None:
+        """성공 요청 지연 기록 (초, 헤지가 이긴 요청은 첫 호출 시작부터의 지연)"""
+        self._latencies.append(latency)
+
+    def quantile(self) -> Optional[float]:
+        """현재 percentile 지연 (샘플 부족 시 None)"""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        idx = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return ordered[idx]
+
+    def delay(self) -> Optional[float]:
+        """
+        일반 호출 시작 시 호출 → 헤지 대기 시간 (None이면 헤징 안 함)
+
+        추가 호출 예산도 이때 적립
+        """
+        self.requests += 1
+        self._credit = min(self.burst, self._credit + self.max_ratio)
+
+        quantile = self.quantile()
+        if quantile is None:
+            return None
+        return max(self.min_delay, quantile)
+
+    def try_acquire(self) -> bool:
+        """추가 호출 예산 1 소모 (부족하면 False)"""
+        if self._credit < 1.0:
+            self.skipped += 1
+            return False
+        self._credit -= 1.0
+        self.hedges += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """헤징 통계"""
+        quantile = self.quantile()
+        return {
+            "percentile": self.percentile,
+            "samples": len(self._latencies),
+            "hedge_after": round(max(self.min_delay, quantile), 3) if quantile is not None else None,
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "skipped": self.skipped,
+            "hedge_ratio": round(self.hedges / self.requests, 4) if self.requests else 0.0,
+            "max_ratio": self.max_ratio,
+        }
+
+
+def _build_messages(prompt: str, system_prompt: Optional[str]) -> List["BaseMessage"]:
+    """메시지 구성 (langchain_core.messages는 첫 호출 시 import)"""
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    messages: List["BaseMessage"] = []
+    if system_prompt:
+        messages.append(SystemMessage(content=system_prompt))
+    messages.append(HumanMessage(content=prompt))
+    return messages
+
+
+def _estimate_tokens(*texts: Optional[str]) -> int:
+    """입력 토큰 수 추정 (버킷 예약용)"""
+    return sum(estimate_tokens(text) for text in texts) + 1
+
+
+def _usage_tokens(message: Any) -> Optional[int]:
+    """응답 메시지의 실제 사용 토큰 수 (없으면 None)"""
+    usage = getattr(message, "usage_metadata", None)
+    if usage:
+        return usage.get("total_tokens")
+    return None
+
+
+class ModelUsage:
+    """
+    모델별 호출 통계 (지연 / 토큰 사용량)
+
+    지연은 최근 window개 성공 호출 기준 (스트리밍은 마지막 청크까지).
+    model을 주면 토큰 사용량을 메트릭(scam_llm_tokens_total)에도 누적
+    """
+
+    def __init__(self, model: Optional[str] = None, window: int = 200) -> None:
+        self.model = model
+        self.requests = 0
+        self.failures = 0
+        self.streams = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+
+    def observe(self, latency: float, message: Any = None) -> None:
+        """성공 호출 기록 (응답에 usage_metadata가 있으면 토큰 수 누적)"""
+        self._latencies.append(latency)
+        usage = getattr(message, "usage_metadata", None)
+        if usage:
+            input_tokens = usage.get("input_tokens", 0)
+            output_tokens = usage.get("output_tokens", 0)
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+            if self.model is not None:
+                LLM_TOKENS.inc(self.model, "input", amount=input_tokens)
+                LLM_TOKENS.inc(self.model, "output", amount=output_tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        """호출 통계"""
+        latencies = sorted(self._latencies)
+        count = len(latencies)
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "streams": self.streams,
+            "avg_latency_ms": round(sum(latencies) / count * 1000, 1) if count else 0.0,
+            "p95_latency_ms": (
+                round(latencies[min(count - 1, int(count * 0.95))] * 1000, 1) if count else 0.0
+            ),
+            "max_latency_ms": round(latencies[-1] * 1000, 1) if count else 0.0,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+
+def _retry_after(error: Exception, attempt: int) -> Optional[float]:
+    """
+    429 응답이면 재시도 대기 시간(초), 아니면 None
+
+    Retry-After / retry-after-ms 헤더 우선, 없으면 지수 백오프 + 지터
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status != 429:
+        return None
+
+    headers = getattr(response, "headers", None) or {}
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value:
+            try:
+                return max(0.0, float(value) * scale)
+            except ValueError:
+                pass
+    return min(2.0 ** attempt, 8.0) + random.uniform(0.0, 0.5)
 
 
 class UpstageClient:
@@ -31,6 +465,11 @@ class UpstageClient:
     - 비동기 호출 (async/await)
     - Timeout 관리
     - 에러 처리
+    - 외부 httpx 클라이언트(연결 풀) 주입 가능
+    - 호출 제한기(LLMRateLimiter) 주입 시 동시 실행 / 분당 한도 / 429 백오프 적용
+    - 헤징 정책(RequestHedger) 주입 시 느린 호출에 같은 요청 1회 추가
+    - 요청별 max_tokens 지정, 호출 지연 / 토큰 사용량 통계 (usage)
+    - 서킷 브레이커 주입 시 open 상태면 호출 없이 CircuitOpenError
 
     Example:
         client = UpstageClient(
@@ -51,6 +490,12 @@ class UpstageClient:
         temperature: float = 0.1,
         max_tokens: int = 2000,
         timeout: int = 25,
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[LLMRateLimiter] = None,
+        rate_limit_retries: int = 2,
+        hedger: Optional[RequestHedger] = None,
+        breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         """
         초기화
@@ -61,6 +506,12 @@ class UpstageClient:
             temperature: 온도 (0.0-2.0)
             max_tokens: 최대 토큰 수
             timeout: 타임아웃 (초)
+            http_client: 동기 호출용 httpx 클라이언트 (None이면 SDK 기본값)
+            http_async_client: 비동기 호출용 httpx 클라이언트 (None이면 SDK 기본값)
+            limiter: 호출 제한기 (None이면 제한 없음)
+            rate_limit_retries: 429 응답 재시도 횟수 (제한기 사용 시)
+            hedger: 요청 헤징 정책 (None이면 헤징 없음, generate에만 적용)
+            breaker: 서킷 브레이커 (None이면 사용 안 함, generate / stream에 적용)
         """
 
         self.api_key = api_key
@@ -68,24 +519,156 @@ class UpstageClient:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self.http_client = http_client
+        self.http_async_client = http_async_client
+        self.limiter = limiter
+        self.rate_limit_retries = rate_limit_retries
+        self.hedger = hedger
+        self.breaker = breaker
+        self.usage = ModelUsage(model)
 
         # LangChain ChatUpstage 초기화
-        # Pydantic 모델 rebuild (인스턴스 생성 직전에 실행)
-        try:
-            ChatUpstage.model_rebuild()
-        except Exception:
-            pass  # 이미 빌드된 경우 무시
-
-        self.llm = ChatUpstage(
+        # (제한기 사용 시 429 재시도는 제한기가 담당 → SDK 자체 재시도 끔)
+        options: Dict[str, Any] = {"max_retries": 0} if limiter is not None else {}
+        self.llm = load_chat_model_class()(
             model=model,
             upstage_api_key=api_key,
             temperature=temperature,
             max_tokens=max_tokens,
+            http_client=http_client,
+            http_async_client=http_async_client,
+            **options,
+        )
+
+    def _bind(self, max_tokens: Optional[int]) -> Any:
+        """요청별 max_tokens 적용 (기본값이면 그대로)"""
+        if max_tokens is None or max_tokens == self.max_tokens:
+            return self.llm
+        return self.llm.bind(max_tokens=max_tokens)
+
+    def _track(self, mode: str) -> Any:
+        """모델별 호출 메트릭 구간 (재시도 / 헤지 / 슬롯 대기 포함 전체 시간)"""
+        return LLM_METRICS.track(
+            self.model,
+            mode,
+            outcomes=(
+                (LLMQueueFullError, "queue_full"),
+                (CircuitOpenError, "circuit_open"),
+                (TimeoutError, OUTCOME_TIMEOUT),
+            ),
         )
-        
+
+    def _protect(self) -> Any:
+        """서킷 브레이커 보호 구간 (대기열 초과는 외부 API 실패로 세지 않음)"""
+        if self.breaker is None:
+            return contextlib.nullcontext()
+        return self.breaker.protect(ignore=(LLMQueueFullError,))
+
+    def _slot(self, tokens: int) -> Any:
+        """제한기 슬롯 (제한기 없으면 바로 통과)"""
+        if self.limiter is None:
+            return contextlib.nullcontext(lambda used: None)
+        return self.limiter.slot(tokens)
+
+    async def _invoke_once(
+        self, llm: Any, messages: List["BaseMessage"], reserve: int, timeout: float
+    ) -> "BaseMessage":
+        """슬롯 획득 후 1회 호출 (성공 지연은 사용량 통계에 기록)"""
+        async with self._slot(reserve) as settle:
+            started = time.monotonic()
+            response = await asyncio.wait_for(llm.ainvoke(messages), timeout=timeout)
+            settle(_usage_tokens(response))
+        self.usage.observe(time.monotonic() - started, response)
+        return response
+
+    async def _invoke(self, llm: Any, messages: List["BaseMessage"], reserve: int) -> "BaseMessage":
+        """
+        호출 (헤징 정책이 있으면 헤징)
+
+        첫 호출이 percentile 지연 안에 끝나지 않으면 같은 요청을 하나 더 보내고
+        먼저 성공한 응답을 사용, 나머지는 취소.
+        추가 예산이 없거나 제한기에 빈 슬롯이 없으면 헤징하지 않음.
+        전체 대기는 첫 호출 기준 timeout 이내
+        """
+        hedger = self.hedger
+        if hedger is None:
+            return await self._invoke_once(llm, messages, reserve, self.timeout)
+
+        started = time.monotonic()
+        response = await self._invoke_hedged(llm, messages, reserve, hedger.delay())
+        # 요청 단위 지연 기록 (첫 호출 시작 ~ 응답)
+        # 헤지가 이기면 취소된 첫 호출 지연의 하한이 기록됨 → 빠른 승자만 남아
+        # 백분위가 점점 낮아지고 헤지가 더 일찍 / 자주 나가는 것을 방지
+        hedger.observe(time.monotonic() - started)
+        return response
+
+    async def _invoke_hedged(
+        self, llm: Any, messages: List["BaseMessage"], reserve: int, delay: Optional[float]
+    ) -> "BaseMessage":
+        """delay까지 첫 호출이 끝나지 않으면 같은 요청 1회 추가 (delay None이면 헤징 안 함)"""
+        hedger = self.hedger
+        if delay is None or delay >= self.timeout:
+            return await self._invoke_once(llm, messages, reserve, self.timeout)
+
+        deadline = time.monotonic() + self.timeout
+        primary = asyncio.ensure_future(self._invoke_once(llm, messages, reserve, self.timeout))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            if (self.limiter is not None and not self.limiter.has_capacity()) or not hedger.try_acquire():
+                return await primary
+
+            hedge = asyncio.ensure_future(
+                self._invoke_once(llm, messages, reserve, max(0.0, deadline - time.monotonic()))
+            )
+            pending.add(hedge)
+
+            first_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            hedger.hedge_wins += 1
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _backoff(self, error: Exception, attempt: int) -> bool:
+        """
+        429면 Retry-After만큼 보류 후 True (재시도), 아니면 False
+
+        대기 시간이 제한기 queue_timeout보다 길면 재시도하지 않음 (폴백이 더 빠름)
+        """
+        if self.limiter is None or attempt >= self.rate_limit_retries:
+            return False
+        delay = _retry_after(error, attempt)
+        if delay is None or delay > self.limiter.queue_timeout:
+            return False
+        logger.warning(
+            "LLM API 429 → %.1f초 후 재시도 (%s/%s)",
+            delay,
+            attempt + 1,
+            self.rate_limit_retries,
+            extra={"llm_model": self.model},
+        )
+        # 보류 시간은 제한기에 기록 → 다음 슬롯 획득 시 대기 (다른 요청도 함께 보류)
+        self.limiter.note_rate_limited(delay)
+        return True
+
 
     async def generate(
-        self, prompt: str, system_prompt: Optional[str] = None, **kwargs
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
     ) -> str:
         """
         텍스트 생성 (비동기)
@@ -93,6 +676,7 @@ class UpstageClient:
         Args:
             prompt: 사용자 프롬프트
             system_prompt: 시스템 프롬프트 (역할 정의)
+            max_tokens: 이 요청의 최대 출력 토큰 (None이면 클라이언트 기본값)
             **kwargs: 추가 파라미터
 
         Returns:
@@ -100,6 +684,7 @@ class UpstageClient:
 
         Raises:
             TimeoutError: 타임아웃 초과
+            CircuitOpenError: 서킷 open (호출하지 않음)
             Exception: 기타 에러
 
         Example:
@@ -109,37 +694,132 @@ class UpstageClient:
             )
         """
         # 메시지 구성
-        messages: List[BaseMessage] = []
-
-        if system_prompt:
-            messages.append(SystemMessage(content=system_prompt))
+        messages = _build_messages(prompt, system_prompt)
+
+        llm = self._bind(max_tokens)
+        reserve = _estimate_tokens(system_prompt, prompt) + (max_tokens or self.max_tokens)
+        self.usage.requests += 1
+
+        with self._track("generate"), self._protect():
+            try:
+                attempt = 0
+                while True:
+                    try:
+                        response = await self._invoke(llm, messages, reserve)
+                        return response.content
+                    except (LLMQueueFullError, asyncio.TimeoutError):
+                        raise
+                    except Exception as e:
+                        if not self._backoff(e, attempt):
+                            raise
+                        attempt += 1
+
+            except LLMQueueFullError as e:
+                self.usage.failures += 1
+                logger.warning("%s", e, extra={"llm_model": self.model})
+                raise
+
+            except asyncio.TimeoutError:
+                self.usage.failures += 1
+                error_msg = f"LLM API 타임아웃: {self.timeout}초 초과"
+                logger.warning(error_msg, extra={"llm_model": self.model})
+                raise TimeoutError(error_msg)
+
+            except Exception as e:
+                self.usage.failures += 1
+                error_msg = f"LLM API 에러: {str(e)}"
+                logger.warning(error_msg, extra={"llm_model": self.model})
+                raise Exception(error_msg)
+
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        텍스트 스트리밍 생성 (비동기, 토큰 단위)
 
-        messages.append(HumanMessage(content=prompt))
+        청크 간 대기 시간이 timeout을 넘으면 중단
 
-        try:
-            response = await asyncio.wait_for(
-                self.llm.ainvoke(messages), timeout=self.timeout
-            )
-
-            return response.content
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트
+            max_tokens: 이 요청의 최대 출력 토큰 (None이면 클라이언트 기본값)
 
-        except asyncio.TimeoutError:
-            error_msg = f"LLM API 타임아웃: {self.timeout}초 초과"
-            print(f"  ⚠️ {error_msg}")
-            raise TimeoutError(error_msg)
+        Yields:
+            생성된 텍스트 조각
 
-        except Exception as e:
-            error_msg = f"LLM API 에러: {str(e)}"
-            print(f"  ⚠️ {error_msg}")
-            raise Exception(error_msg)
+        Raises:
+            TimeoutError: 다음 청크 대기 타임아웃 초과
+            CircuitOpenError: 서킷 open (호출하지 않음)
+            Exception: 기타 에러
+        """
+        messages = _build_messages(prompt, system_prompt)
+
+        llm = self._bind(max_tokens)
+        reserve = _estimate_tokens(system_prompt, prompt) + (max_tokens or self.max_tokens)
+        self.usage.requests += 1
+        self.usage.streams += 1
+
+        with self._track("stream"), self._protect():
+            try:
+                attempt = 0
+                started = False
+                while True:
+                    try:
+                        async with self._slot(reserve):
+                            begin = time.monotonic()
+                            chunks = llm.astream(messages).__aiter__()
+                            try:
+                                while True:
+                                    try:
+                                        chunk = await asyncio.wait_for(
+                                            chunks.__anext__(), timeout=self.timeout
+                                        )
+                                    except StopAsyncIteration:
+                                        break
+                                    if chunk.content:
+                                        started = True
+                                        yield chunk.content
+                            finally:
+                                await chunks.aclose()
+                        self.usage.observe(time.monotonic() - begin)
+                        return
+                    except (LLMQueueFullError, asyncio.TimeoutError):
+                        raise
+                    except Exception as e:
+                        # 첫 청크 이전의 429만 재시도
+                        if started or not self._backoff(e, attempt):
+                            raise
+                        attempt += 1
+
+            except LLMQueueFullError as e:
+                self.usage.failures += 1
+                logger.warning("%s", e, extra={"llm_model": self.model})
+                raise
+
+            except asyncio.TimeoutError:
+                self.usage.failures += 1
+                error_msg = f"LLM API 타임아웃: {self.timeout}초 초과"
+                logger.warning(error_msg, extra={"llm_model": self.model})
+                raise TimeoutError(error_msg)
+
+            except Exception as e:
+                self.usage.failures += 1
+                error_msg = f"LLM API 에러: {str(e)}"
+                logger.warning(error_msg, extra={"llm_model": self.model})
+                raise Exception(error_msg)
 
     def generate_sync(
         self, prompt: str, system_prompt: Optional[str] = None, **kwargs
     ) -> str:
         """
-        텍스트 생성 (동기)
+        텍스트 생성 (동기, 사용 중단 예정)
 
-        비동기 환경이 아닐 때 사용
+        호출 제한기(asyncio 기반, 이벤트 루프 전용)를 거치지 않으므로 서비스 코드에서는
+        generate를 사용. 서킷 브레이커 / 사용량 통계 / 호출 메트릭은 generate와 같이 적용
 
         Args:
             prompt: 사용자 프롬프트
@@ -148,23 +828,39 @@ class UpstageClient:
 
         Returns:
             생성된 텍스트
-        """
-        messages: List[BaseMessage] = []
-
-        if system_prompt:
-            messages.append(SystemMessage(content=system_prompt))
-
-        messages.append(HumanMessage(content=prompt))
 
-        try:
-            # 동기 호출
-            response = self.llm.invoke(messages)
-            return response.content
-
-        except Exception as e:
-            error_msg = f"LLM API 에러: {str(e)}"
-            print(f"  ⚠️ {error_msg}")
-            raise Exception(error_msg)
+        Raises:
+            CircuitOpenError: 서킷 open (호출하지 않음)
+            Exception: 기타 에러
+        """
+        warnings.warn(
+            "UpstageClient.generate_sync는 호출 제한기를 거치지 않아 사용 중단 예정입니다. "
+            "generate를 사용하세요.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        messages = _build_messages(prompt, system_prompt)
+        self.usage.requests += 1
+
+        with self._track("sync"), self._protect():
+            try:
+                started = time.monotonic()
+                response = self.llm.invoke(messages)
+                self.usage.observe(time.monotonic() - started, response)
+                return response.content
+
+            except Exception as e:
+                self.usage.failures += 1
+                error_msg = f"LLM API 에러: {str(e)}"
+                logger.warning(error_msg, extra={"llm_model": self.model})
+                raise Exception(error_msg)
+
+    async def aclose(self) -> None:
+        """주입된 httpx 클라이언트 종료 (연결 풀 정리)"""
+        if self.http_async_client is not None:
+            await self.http_async_client.aclose()
+        if self.http_client is not None:
+            self.http_client.close()
 
     def __repr__(self) -> str:
         return (
@@ -214,23 +910,15 @@ def create_llm_client(
         timeout=timeout or settings.LLM_TIMEOUT,
     )
 
-def get_llm_client() -> ChatUpstage:
+def get_llm_client() -> "ChatUpstage":
     """
     전역 LLM 클라이언트 싱글톤 반환
 
+    프로세스 전역 UpstageClient(연결 풀 공유)의 ChatUpstage
+
     Returns:
         ChatUpstage 인스턴스
     """
-    from app.config import settings
+    from infrastructure.llm.provider import get_upstage_client
 
-    # Pydantic 모델 rebuild (인스턴스 생성 직전에 실행)
-    try:
-        ChatUpstage.model_rebuild()
-    except Exception:
-        pass  # 이미 빌드된 경우 무시
-
-    return ChatUpstage(
-        model=settings.LLM_MODEL,
-        upstage_api_key=settings.UPSTAGE_API_KEY,
-        temperature=settings.LLM_TEMPERATURE,
-    )
\ No newline at end of file
+    return get_upstage_client().llm
\ No newline at end of file
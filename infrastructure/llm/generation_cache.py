@@ -0,0 +1,154 @@
+"""
+LLM 생성 결과 캐시
+
+역할:
+- 대응 방안 생성 결과를 프롬프트 입력 시그니처로 캐시
+  (같은 사기 유형 / 위험도 / 매칭 패턴 / 검색 문서면 같은 조언 → LLM 호출 생략)
+- 시그니처 구성은 agent.nodes.generate.generation_signature 참고
+- 1차: 인메모리 LRU / 2차: SQLite (재시작 후 유지, 워커 간 공유)
+- 두 계층 모두 TTL 적용 (패턴 / 뉴스 갱신 후 오래된 조언이 남지 않도록)
+- hit rate 통계
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from infrastructure.cache import LRUCache, SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationCache:
+    """
+    생성 결과 캐시
+
+    Example:
+        cache = GenerationCache(
+            store=SQLiteCache("data/cache/generations.sqlite3", ttl=86400),
+            ttl=86400,
+        )
+        cache.set(signature, text)
+        text = cache.get(signature)
+    """
+
+    def __init__(
+        self,
+        store: Optional[SQLiteCache] = None,
+        memory_size: int = 512,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            store: 영구 저장소 (None이면 인메모리만 사용)
+            memory_size: 인메모리 LRU 크기
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+        """
+        self.store = store
+        self.memory: LRUCache[str] = LRUCache(
+            maxsize=memory_size, ttl=ttl, name="generation.memory"
+        )
+
+        self._stats_lock = threading.Lock()
+        self.stores = 0
+
+    def get(self, signature: str) -> Optional[str]:
+        """메모리 → 디스크 순으로 조회 (디스크 hit은 메모리로 승격)"""
+        text = self.memory.get(signature)
+        if text is not None:
+            return text
+
+        if self.store is not None:
+            raw = self.store.get(signature)
+            if raw is not None:
+                text = raw.decode("utf-8")
+                self.memory.set(signature, text)
+                return text
+        return None
+
+    def set(self, signature: str, text: str) -> None:
+        """저장"""
+        self.memory.set(signature, text)
+        if self.store is not None:
+            self.store.set(signature, text.encode("utf-8"))
+
+        with self._stats_lock:
+            self.stores += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (메모리 / 디스크)"""
+        memory = self.memory.stats()
+        disk = self.store.stats() if self.store is not None else None
+
+        lookups = memory["hits"] + memory["misses"]
+        hits = memory["hits"] + (disk["hits"] if disk else 0)
+        return {
+            "hits": hits,
+            "misses": lookups - hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "memory": memory,
+            "disk": disk,
+        }
+
+    def close(self) -> None:
+        if self.store is not None:
+            self.store.close()
+
+
+# ========== 전역 생성 캐시 ========== #
+_cache: Optional[GenerationCache] = None
+_lock = threading.Lock()
+
+
+def get_generation_cache() -> Optional[GenerationCache]:
+    """
+    프로세스 전역 생성 캐시
+
+    GENERATION_CACHE_ENABLED가 꺼져 있으면 None
+    """
+    global _cache
+    if _cache is None:
+        from app.config import settings
+
+        if not settings.GENERATION_CACHE_ENABLED:
+            return None
+
+        with _lock:
+            if _cache is None:
+                ttl = settings.GENERATION_CACHE_TTL or None
+                store = None
+                if settings.GENERATION_CACHE_PATH:
+                    try:
+                        store = SQLiteCache(
+                            settings.GENERATION_CACHE_PATH,
+                            max_entries=settings.GENERATION_CACHE_MAX_ENTRIES,
+                            ttl=ttl,
+                            name="generation.disk",
+                        )
+                    except Exception as e:
+                        logger.warning("생성 결과 디스크 캐시 비활성화: %s", e)
+
+                _cache = GenerationCache(
+                    store=store,
+                    memory_size=settings.GENERATION_CACHE_MEMORY_SIZE,
+                    ttl=ttl,
+                )
+    return _cache
+
+
+def get_generation_cache_stats() -> Optional[Dict[str, Any]]:
+    """전역 생성 캐시 통계 (캐시 미사용 / 미생성 시 None)"""
+    cache = _cache
+    return cache.stats() if cache is not None else None
+
+
+def close_generation_cache() -> None:
+    """전역 생성 캐시 정리 (디스크 캐시 연결 종료)"""
+    global _cache
+    with _lock:
+        cache, _cache = _cache, None
+    if cache is not None:
+        cache.close()
@@ -0,0 +1,241 @@
+"""
+프로세스 전역 LLM 클라이언트
+
+역할:
+- 워커 시작 시 모델별 UpstageClient를 한 번만 생성 (ChatUpstage + httpx keep-alive 연결 풀)
+  (모델 라우팅 사용 시 LLM_MODEL / LLM_LIGHT_MODEL 각각 1개, infrastructure.llm.router 참고)
+- 모든 노드가 같은 모델이면 같은 클라이언트 / 연결 풀 재사용 → 요청마다 TLS 핸드셰이크 없음
+- 같은 모델 호출은 같은 제한기(LLMRateLimiter) 공유 → 동시 실행 / 분당 한도 / 429 백오프
+  (모델별 한도가 따로 적용되므로 제한기도 모델별)
+- LLM_HEDGE_ENABLED이면 헤징 정책(RequestHedger)도 모델별 공유 → 지연 분포를 모델 단위로 추적
+- 모델별 지연 / 토큰 사용량 통계
+- 모델별 서킷 브레이커 (llm.<모델명>, infrastructure.circuit_breaker)
+- 모델별 제한기 동시 실행 / 대기열 깊이 게이지 (/metrics)
+- 워커 시작 예열 (SDK import + 클라이언트 생성 + 모델별 연결 1개 미리 맺기)
+- 종료 시 연결 풀 정리
+
+앱 lifespan 밖(스크립트 등)에서는 최초 호출 시 지연 생성.
+httpx 비동기 연결은 이벤트 루프에 묶이므로, 생성 당시 루프가 닫혔으면 다시 생성
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from infrastructure.circuit_breaker import get_circuit_breaker
+from infrastructure.llm.client import (
+    LLMRateLimiter,
+    RequestHedger,
+    UpstageClient,
+    load_chat_model_class,
+)
+from infrastructure.llm.router import routed_models
+from infrastructure.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+_clients: Dict[str, UpstageClient] = {}
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _http_options() -> Dict[str, Any]:
+    """연결 풀 / 타임아웃 설정"""
+    from app.config import settings
+
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(settings.LLM_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT),
+    }
+
+
+def _create_client(model: str) -> UpstageClient:
+    from app.config import settings
+
+    options = _http_options()
+    return UpstageClient(
+        api_key=settings.UPSTAGE_API_KEY,
+        model=model,
+        temperature=settings.LLM_TEMPERATURE,
+        max_tokens=settings.LLM_MAX_TOKENS,
+        timeout=settings.LLM_TIMEOUT,
+        http_client=httpx.Client(**options),
+        http_async_client=httpx.AsyncClient(**options),
+        # 제한기도 이벤트 루프에 묶이므로 클라이언트와 함께 생성
+        limiter=LLMRateLimiter(
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            max_queue=settings.LLM_QUEUE_SIZE,
+            queue_timeout=settings.LLM_QUEUE_TIMEOUT,
+            requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+        ),
+        rate_limit_retries=settings.LLM_RATE_LIMIT_RETRIES,
+        hedger=(
+            RequestHedger(
+                percentile=settings.LLM_HEDGE_PERCENTILE,
+                min_delay=settings.LLM_HEDGE_MIN_DELAY,
+                max_ratio=settings.LLM_HEDGE_MAX_RATIO,
+            )
+            if settings.LLM_HEDGE_ENABLED
+            else None
+        ),
+        # 브레이커는 루프와 무관 → 클라이언트를 다시 만들어도 상태 유지
+        breaker=get_circuit_breaker(f"llm.{model}"),
+    )
+
+
+def _default_model() -> str:
+    from app.config import settings
+
+    return settings.LLM_MODEL
+
+
+def _client_for(model: str) -> UpstageClient:
+    """모델 클라이언트 조회 / 생성 (호출자가 _lock 보유)"""
+    global _client_loop
+
+    loop = _running_loop()
+    if _client_loop is not None and _client_loop is not loop and _client_loop.is_closed():
+        # 닫힌 루프에 묶인 연결 풀은 재사용 불가 → 전부 새로 생성 (이전 풀은 GC)
+        _clients.clear()
+    if not _clients:
+        _client_loop = loop
+
+    client = _clients.get(model)
+    if client is None:
+        client = _create_client(model)
+        _clients[model] = client
+    return client
+
+
+def init_llm_client() -> UpstageClient:
+    """
+    전역 LLM 클라이언트 생성 (라우팅 대상 모델 전부, 이미 있으면 그대로)
+
+    Returns:
+        기본 모델(LLM_MODEL) UpstageClient
+    """
+    with _lock:
+        for model in routed_models():
+            _client_for(model)
+        return _client_for(_default_model())
+
+
+async def warm_llm_client(timeout: float = 5.0) -> int:
+    """
+    전역 LLM 클라이언트 예열 (워커 시작 시 백그라운드)
+
+    - langchain_upstage import / 모델 rebuild는 스레드에서 (이벤트 루프 차단 없음)
+    - 클라이언트 생성은 현재 루프에서 (비동기 연결 풀이 이 루프에 묶임)
+    - 모델별 연결 풀에 연결 1개를 미리 맺음 → 첫 요청의 TCP / TLS 핸드셰이크 제거
+      (응답 코드는 무관, 실패해도 첫 요청에서 다시 연결)
+
+    Args:
+        timeout: 연결 예열 요청 타임아웃 (초)
+
+    Returns:
+        연결을 미리 맺은 클라이언트 수
+    """
+    await asyncio.to_thread(load_chat_model_class)
+    init_llm_client()
+
+    warmed = 0
+    for client in _active_clients():
+        base_url = getattr(client.llm, "upstage_api_base", None)
+        if client.http_async_client is None or not base_url:
+            continue
+        try:
+            await client.http_async_client.head(base_url, timeout=timeout)
+            warmed += 1
+        except httpx.HTTPError as e:
+            logger.debug("LLM 연결 예열 실패 (%s): %s", client.model, e)
+    return warmed
+
+
+def get_upstage_client(model: Optional[str] = None) -> UpstageClient:
+    """
+    모델별 전역 LLM 클라이언트 반환 (없거나 이전 이벤트 루프용이면 생성)
+
+    Args:
+        model: 모델명 (None이면 LLM_MODEL)
+    """
+    model = model or _default_model()
+    client = _clients.get(model)
+    if client is not None and (_client_loop is None or not _client_loop.is_closed()):
+        return client
+    with _lock:
+        return _client_for(model)
+
+
+def _active_clients() -> List[UpstageClient]:
+    return list(_clients.values())
+
+
+def get_llm_model_stats() -> Dict[str, Dict[str, Any]]:
+    """모델별 호출 통계 (지연 / 토큰 사용량)"""
+    return {client.model: client.usage.stats() for client in _active_clients()}
+
+
+def get_llm_limiter_stats() -> Optional[Dict[str, Dict[str, Any]]]:
+    """모델별 LLM 호출 제한기 통계 (클라이언트 미생성 시 None)"""
+    stats = {
+        client.model: client.limiter.stats()
+        for client in _active_clients()
+        if client.limiter is not None
+    }
+    return stats or None
+
+
+def _limiter_gauge(key: str) -> Callable[[], Dict[Tuple[str, ...], float]]:
+    """제한기 통계 항목 → 모델별 게이지 값 (/metrics 수집 시점에 조회)"""
+    return lambda: {
+        (model,): stats[key] for model, stats in (get_llm_limiter_stats() or {}).items()
+    }
+
+
+REGISTRY.gauge_callback(
+    "scam_llm_in_flight", "LLM calls holding a limiter slot", ("model",), _limiter_gauge("in_flight")
+)
+REGISTRY.gauge_callback(
+    "scam_llm_queue_depth", "LLM calls waiting for a limiter slot", ("model",), _limiter_gauge("queue_depth")
+)
+
+
+def get_llm_hedge_stats() -> Optional[Dict[str, Dict[str, Any]]]:
+    """모델별 LLM 헤징 통계 (헤징 미사용 / 클라이언트 미생성 시 None)"""
+    stats = {
+        client.model: client.hedger.stats()
+        for client in _active_clients()
+        if client.hedger is not None
+    }
+    return stats or None
+
+
+async def close_llm_client() -> None:
+    """전역 LLM 클라이언트 전부 종료 (연결 풀 정리)"""
+    global _client_loop
+
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _client_loop = None
+
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("LLM 클라이언트 종료 실패 (%s): %s", client.model, e)
@@ -0,0 +1,55 @@
+"""
+LLM 모델 라우팅
+
+역할:
+- analyze 노드 결과(위험도 레벨 / 점수)로 요청별 모델과 max_tokens 선택
+  - 고위험(높음 / 매우높음 또는 LLM_ROUTING_HEAVY_MIN_SCORE 이상): LLM_MODEL (solar-pro)
+  - 그 외(안전 / 낮음 / 중간): LLM_LIGHT_MODEL (solar-mini, 더 빠르고 저렴)
+- 모델별 클라이언트(연결 풀 / 제한기)는 infrastructure.llm.provider가 관리
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+HEAVY_RISK_LEVELS = ("매우높음", "높음")
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """요청별 모델 선택 결과"""
+
+    model: str
+    max_tokens: int
+    tier: str  # "heavy" / "light"
+
+
+def route_model(risk_level: Optional[str], risk_score: Optional[int]) -> ModelRoute:
+    """
+    위험도로 모델 / max_tokens 선택
+
+    Args:
+        risk_level: 위험도 레벨 (analyze 노드 결과)
+        risk_score: 위험도 점수 (0-100)
+
+    Returns:
+        ModelRoute (LLM_ROUTING_ENABLED가 꺼져 있으면 항상 LLM_MODEL)
+    """
+    from app.config import settings
+
+    heavy = ModelRoute(settings.LLM_MODEL, settings.LLM_MAX_TOKENS, "heavy")
+    if not settings.LLM_ROUTING_ENABLED:
+        return heavy
+
+    if risk_level in HEAVY_RISK_LEVELS or (risk_score or 0) >= settings.LLM_ROUTING_HEAVY_MIN_SCORE:
+        return heavy
+    return ModelRoute(settings.LLM_LIGHT_MODEL, settings.LLM_LIGHT_MAX_TOKENS, "light")
+
+
+def routed_models() -> List[str]:
+    """라우팅 대상 모델 목록 (중복 제거, 기본 모델 먼저)"""
+    from app.config import settings
+
+    models = [settings.LLM_MODEL]
+    if settings.LLM_ROUTING_ENABLED and settings.LLM_LIGHT_MODEL not in models:
+        models.append(settings.LLM_LIGHT_MODEL)
+    return models
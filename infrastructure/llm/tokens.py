@@ -0,0 +1,69 @@
+"""
+로컬 토큰 수 추정
+
+역할:
+- 토크나이저 / 원격 호출 없이 프롬프트 토큰 수를 빠르게 추정 (정규식 1회 순회)
+- 한글 음절 묶음: 약 1.5자당 1토큰, 영문/숫자 묶음: 약 4자당 1토큰, 기호/이모지: 1개당 1토큰
+- 프롬프트 예산 배분 / 호출 제한기 토큰 예약용 (과금 정산용이 아님)
+"""
+
+import math
+import re
+from typing import Optional
+
+_HANGUL_CHARS_PER_TOKEN = 1.5
+_ASCII_CHARS_PER_TOKEN = 4.0
+
+_TOKEN_RE = re.compile(r"([가-힣ㄱ-ㅎㅏ-ㅣ]+)|([A-Za-z0-9]+)|(\S)")
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """
+    텍스트 토큰 수 추정
+
+    Args:
+        text: 텍스트 (None이면 0)
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+
+    tokens = 0
+    for hangul, ascii_word, _ in _TOKEN_RE.findall(text):
+        if hangul:
+            tokens += math.ceil(len(hangul) / _HANGUL_CHARS_PER_TOKEN)
+        elif ascii_word:
+            tokens += math.ceil(len(ascii_word) / _ASCII_CHARS_PER_TOKEN)
+        else:
+            tokens += 1
+    return tokens
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = "…") -> str:
+    """
+    추정 토큰 수가 max_tokens 이하가 되도록 뒤를 잘라냄
+
+    Args:
+        text: 텍스트
+        max_tokens: 최대 토큰 수
+        suffix: 잘린 경우 덧붙일 표시
+
+    Returns:
+        잘린 텍스트 (이미 예산 이내면 그대로)
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+
+    # 글자 수 이분 탐색 (추정 함수는 접두사 길이에 대해 단조 증가)
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + suffix
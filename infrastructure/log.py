@@ -0,0 +1,202 @@
+"""
+구조화 로깅 (JSON, 큐 기반 비동기 출력)
+
+역할:
+- 표준 logging 위에 JSON(또는 텍스트) 한 줄 로그 출력
+  (extra={...}로 넘긴 필드는 JSON 키로 그대로 기록)
+- QueueHandler → QueueListener 스레드에서 stdout 출력
+  → 호출 측(이벤트 루프)은 레코드를 큐에 넣기만 함 (I/O / 직렬화는 리스너 스레드)
+- 요청 컨텍스트(trace_id)를 모든 레코드에 부착
+- 요청 단위 DEBUG 로그 샘플링 (LOG_DEBUG_SAMPLE_RATE 비율의 요청만 상세 로그 출력,
+  샘플링 여부는 요청 시작 시 1회 결정 → 선택된 요청은 단계별 로그가 모두 남음)
+- 레벨: DEBUG 설정이면 DEBUG, 아니면 LOG_LEVEL (app / agent / infrastructure 로거)
+  외부 라이브러리는 WARNING 이상만
+
+Example:
+    logger = logging.getLogger(__name__)
+    logger.info("분석 완료", extra={"risk_score": 85, "processing_time": 1.2})
+"""
+
+import atexit
+import contextlib
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# 설정 대상 로거 (이 프로젝트 패키지)
+APP_LOGGERS = ("app", "agent", "infrastructure")
+
+# LogRecord 기본 속성 (이외의 속성은 extra 필드로 간주)
+_RESERVED = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "trace_id", "sampled"}
+
+# 요청 컨텍스트: (trace_id, DEBUG 로그 샘플링 여부)
+_request: ContextVar[Optional[Tuple[str, bool]]] = ContextVar("log_request", default=None)
+
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON (ts / level / logger / msg / trace_id + extra 필드 + exc)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            payload["trace_id"] = trace_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽는 한 줄 텍스트 (로컬 개발용, extra 필드는 key=value)"""
+
+    def __init__(self) -> None:
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s [%(trace_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not getattr(record, "trace_id", None):
+            record.trace_id = "-"
+        line = super().format(record)
+        fields = " ".join(
+            f"{key}={value}"
+            for key, value in record.__dict__.items()
+            if key not in _RESERVED and not key.startswith("_")
+        )
+        return f"{line} {fields}" if fields else line
+
+
+class RequestContextFilter(logging.Filter):
+    """trace_id 부착 + 샘플링되지 않은 요청의 DEBUG 레코드 제외"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _request.get()
+        if context is None:
+            record.trace_id = None
+            return True
+        record.trace_id, sampled = context
+        return sampled or record.levelno > logging.DEBUG
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    큐에 넣기 전 최소 준비만 수행 (메시지 인자 병합, 예외는 텍스트로)
+
+    기본 QueueHandler.prepare는 호출 측에서 포매터까지 실행하므로
+    JSON 직렬화는 리스너 스레드로 미룸
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(
+    level: Optional[str] = None,
+    fmt: Optional[str] = None,
+) -> None:
+    """
+    로깅 초기화 (프로세스당 1회, 다시 호출하면 무시)
+
+    Args:
+        level: 로그 레벨 (None이면 DEBUG 설정 → DEBUG, 아니면 LOG_LEVEL)
+        fmt: "json" / "text" (None이면 LOG_FORMAT)
+    """
+    global _listener
+    from app.config import settings
+
+    with _lock:
+        if _listener is not None:
+            return
+
+        level = level or ("DEBUG" if settings.DEBUG else settings.LOG_LEVEL)
+        fmt = fmt or settings.LOG_FORMAT
+
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        handler = _RecordQueueHandler(records)
+        handler.addFilter(RequestContextFilter())
+
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(logging.WARNING)
+        for name in APP_LOGGERS:
+            logging.getLogger(name).setLevel(level.upper())
+
+        _listener = QueueListener(records, output, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """리스너 종료 (큐에 남은 레코드는 모두 출력 후 종료)"""
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def new_trace_id() -> str:
+    return uuid.uuid4().hex
+
+
+@contextlib.contextmanager
+def request_context(trace_id: Optional[str] = None) -> Iterator[str]:
+    """
+    요청 로그 컨텍스트 (trace_id 부착 + DEBUG 로그 샘플링 결정)
+
+    Yields:
+        trace_id
+    """
+    from app.config import settings
+
+    trace_id = (trace_id or "")[:64] or new_trace_id()
+    sampled = random.random() < settings.LOG_DEBUG_SAMPLE_RATE
+    token = _request.set((trace_id, sampled))
+    try:
+        yield trace_id
+    finally:
+        try:
+            _request.reset(token)
+        except ValueError:
+            pass
+
+
+def current_trace_id() -> Optional[str]:
+    """현재 요청의 trace_id (요청 밖이면 None)"""
+    context = _request.get()
+    return context[0] if context else None
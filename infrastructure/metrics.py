@@ -0,0 +1,398 @@
+"""
+지연 / 오류 메트릭 (Prometheus 텍스트 형식)
+
+역할:
+- 노드별 / 데이터 소스별(RAG / BM25 / 패턴 / 웹) / LLM 모델별
+  실행 시간(wall time), 대기 시간(queue time), 결과(ok / timeout / error ...) 집계
+  → 부하 중 p99를 끌어올리는 단계 추적
+- 대기 시간: 공유 executor 작업 대기 + LLM 제한기 슬롯 / 한도 대기의 누적
+  (구간(span)은 contextvar로 중첩, 끝나면 대기 시간 / 오류를 상위 구간에 합산)
+- 레이블별 카운터 / 히스토그램 + 수집 시점 콜백 게이지 (서킷 상태, LLM 대기열 깊이 등)
+- GET /metrics 응답 (text/plain; version=0.0.4)
+- 외부 의존성 없음 (prometheus_client 미사용), 스레드 안전
+"""
+
+import contextlib
+import logging
+import math
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 지연 히스토그램 버킷 (초) - 로컬 조회(ms) ~ LLM 생성(수십 초)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0,
+)
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_CANCELLED = "cancelled"
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """메트릭 공통 (이름 / 설명 / 레이블, 레이블 값 조합별 시계열)"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labelvalues: Sequence[Any]) -> LabelValues:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name}: 레이블 {len(self.labelnames)}개 필요 ({len(labelvalues)}개 전달)"
+            )
+        return tuple(str(value) for value in labelvalues)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """# HELP / # TYPE + 시계열 행"""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._samples(),
+        ]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: Any, amount: float = 1.0) -> None:
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labelvalues: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labelvalues), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램 (누적 버킷 / 합계 / 개수)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 조합 → [버킷별 개수..., +Inf 개수, 합계]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labelvalues: Any) -> None:
+        key = self._key(labelvalues)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def count(self, *labelvalues: Any) -> int:
+        with self._lock:
+            series = self._values.get(self._key(labelvalues))
+            return int(sum(series[:-1])) if series else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._values.items())
+
+        lines: List[str] = []
+        for key, series in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), series[:-1]):
+                cumulative += count
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class CallbackGauge(_Metric):
+    """수집 시점에 콜백으로 값을 읽는 게이지 (기존 통계 객체 재사용)"""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[LabelValues, float]],
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _samples(self) -> List[str]:
+        try:
+            values = self.callback()
+        except Exception as e:
+            logger.warning("메트릭 수집 실패 (%s): %s", self.name, e)
+            return []
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리 (이름 중복 등록 시 기존 메트릭 반환)"""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> Any:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[LabelValues, float]],
+    ) -> CallbackGauge:
+        return self.register(CallbackGauge(name, documentation, labelnames, callback))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+# ========== 구간(span) - 대기 시간 / 오류 누적 ========== #
+class Span:
+    """측정 구간 (하위 구간 / executor / LLM 제한기 대기 시간과 오류를 누적)"""
+
+    __slots__ = ("queue_wait", "errors")
+
+    def __init__(self) -> None:
+        self.queue_wait = 0.0
+        self.errors: List[str] = []
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("metrics_span", default=None)
+
+
+@contextlib.contextmanager
+def span() -> Iterator[Span]:
+    """
+    측정 구간 시작
+
+    asyncio 태스크는 시작 시점 컨텍스트를 복사하므로 gather / 헤지 호출의 대기도
+    같은 구간에 누적. 끝나면 대기 시간 / 오류를 상위 구간에 합산
+    """
+    parent = _current_span.get()
+    current = Span()
+    token = _current_span.set(current)
+    try:
+        yield current
+    finally:
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # 다른 컨텍스트에서 종료된 비동기 제너레이터 (스트리밍)
+            pass
+        if parent is not None:
+            parent.queue_wait += current.queue_wait
+            parent.errors.extend(current.errors)
+
+
+def note_queue_wait(seconds: float) -> None:
+    """현재 구간에 대기 시간 기록 (구간 밖이면 무시)"""
+    current = _current_span.get()
+    if current is not None and seconds > 0:
+        current.queue_wait += seconds
+
+
+def note_error(message: str) -> None:
+    """현재 구간에 (처리된) 오류 기록 - 폴백으로 넘어간 타임아웃 / 실패 등"""
+    current = _current_span.get()
+    if current is not None:
+        current.errors.append(message)
+
+
+class _Call:
+    """track() 구간 결과 (outcome은 호출 측에서 바꿀 수 있음)"""
+
+    __slots__ = ("outcome", "span")
+
+    def __init__(self, current: Span) -> None:
+        self.outcome = OUTCOME_OK
+        self.span = current
+
+    def fail(self, outcome: str, message: str) -> None:
+        """예외 없이 폴백한 실패 기록 (결과 + 오류 메시지)"""
+        self.outcome = outcome
+        self.span.errors.append(message)
+
+
+class StageMetrics:
+    """
+    단계 메트릭 묶음 (실행 시간 / 대기 시간 히스토그램 + 결과별 호출 카운터)
+
+    Example:
+        with SOURCE_METRICS.track("rag") as call:
+            ...
+            call.fail(OUTCOME_TIMEOUT, "RAG 검색 타임아웃")
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        subject: str,
+        labelnames: Sequence[str],
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        self.labelnames = tuple(labelnames)
+        self.duration = registry.histogram(
+            f"{prefix}_duration_seconds", f"{subject} wall time (seconds)", self.labelnames
+        )
+        self.queue = registry.histogram(
+            f"{prefix}_queue_seconds",
+            f"{subject} time spent waiting for executor workers / LLM slots (seconds)",
+            self.labelnames,
+        )
+        self.calls = registry.counter(
+            f"{prefix}_calls_total", f"{subject} calls by outcome", self.labelnames + ("outcome",)
+        )
+
+    def observe(self, *labelvalues: Any, duration: float, queue_wait: float, outcome: str) -> None:
+        self.duration.observe(duration, *labelvalues)
+        self.queue.observe(queue_wait, *labelvalues)
+        self.calls.inc(*labelvalues, outcome)
+
+    @contextlib.contextmanager
+    def track(
+        self,
+        *labelvalues: Any,
+        outcomes: Sequence[Tuple[type, str]] = (),
+    ) -> Iterator[_Call]:
+        """
+        구간 측정
+
+        Args:
+            *labelvalues: 레이블 값
+            outcomes: (예외 타입, 결과 이름) - 예외로 끝나면 처음 맞는 결과로 기록
+                      (그 외 Exception은 error, 취소 / 조기 종료는 cancelled)
+        """
+        start = time.perf_counter()
+        with span() as current:
+            call = _Call(current)
+            try:
+                yield call
+            except Exception as e:
+                call.outcome = next(
+                    (name for kind, name in outcomes if isinstance(e, kind)), OUTCOME_ERROR
+                )
+                current.errors.append(f"{'/'.join(map(str, labelvalues))}: {call.outcome}: {e}"[:200])
+                raise
+            except BaseException:
+                call.outcome = OUTCOME_CANCELLED
+                raise
+            finally:
+                self.observe(
+                    *labelvalues,
+                    duration=time.perf_counter() - start,
+                    queue_wait=current.queue_wait,
+                    outcome=call.outcome,
+                )
+
+
+# ========== 서비스 메트릭 ========== #
+NODE_METRICS = StageMetrics("scam_graph_node", "LangGraph node", ("node",))
+SOURCE_METRICS = StageMetrics("scam_source", "Retrieval data source", ("source",))
+LLM_METRICS = StageMetrics("scam_llm", "Upstage LLM", ("model", "mode"))
+
+LLM_TOKENS = REGISTRY.counter(
+    "scam_llm_tokens_total", "LLM tokens reported by the API", ("model", "direction")
+)
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "scam_http_request_duration_seconds",
+    "HTTP request wall time until response headers (seconds)",
+    ("method", "route", "status"),
+)
+
+
+def render_metrics() -> str:
+    """등록된 모든 메트릭 (Prometheus 텍스트 형식)"""
+    return REGISTRY.render()
@@ -0,0 +1,22 @@
+"""
+infrastructure.news 패키지
+
+로컬 사기 뉴스 색인 + 백그라운드 갱신
+"""
+
+from infrastructure.news.store import NewsSnapshot, NewsStore
+from infrastructure.news.refresher import (
+    DEFAULT_NEWS_KEYWORDS,
+    NewsRefresher,
+    get_news_refresher,
+    get_news_store,
+)
+
+__all__ = [
+    "DEFAULT_NEWS_KEYWORDS",
+    "NewsRefresher",
+    "NewsSnapshot",
+    "NewsStore",
+    "get_news_refresher",
+    "get_news_store",
+]
@@ -0,0 +1,180 @@
+"""
+뉴스 색인 백그라운드 갱신기
+
+역할:
+- 주기적으로 네이버 뉴스를 크롤링하여 NewsStore 갱신
+- 크롤링(HTTP + BeautifulSoup)은 갱신기 전용 스레드 1개에서 실행 → 요청 경로와 분리
+  (공유 executor(BLOCKING_MAX_WORKERS)를 쓰지 않으므로 갱신 중에도 요청의 패턴 / RAG / BM25 작업 스레드를 차지하지 않음)
+- 요청 처리 시에는 NewsStore 조회만 수행
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from infrastructure.news.store import NewsStore
+
+logger = logging.getLogger(__name__)
+
+# retrieve 노드가 메시지에서 도출하는 키워드 + 일반 사기 키워드
+DEFAULT_NEWS_KEYWORDS = [
+    "보이스피싱",
+    "대출사기",
+    "투자사기",
+    "금융사기",
+    "메신저피싱",
+    "스미싱",
+]
+
+
+class NewsRefresher:
+    """
+    주기적 뉴스 크롤링 작업
+
+    Example:
+        refresher = NewsRefresher(store, interval=1800)
+        refresher.start()   # 이벤트 루프 안에서 호출
+        ...
+        await refresher.stop()
+    """
+
+    def __init__(
+        self,
+        store: NewsStore,
+        keywords: Optional[List[str]] = None,
+        interval: float = 1800.0,
+        max_per_keyword: int = 10,
+    ) -> None:
+        self.store = store
+        self.keywords = keywords or list(DEFAULT_NEWS_KEYWORDS)
+        self.interval = interval
+        self.max_per_keyword = max_per_keyword
+
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.refresh_count = 0
+        self.last_error: Optional[str] = None
+
+    def refresh_once(self) -> int:
+        """
+        전체 키워드 크롤링 후 색인 교체 (블로킹)
+
+        Returns:
+            수집된 뉴스 수
+        """
+        from scripts.web_crawler import ScamNewsCrawler
+
+        crawler = ScamNewsCrawler()
+        items: Dict[str, List[Dict[str, Any]]] = {}
+
+        for idx, keyword in enumerate(self.keywords):
+            if idx:
+                time.sleep(1)  # 키워드 간 요청 간격
+            news = crawler.crawl_naver_news(keyword, max_count=self.max_per_keyword)
+            items[keyword] = crawler.dedup_by_link(news)
+
+        self.refresh_count += 1
+
+        total = sum(len(v) for v in items.values())
+        if total == 0:
+            self.last_error = "수집된 뉴스 없음 (기존 색인 유지)"
+            return 0
+
+        self.store.replace(items)
+        self.last_error = None
+        return total
+
+    async def _run(self) -> None:
+        # 저장된 색인이 충분히 최신이면 첫 갱신을 미룸
+        age = self.store.age_seconds()
+        if age is not None and age < self.interval:
+            await asyncio.sleep(self.interval - age)
+
+        while True:
+            try:
+                total = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self.refresh_once
+                )
+                logger.info("뉴스 색인 갱신: %s개", total)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("뉴스 색인 갱신 실패: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """백그라운드 갱신 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="news-refresher"
+                )
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="news-refresher"
+            )
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 종료"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        # 진행 중인 크롤링은 기다리지 않음 (HTTP 타임아웃 후 스레드 종료)
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.store.stats(),
+            "running": self.running,
+            "interval": self.interval,
+            "refresh_count": self.refresh_count,
+            "last_error": self.last_error,
+        }
+
+
+# ========== 전역 인스턴스 ========== #
+_store: Optional[NewsStore] = None
+_refresher: Optional[NewsRefresher] = None
+_lock = threading.Lock()
+
+
+def get_news_store() -> NewsStore:
+    """전역 뉴스 저장소 (최초 호출 시 디스크에서 로드)"""
+    global _store
+    if _store is None:
+        with _lock:
+            if _store is None:
+                from app.config import settings
+
+                store = NewsStore(settings.NEWS_STORE_PATH)
+                store.load()
+                _store = store
+    return _store
+
+
+def get_news_refresher() -> NewsRefresher:
+    """전역 뉴스 갱신기"""
+    global _refresher
+    if _refresher is None:
+        from app.config import settings
+
+        _refresher = NewsRefresher(
+            get_news_store(),
+            interval=settings.NEWS_REFRESH_INTERVAL,
+            max_per_keyword=settings.NEWS_MAX_PER_KEYWORD,
+        )
+    return _refresher
@@ -0,0 +1,162 @@
+"""
+로컬 사기 뉴스 인덱스
+
+역할:
+- 백그라운드 크롤링 결과를 키워드별로 색인해 메모리에 보관
+- 요청 시에는 dict 조회만 수행 (외부 HTTP 없음)
+- JSON 파일로 영구 저장 → 재시작 직후에도 바로 조회 가능
+
+스냅샷은 통째로 교체되므로 조회 중인 요청은 갱신 중간 상태를 보지 않음
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = Path(__file__).resolve().parents[2]
+
+
+def _to_documents(news_list: List[Dict[str, Any]]) -> List["Document"]:
+    from scripts.web_crawler import ScamNewsCrawler
+
+    return ScamNewsCrawler().convert_to_documents(news_list)
+
+
+@dataclass(frozen=True)
+class NewsSnapshot:
+    """키워드별 뉴스 색인 (불변)"""
+
+    refreshed_at: Optional[str] = None
+    items: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    documents: Dict[str, List["Document"]] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(len(docs) for docs in self.documents.values())
+
+
+class NewsStore:
+    """
+    로컬 뉴스 저장소
+
+    Example:
+        store = NewsStore("data/cache/news_index.json")
+        store.load()
+        docs = store.lookup(["보이스피싱"], max_count=3)
+    """
+
+    def __init__(self, path: Optional[str | Path] = None) -> None:
+        if path:
+            path = Path(path)
+            self.path: Optional[Path] = path if path.is_absolute() else _BASE_DIR / path
+        else:
+            self.path = None
+
+        self._snapshot = NewsSnapshot()
+        self._write_lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> NewsSnapshot:
+        return self._snapshot
+
+    def lookup(self, keywords: List[str], max_count: int = 3) -> List["Document"]:
+        """
+        키워드별 최신 뉴스 조회 (메모리 조회만 수행)
+
+        Args:
+            keywords: 검색 키워드 (앞쪽 우선)
+            max_count: 최대 뉴스 개수
+
+        Returns:
+            뉴스 Document 리스트
+        """
+        snapshot = self._snapshot
+        results: List["Document"] = []
+        for keyword in keywords:
+            results.extend(snapshot.documents.get(keyword, ())[:max_count])
+            if len(results) >= max_count:
+                break
+        return results[:max_count]
+
+    def replace(self, items: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        키워드별 뉴스 교체 (새로 수집되지 않은 키워드는 기존 결과 유지)
+
+        Args:
+            items: {키워드: 뉴스 dict 리스트 (최신순)}
+        """
+        with self._write_lock:
+            merged = dict(self._snapshot.items)
+            merged.update({k: v for k, v in items.items() if v})
+
+            self._snapshot = NewsSnapshot(
+                refreshed_at=datetime.now().isoformat(),
+                items=merged,
+                documents={k: _to_documents(v) for k, v in merged.items()},
+            )
+            self._save_locked()
+
+    def load(self) -> bool:
+        """디스크에서 색인 로드"""
+        if self.path is None or not self.path.exists():
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            items = data.get("items") or {}
+            self._snapshot = NewsSnapshot(
+                refreshed_at=data.get("refreshed_at"),
+                items=items,
+                documents={k: _to_documents(v) for k, v in items.items()},
+            )
+            logger.info("뉴스 색인 로드: %s개 (%s)", self._snapshot.total, self._snapshot.refreshed_at)
+            return True
+        except Exception as e:
+            logger.warning("뉴스 색인 로드 실패: %s", e)
+            return False
+
+    def _save_locked(self) -> None:
+        """임시 파일에 쓰고 rename (원자적 저장)"""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"refreshed_at": self._snapshot.refreshed_at, "items": self._snapshot.items},
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning("뉴스 색인 저장 실패: %s", e)
+
+    def age_seconds(self) -> Optional[float]:
+        """마지막 갱신 후 경과 시간 (초)"""
+        refreshed_at = self._snapshot.refreshed_at
+        if not refreshed_at:
+            return None
+        try:
+            return (datetime.now() - datetime.fromisoformat(refreshed_at)).total_seconds()
+        except ValueError:
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "refreshed_at": snapshot.refreshed_at,
+            "keywords": {k: len(v) for k, v in snapshot.documents.items()},
+            "total": snapshot.total,
+        }
@@ -0,0 +1,27 @@
+"""
+infrastructure.patterns 패키지
+
+사기 패턴 매칭 엔진
+"""
+
+from infrastructure.patterns.matcher import (
+    AhoCorasickMatcher,
+    PatternHit,
+    PatternIndex,
+    PatternMatchResult,
+)
+from infrastructure.patterns.registry import (
+    PatternRegistry,
+    PatternSnapshot,
+    get_pattern_registry,
+)
+
+__all__ = [
+    "AhoCorasickMatcher",
+    "PatternHit",
+    "PatternIndex",
+    "PatternMatchResult",
+    "PatternRegistry",
+    "PatternSnapshot",
+    "get_pattern_registry",
+]
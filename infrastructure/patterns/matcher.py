@@ -0,0 +1,230 @@
+"""
+사기 패턴 다중 매칭 엔진 (Aho-Corasick)
+
+역할:
+- scam_patterns.json의 모든 패턴/발신자 패턴/키워드/공식 연락처를
+  하나의 오토마톤으로 한 번만 컴파일
+- 메시지를 한 번만 훑어서 모든 매칭(패턴 ID + 위치)을 찾음
+- 패턴 수가 수천 개로 늘어나도 탐색 비용은 메시지 길이에 비례
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class AhoCorasickMatcher(Generic[T]):
+    """
+    Aho-Corasick 다중 문자열 매칭기
+
+    Example:
+        matcher = AhoCorasickMatcher()
+        matcher.add("안전계좌", "scam_002")
+        matcher.build()
+
+        for start, end, payload in matcher.iter_matches("안전계좌로 이체"):
+            ...
+    """
+
+    def __init__(self) -> None:
+        # 상태별 전이 테이블 / 실패 링크 / 출력 (키워드 길이, payload)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, T]]] = [[]]
+        self._built = False
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, keyword: str, payload: T) -> None:
+        """키워드 등록 (build 전에 호출)"""
+        if self._built:
+            raise RuntimeError("build() 이후에는 키워드를 추가할 수 없습니다")
+        if not keyword:
+            return
+
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+
+        self._output[state].append((len(keyword), payload))
+        self._size += 1
+
+    def build(self) -> "AhoCorasickMatcher[T]":
+        """실패 링크 계산 (BFS)"""
+        queue: deque = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+
+                # 접미사 상태의 출력 병합
+                self._output[nxt].extend(self._output[self._fail[nxt]])
+
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, T]]:
+        """
+        텍스트 한 번 순회로 모든 매칭 반환
+
+        Yields:
+            (시작 위치, 끝 위치, payload) - 겹치는 매칭 포함
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        state = 0
+        for idx, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for length, payload in output[state]:
+                yield idx - length + 1, idx + 1, payload
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    """단일 매칭 결과"""
+
+    pattern_id: str  # scam id (예: scam_001) / keyword:<level> / contact:<org>
+    kind: str  # pattern | sender | keyword | contact | contact_phone
+    keyword: str  # 원본 패턴 문자열
+    start: int
+    end: int
+    source: str  # query | sender
+
+
+@dataclass
+class PatternMatchResult:
+    """메시지 1건에 대한 전체 매칭 결과"""
+
+    hits: List[PatternHit] = field(default_factory=list)
+
+    def by_kind(self, *kinds: str) -> List[PatternHit]:
+        return [hit for hit in self.hits if hit.kind in kinds]
+
+
+def _digits_only(value: Optional[str]) -> str:
+    return "".join(ch for ch in (value or "") if ch.isdigit())
+
+
+class PatternIndex:
+    """
+    scam_patterns.json을 컴파일한 패턴 인덱스
+
+    - 텍스트 오토마톤: patterns / sender_patterns / keywords / 기관명 (소문자 기준)
+    - 숫자 오토마톤: 공식 연락처 번호 (숫자만 추출한 텍스트 기준)
+
+    매칭 위치(start, end)는 strip().lower() 처리된 텍스트 기준
+    (숫자 매칭은 숫자만 추출한 텍스트 기준)
+    """
+
+    def __init__(self, dataset: Dict[str, Any]) -> None:
+        self.dataset = dataset or {}
+        self.scams: Dict[str, Dict[str, Any]] = {}
+        self.contacts: Dict[str, str] = dict(
+            (self.dataset.get("legitimate_contacts") or {}).items()
+        )
+
+        self._text_matcher: AhoCorasickMatcher[Tuple[str, str, str]] = (
+            AhoCorasickMatcher()
+        )
+        self._digit_matcher: AhoCorasickMatcher[Tuple[str, str, str]] = (
+            AhoCorasickMatcher()
+        )
+
+        for idx, scam in enumerate(self.dataset.get("financial_scams", [])):
+            scam_id = scam.get("id") or f"scam_{idx:03d}"
+            self.scams[scam_id] = scam
+
+            for p in scam.get("patterns", []):
+                if p:
+                    self._text_matcher.add(p.lower(), (scam_id, "pattern", p))
+            for p in scam.get("sender_patterns", []):
+                if p:
+                    self._text_matcher.add(p.lower(), (scam_id, "sender", p))
+
+        for level, keywords in (self.dataset.get("keywords") or {}).items():
+            for k in keywords:
+                if k:
+                    self._text_matcher.add(k.lower(), (f"keyword:{level}", "keyword", k))
+
+        for org, phone in self.contacts.items():
+            if org:
+                self._text_matcher.add(org.lower(), (f"contact:{org}", "contact", org))
+            norm_phone = _digits_only(phone)
+            if norm_phone:
+                self._digit_matcher.add(
+                    norm_phone, (f"contact:{org}", "contact_phone", phone)
+                )
+
+        self._text_matcher.build()
+        self._digit_matcher.build()
+
+    @property
+    def size(self) -> int:
+        """등록된 전체 패턴 수"""
+        return len(self._text_matcher) + len(self._digit_matcher)
+
+    def match(self, query: str, sender: Optional[str] = None) -> PatternMatchResult:
+        """
+        메시지/발신자에서 모든 패턴 매칭
+
+        Args:
+            query: 메시지
+            sender: 발신자 정보
+
+        Returns:
+            PatternMatchResult
+        """
+        result = PatternMatchResult()
+
+        query_lower = (query or "").strip().lower()
+        sender_lower = (sender or "").strip().lower()
+
+        for start, end, (pid, kind, kw) in self._text_matcher.iter_matches(query_lower):
+            result.hits.append(PatternHit(pid, kind, kw, start, end, "query"))
+
+        # 발신자에서는 발신자 패턴만 유효
+        if sender_lower:
+            for start, end, (pid, kind, kw) in self._text_matcher.iter_matches(
+                sender_lower
+            ):
+                if kind == "sender":
+                    result.hits.append(PatternHit(pid, kind, kw, start, end, "sender"))
+
+        for source, digits in (
+            ("query", _digits_only(query)),
+            ("sender", _digits_only(sender)),
+        ):
+            if not digits:
+                continue
+            for start, end, (pid, kind, kw) in self._digit_matcher.iter_matches(digits):
+                result.hits.append(PatternHit(pid, kind, kw, start, end, source))
+
+        return result
@@ -0,0 +1,214 @@
+"""
+사기 패턴 레지스트리 (핫 리로드)
+
+역할:
+- scam_patterns.json 변경 감지 (mtime + sha256)
+- 새 PatternIndex를 백그라운드에서 컴파일한 뒤 원자적으로 교체
+- 교체 시마다 버전 증가 → 버전이 포함된 캐시 키로 이전 결과 무효화
+
+처리 중인 요청은 시작 시점에 받은 스냅샷을 끝까지 사용하므로
+반쯤 로드된 인덱스를 보는 일이 없음
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from infrastructure.patterns.matcher import PatternIndex
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class PatternSnapshot:
+    """컴파일된 패턴 인덱스 스냅샷 (불변)"""
+
+    version: int
+    digest: str
+    mtime: float
+    loaded_at: str
+    index: PatternIndex
+
+    @property
+    def dataset(self) -> Dict[str, Any]:
+        return self.index.dataset
+
+
+class PatternRegistry:
+    """
+    패턴 인덱스 레지스트리
+
+    Example:
+        registry = PatternRegistry("data/chroma_scam_defense/scam_patterns.json")
+        registry.start_watcher(interval=5.0)
+
+        snapshot = registry.current()
+        result = snapshot.index.match(message, sender)
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        path = Path(path)
+        self.path = path if path.is_absolute() else _BASE_DIR / path
+
+        self._snapshot: Optional[PatternSnapshot] = None
+        self._reload_lock = threading.Lock()
+        self._stat_key: Optional[tuple] = None
+        self._version = 0
+
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+
+    # ========== 조회 ========== #
+    def current(self) -> PatternSnapshot:
+        """현재 스냅샷 반환 (최초 호출 시 동기 로드)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.reload(force=True)
+            snapshot = self._snapshot
+        return snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version if self._snapshot else 0
+
+    # ========== 리로드 ========== #
+    def _stat(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        패턴 파일 다시 로드
+
+        파일 내용(sha256)이 바뀐 경우에만 새 인덱스를 컴파일하고 교체.
+        로드 실패(파일 없음 포함) 시 기존 스냅샷 유지 (스냅샷이 아직 없을 때만 빈 인덱스).
+
+        Args:
+            force: 파일 변경(mtime/size) 여부와 무관하게 다시 읽기
+
+        Returns:
+            새 스냅샷으로 교체되었는지 여부
+        """
+        with self._reload_lock:
+            stat_key = self._stat()
+            if not force and self._snapshot is not None and stat_key == self._stat_key:
+                return False
+
+            try:
+                # 파일이 없어도 다른 로드 오류와 같이 처리 (배포 중 잠시 사라져도 탐지 유지)
+                if stat_key is None:
+                    raise FileNotFoundError(f"패턴 파일 없음: {self.path}")
+                raw = self.path.read_bytes()
+                dataset: Dict[str, Any] = json.loads(raw.decode("utf-8"))
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("패턴 로드 실패 (기존 인덱스 유지): %s", e)
+                if self._snapshot is None:
+                    self._swap({}, "", 0.0)
+                self._stat_key = stat_key
+                return False
+
+            self._stat_key = stat_key
+            self.last_error = None
+            digest = hashlib.sha256(raw).hexdigest()
+            if self._snapshot is not None and digest == self._snapshot.digest:
+                return False
+
+            self._swap(dataset, digest, stat_key[0] / 1e9)
+            return True
+
+    def _swap(self, dataset: Dict[str, Any], digest: str, mtime: float) -> None:
+        """새 인덱스 컴파일 후 참조 교체 (원자적)"""
+        index = PatternIndex(dataset)
+
+        self._version += 1
+        self._snapshot = PatternSnapshot(
+            version=self._version,
+            digest=digest,
+            mtime=mtime,
+            loaded_at=datetime.now().isoformat(),
+            index=index,
+        )
+        self.reload_count += 1
+        logger.info(
+            "패턴 인덱스 v%s: %s개 유형, %s개 패턴", self._version, len(index.scams), index.size
+        )
+
+    # ========== 파일 감시 ========== #
+    def start_watcher(self, interval: float = 5.0) -> None:
+        """파일 변경 감시 스레드 시작 (interval <= 0 이면 비활성화)"""
+        if interval <= 0 or (self._watcher and self._watcher.is_alive()):
+            return
+
+        self.current()
+        self._stop_event.clear()
+        self._watcher = threading.Thread(
+            target=self._watch_loop,
+            args=(interval,),
+            name="pattern-registry-watcher",
+            daemon=True,
+        )
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        """파일 변경 감시 스레드 종료"""
+        self._stop_event.set()
+        if self._watcher:
+            self._watcher.join(timeout=1.0)
+        self._watcher = None
+
+    def _watch_loop(self, interval: float) -> None:
+        while not self._stop_event.wait(interval):
+            if self._stat() == self._stat_key:
+                continue
+            try:
+                self.reload()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("패턴 리로드 실패: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """레지스트리 상태"""
+        snapshot = self._snapshot
+        return {
+            "path": str(self.path),
+            "version": snapshot.version if snapshot else 0,
+            "digest": snapshot.digest[:12] if snapshot else None,
+            "loaded_at": snapshot.loaded_at if snapshot else None,
+            "scam_types": len(snapshot.index.scams) if snapshot else 0,
+            "patterns": snapshot.index.size if snapshot else 0,
+            "reload_count": self.reload_count,
+            "watching": bool(self._watcher and self._watcher.is_alive()),
+            "last_error": self.last_error,
+        }
+
+
+# 전역 레지스트리
+_registry: Optional[PatternRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_pattern_registry() -> PatternRegistry:
+    """전역 패턴 레지스트리 싱글톤"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from app.config import settings
+
+                _registry = PatternRegistry(settings.SCAM_PATTERNS_FILE)
+    return _registry
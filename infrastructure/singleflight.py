@@ -0,0 +1,111 @@
+"""
+동시 요청 병합 (single-flight)
+
+역할:
+- 같은 키로 동시에 들어온 요청은 실행 중인 작업 1개를 함께 기다림
+  (스미싱 대량 발송 시 같은 메시지 수백 건 → 그래프 / LLM 실행 1회)
+- 작업은 별도 태스크로 실행 → 먼저 온 요청이 끊겨도 나머지 요청은 결과를 받음
+- 완료 즉시 키 제거 (결과 캐시가 아님, 이후 요청은 새로 실행)
+- 실행 / 병합 / 오류 카운터
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    키 단위 동시 실행 병합기 (이벤트 루프 내에서 사용)
+
+    Example:
+        flight = SingleFlight(name="detect")
+        result = await flight.run(key, lambda: graph.ainvoke(state))
+    """
+
+    def __init__(self, name: str = "singleflight") -> None:
+        """
+        초기화
+
+        Args:
+            name: 이름 (통계 표시용)
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_waiters = 0
+        self._waiters: Dict[Hashable, int] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        같은 키의 실행 중 작업이 있으면 그 결과를 기다리고, 없으면 새로 실행
+
+        Args:
+            key: 병합 키
+            func: 실행할 코루틴 함수 (인자 없음)
+
+        Returns:
+            작업 결과 (예외도 모든 대기 요청에 그대로 전달)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            self._waiters[key] = 1
+            self.executions += 1
+            task.add_done_callback(lambda t, key=key: self._finish(key, t))
+        else:
+            self.coalesced += 1
+            self._waiters[key] += 1
+        self.max_waiters = max(self.max_waiters, self._waiters[key])
+
+        # 대기 요청이 취소돼도 공유 작업은 계속 실행
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 통계"""
+        requests = self.executions + self.coalesced
+        return {
+            "name": self.name,
+            "in_flight": len(self._inflight),
+            "requests": requests,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / requests, 4) if requests else 0.0,
+            "max_waiters": self.max_waiters,
+            "errors": self.errors,
+        }
+
+
+# ========== 이름 기반 레지스트리 ========== #
+_FLIGHTS: Dict[str, SingleFlight] = {}
+_FLIGHTS_LOCK = threading.Lock()
+
+
+def get_singleflight(name: str) -> SingleFlight:
+    """이름으로 공유 병합기 조회 (없으면 생성)"""
+    flight = _FLIGHTS.get(name)
+    if flight is None:
+        with _FLIGHTS_LOCK:
+            flight = _FLIGHTS.get(name)
+            if flight is None:
+                flight = SingleFlight(name=name)
+                _FLIGHTS[name] = flight
+    return flight
+
+
+def get_singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    """등록된 모든 병합기 통계"""
+    return {name: flight.stats() for name, flight in list(_FLIGHTS.items())}
@@ -2,14 +2,73 @@
 infrastructure.vector_store 패키지
 
 벡터 스토어 관련 모듈
+
+하위 모듈은 이름에 처음 접근할 때 import (PEP 562)
+→ lexical_index / embedding_cache만 쓰는 경로는 chromadb를 로드하지 않음
 """
 
-from infrastructure.vector_store.scam_repository import (
-    ScamPatternRepository,
-    FastScamRepository,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from infrastructure.vector_store.scam_repository import (
+        ScamPatternRepository,
+        FastScamRepository,
+    )
+    from infrastructure.vector_store.embedding_cache import (
+        CachedEmbeddings,
+        GuardedEmbeddings,
+        get_embedding_cache_stats,
+        get_embeddings,
+    )
+    from infrastructure.vector_store.lexical_index import (
+        BM25Index,
+        reciprocal_rank_fusion,
+        tokenize_ko,
+    )
+    from infrastructure.vector_store.mmap_index import (
+        MmapScamRepository,
+        MmapVectorIndex,
+        export_collection,
+    )
+    from infrastructure.vector_store.provider import (
+        close_vector_repository,
+        get_vector_repository,
+        init_vector_repository,
+        is_vector_repository_ready,
+    )
+
+# 공개 이름 → 정의 모듈
+_EXPORTS = {
+    "ScamPatternRepository": "infrastructure.vector_store.scam_repository",
+    "FastScamRepository": "infrastructure.vector_store.scam_repository",
+    "CachedEmbeddings": "infrastructure.vector_store.embedding_cache",
+    "GuardedEmbeddings": "infrastructure.vector_store.embedding_cache",
+    "get_embedding_cache_stats": "infrastructure.vector_store.embedding_cache",
+    "get_embeddings": "infrastructure.vector_store.embedding_cache",
+    "BM25Index": "infrastructure.vector_store.lexical_index",
+    "reciprocal_rank_fusion": "infrastructure.vector_store.lexical_index",
+    "tokenize_ko": "infrastructure.vector_store.lexical_index",
+    "MmapScamRepository": "infrastructure.vector_store.mmap_index",
+    "MmapVectorIndex": "infrastructure.vector_store.mmap_index",
+    "export_collection": "infrastructure.vector_store.mmap_index",
+    "close_vector_repository": "infrastructure.vector_store.provider",
+    "get_vector_repository": "infrastructure.vector_store.provider",
+    "init_vector_repository": "infrastructure.vector_store.provider",
+    "is_vector_repository_ready": "infrastructure.vector_store.provider",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "ScamPatternRepository",
-    "FastScamRepository",
-]
\ No newline at end of file
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,328 @@
+"""
+쿼리 임베딩 캐시
+
+역할:
+- UpstageEmbeddings 앞단 캐시 (같은 SMS 템플릿은 한 번만 원격 임베딩)
+- 키: sha256(EMBEDDING_MODEL + 용도(query/passage) + 정규화된 텍스트)
+  (Upstage는 쿼리/문서 임베딩 모델이 달라 같은 텍스트도 벡터가 다름)
+- 1차: 인메모리 LRU / 2차: SQLite (재시작 후 유지, 워커 간 공유)
+- hit rate 통계
+- 원격 임베딩은 서킷 브레이커로 보호 (Upstage 장애 시 즉시 CircuitOpenError → BM25 검색만 사용,
+  캐시 hit은 브레이커와 무관하게 계속 동작)
+- 원격 호출 타임아웃은 EMBEDDING_TIMEOUT (기본 RAG_TIMEOUT), SDK 재시도 없음
+  → 느린 Upstage 응답도 타임아웃 실패로 브레이커에 기록됨
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from infrastructure.cache import LRUCache, SQLiteCache
+from infrastructure.circuit_breaker import CircuitBreaker, get_circuit_breaker
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFKC + 공백 정리)"""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+
+def _encode(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _decode(raw: bytes) -> List[float]:
+    vector = array("f")
+    vector.frombytes(raw)
+    return vector.tolist()
+
+
+def embed_queries(embeddings: Embeddings, texts: List[str]) -> List[List[float]]:
+    """
+    여러 쿼리를 한 번에 임베딩 (쿼리 모델 사용)
+
+    Embeddings 인터페이스의 배치 메서드(embed_documents)는 문서(passage) 모델을
+    사용하므로, UpstageEmbeddings는 쿼리 모델로 직접 배치 요청을 보냄
+
+    Args:
+        embeddings: 임베딩 함수
+        texts: 쿼리 리스트
+
+    Returns:
+        쿼리별 임베딩
+    """
+    if not texts:
+        return []
+    if isinstance(embeddings, (CachedEmbeddings, GuardedEmbeddings)):
+        return embeddings.embed_queries(texts)
+
+    from langchain_upstage import UpstageEmbeddings
+
+    if isinstance(embeddings, UpstageEmbeddings):
+        params = embeddings._invocation_params
+        params["model"] = params["model"] + "-query"
+        batch_size = embeddings.embed_batch_size
+
+        vectors: List[List[float]] = []
+        for i in range(0, len(texts), batch_size):
+            data = embeddings.client.create(input=texts[i : i + batch_size], **params).data
+            vectors.extend(r.embedding for r in data)
+        return vectors
+
+    return [embeddings.embed_query(text) for text in texts]
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    임베딩 캐시 래퍼
+
+    Example:
+        embeddings = CachedEmbeddings(
+            UpstageEmbeddings(model="solar-embedding-1-large"),
+            model="solar-embedding-1-large",
+            store=SQLiteCache("data/cache/embeddings.sqlite3"),
+        )
+        vector = embeddings.embed_query("안전계좌로 이체하세요")
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model: str,
+        store: Optional[SQLiteCache] = None,
+        memory_size: int = 2048,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            embeddings: 실제 임베딩 함수 (UpstageEmbeddings 등)
+            model: 임베딩 모델명 (캐시 키에 포함)
+            store: 영구 저장소 (None이면 인메모리만 사용)
+            memory_size: 인메모리 LRU 크기
+        """
+        self.embeddings = embeddings
+        self.model = model
+        self.store = store
+        self.memory: LRUCache[List[float]] = LRUCache(
+            maxsize=memory_size, name="embedding.memory"
+        )
+
+        self._stats_lock = threading.Lock()
+        self.remote_calls = 0
+        self.remote_texts = 0
+
+    def _key(self, normalized: str, kind: str) -> str:
+        raw = f"{self.model}\0{kind}\0{normalized}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        """메모리 → 디스크 순으로 조회 (디스크 hit은 메모리로 승격)"""
+        found: Dict[str, List[float]] = {}
+        missing: List[str] = []
+
+        for key in keys:
+            vector = self.memory.get(key)
+            if vector is None:
+                missing.append(key)
+            else:
+                found[key] = vector
+
+        if missing and self.store is not None:
+            for key, raw in self.store.get_many(missing).items():
+                vector = _decode(raw)
+                self.memory.set(key, vector)
+                found[key] = vector
+
+        return found
+
+    def _save(self, vectors: Dict[str, List[float]]) -> None:
+        for key, vector in vectors.items():
+            self.memory.set(key, vector)
+        if self.store is not None:
+            self.store.set_many({key: _encode(v) for key, v in vectors.items()})
+
+    def _embed_many(
+        self,
+        texts: List[str],
+        kind: str,
+        compute: Callable[[List[str]], List[List[float]]],
+    ) -> List[List[float]]:
+        """캐시 미스만 한 번의 배치 호출로 원격 임베딩"""
+        normalized = [normalize_text(t) for t in texts]
+        keys = [self._key(n, kind) for n in normalized]
+
+        found = self._lookup(keys)
+
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, normalized):
+            if key not in found and key not in pending:
+                pending[key] = text
+
+        if pending:
+            vectors = compute(list(pending.values()))
+            computed = dict(zip(pending.keys(), vectors))
+            self._save(computed)
+            found.update(computed)
+
+            with self._stats_lock:
+                self.remote_calls += 1
+                self.remote_texts += len(pending)
+
+        return [found[key] for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (캐시 미스만 배치 호출)"""
+        return self._embed_many(texts, "passage", self.embeddings.embed_documents)
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """여러 쿼리 임베딩 (캐시 미스만 배치 호출)"""
+        return self._embed_many(
+            texts, "query", lambda pending: embed_queries(self.embeddings, pending)
+        )
+
+    def embed_query(self, text: str) -> List[float]:
+        """쿼리 임베딩"""
+        normalized = normalize_text(text)
+        key = self._key(normalized, "query")
+
+        found = self._lookup([key])
+        if key in found:
+            return found[key]
+
+        vector = self.embeddings.embed_query(normalized)
+        self._save({key: vector})
+
+        with self._stats_lock:
+            self.remote_calls += 1
+            self.remote_texts += 1
+
+        return vector
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (메모리 / 디스크 / 원격 호출)"""
+        memory = self.memory.stats()
+        disk = self.store.stats() if self.store is not None else None
+
+        lookups = memory["hits"] + memory["misses"]
+        hits = memory["hits"] + (disk["hits"] if disk else 0)
+        return {
+            "model": self.model,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory": memory,
+            "disk": disk,
+            "remote_calls": self.remote_calls,
+            "remote_texts": self.remote_texts,
+        }
+
+    def close(self) -> None:
+        if self.store is not None:
+            self.store.close()
+
+
+class GuardedEmbeddings(Embeddings):
+    """
+    서킷 브레이커로 감싼 원격 임베딩
+
+    연속 실패로 서킷이 열리면 원격 호출 없이 CircuitOpenError
+    (호출 측 RAG 검색은 실패로 처리되어 BM25 결과만 사용)
+    """
+
+    def __init__(self, embeddings: Embeddings, breaker: CircuitBreaker) -> None:
+        self.embeddings = embeddings
+        self.breaker = breaker
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with self.breaker.protect():
+            return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        with self.breaker.protect():
+            return self.embeddings.embed_query(text)
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """여러 쿼리를 한 번에 임베딩 (배치 전체가 브레이커 호출 1회)"""
+        with self.breaker.protect():
+            return embed_queries(self.embeddings, texts)
+
+
+# ========== 전역 임베딩 함수 ========== #
+_embeddings: Optional[Embeddings] = None
+_lock = threading.Lock()
+
+
+def get_embeddings() -> Embeddings:
+    """
+    프로세스 전역 임베딩 함수
+
+    CIRCUIT_BREAKER_ENABLED이면 원격 임베딩을 GuardedEmbeddings("embedding")로,
+    EMBEDDING_CACHE_ENABLED이면 그 앞을 CachedEmbeddings로 감싸서 반환
+    """
+    global _embeddings
+    if _embeddings is None:
+        with _lock:
+            if _embeddings is None:
+                from langchain_upstage import UpstageEmbeddings
+                from app.config import settings
+
+                # 타임아웃을 RAG 데드라인에 맞추고 SDK 재시도를 끔
+                # (SDK 기본값은 수 분 대기 + 2회 재시도 → 데드라인 후에도 스레드가 계속 점유되고
+                #  느린 호출이 브레이커에 실패로 기록되지 않아 서킷이 열리지 않음)
+                embeddings: Embeddings = UpstageEmbeddings(
+                    api_key=settings.UPSTAGE_API_KEY,
+                    model=settings.EMBEDDING_MODEL,
+                    timeout=settings.EMBEDDING_TIMEOUT or settings.RAG_TIMEOUT,
+                    max_retries=0,
+                )
+
+                breaker = get_circuit_breaker("embedding")
+                if breaker is not None:
+                    embeddings = GuardedEmbeddings(embeddings, breaker)
+
+                if settings.EMBEDDING_CACHE_ENABLED:
+                    store = None
+                    if settings.EMBEDDING_CACHE_PATH:
+                        try:
+                            store = SQLiteCache(
+                                settings.EMBEDDING_CACHE_PATH,
+                                max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+                                name="embedding.disk",
+                            )
+                        except Exception as e:
+                            logger.warning("임베딩 디스크 캐시 비활성화: %s", e)
+
+                    embeddings = CachedEmbeddings(
+                        embeddings,
+                        model=settings.EMBEDDING_MODEL,
+                        store=store,
+                        memory_size=settings.EMBEDDING_CACHE_MEMORY_SIZE,
+                    )
+
+                _embeddings = embeddings
+    return _embeddings
+
+
+def get_embedding_cache_stats() -> Optional[Dict[str, Any]]:
+    """전역 임베딩 캐시 통계 (캐시 미사용 / 미생성 시 None)"""
+    embeddings = _embeddings
+    if isinstance(embeddings, CachedEmbeddings):
+        return embeddings.stats()
+    return None
+
+
+def close_embeddings() -> None:
+    """전역 임베딩 함수 정리 (디스크 캐시 연결 종료)"""
+    global _embeddings
+    with _lock:
+        embeddings, _embeddings = _embeddings, None
+    if isinstance(embeddings, CachedEmbeddings):
+        embeddings.close()
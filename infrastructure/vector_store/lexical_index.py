@@ -0,0 +1,139 @@
+"""
+BM25 어휘 검색 인덱스 + RRF 결합
+
+역할:
+- Chroma 컬렉션과 같은 문서로 프로세스 내 역색인(BM25) 구성
+- 한국어 토큰화: 어절 + 한글 2-gram (조사가 붙어도 "안전계좌" 매칭), URL/도메인은 통째로
+- 밀집(dense) 검색 결과와 Reciprocal Rank Fusion으로 결합
+- 임베딩 호출이 느리거나 실패해도 어휘 검색만으로 1ms 이내 결과 반환
+"""
+
+import hashlib
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+_URL_RE = re.compile(r"(?:https?://|www\.)\S+|[a-z0-9-]+(?:\.[a-z0-9-]+)*\.[a-z]{2,}(?:/\S*)?")
+_WORD_RE = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+
+def tokenize_ko(text: str) -> List[str]:
+    """
+    한국어 검색용 토큰화
+
+    - URL / 도메인: 원형 그대로 1개 토큰 (특정 URL 정확 매칭)
+    - 영문/숫자: 어절 단위
+    - 한글: 어절 + 2-gram (형태소 분석기 없이 조사/어미 변형 흡수)
+    """
+    text = unicodedata.normalize("NFKC", text or "").lower()
+
+    tokens: List[str] = []
+    for url in _URL_RE.findall(text):
+        tokens.append(url.rstrip(".,)"))
+    text = _URL_RE.sub(" ", text)
+
+    for word in _WORD_RE.findall(text):
+        tokens.append(word)
+        if len(word) > 2 and "가" <= word[0] <= "힣":
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def document_key(doc: Document) -> str:
+    """문서 식별 키 (RRF 결합용, 내용 해시)"""
+    return hashlib.sha1(doc.page_content.encode("utf-8")).hexdigest()
+
+
+class BM25Index:
+    """
+    Okapi BM25 역색인
+
+    Example:
+        index = BM25Index(documents)
+        results = index.search("안전계좌로 이체", k=5)
+    """
+
+    def __init__(
+        self, documents: Sequence[Document], k1: float = 1.5, b: float = 0.75
+    ) -> None:
+        self.documents = list(documents)
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._doc_len: List[int] = []
+
+        for idx, doc in enumerate(self.documents):
+            counts = Counter(tokenize_ko(doc.page_content))
+            self._doc_len.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self._postings[term].append((idx, tf))
+
+        n_docs = len(self.documents)
+        self._avgdl = (sum(self._doc_len) / n_docs) if n_docs else 0.0
+        self._idf = {
+            term: math.log(1 + (n_docs - len(p) + 0.5) / (len(p) + 0.5))
+            for term, p in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[Document, float]]:
+        """
+        BM25 검색
+
+        Returns:
+            (문서, 점수) 리스트 (점수 내림차순)
+        """
+        if not self.documents:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        k1, b, avgdl = self.k1, self.b, self._avgdl or 1.0
+
+        for term in set(tokenize_ko(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for idx, tf in postings:
+                norm = k1 * (1 - b + b * self._doc_len[idx] / avgdl)
+                scores[idx] += idf * tf * (k1 + 1) / (tf + norm)
+
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(self.documents[idx], score) for idx, score in top]
+
+
+def reciprocal_rank_fusion(
+    result_lists: Sequence[Sequence[Document]], k: int = 5, rrf_k: int = 60
+) -> List[Document]:
+    """
+    Reciprocal Rank Fusion
+
+    score(d) = Σ 1 / (rrf_k + rank)  (rank는 1부터)
+
+    Args:
+        result_lists: 검색기별 결과 (순위순)
+        k: 반환할 문서 수
+        rrf_k: 순위 완화 상수 (기본 60)
+
+    Returns:
+        결합된 문서 리스트
+    """
+    scores: Dict[str, float] = defaultdict(float)
+    docs: Dict[str, Document] = {}
+
+    for results in result_lists:
+        for rank, doc in enumerate(results, 1):
+            key = document_key(doc)
+            scores[key] += 1.0 / (rrf_k + rank)
+            docs.setdefault(key, doc)
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    return [docs[key] for key, _ in ranked[:k]]
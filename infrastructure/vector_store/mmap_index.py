@@ -0,0 +1,328 @@
+"""
+메모리 매핑 벡터 인덱스
+
+역할:
+- Chroma 컬렉션의 임베딩을 연속된 NumPy 파일(float32 또는 int8 양자화) + 메타데이터 JSON으로 내보내기
+- np.load(mmap_mode="r")로 매핑 → 모든 uvicorn 워커가 OS 페이지 캐시 한 벌을 공유
+- 쿼리는 행렬-벡터 곱 + argpartition top-k (Chroma 클라이언트 왕복 없음)
+
+파일 구성 (index_dir):
+- vectors.npy   (N, D) float32 또는 int8, 행마다 L2 정규화 (코사인 유사도)
+- scales.npy    (N,) float32, int8일 때만 (행별 역양자화 배율)
+- metadata.json ids / documents / metadatas / 모델명 / 내보낸 시각
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from infrastructure.vector_store.embedding_cache import embed_queries, get_embeddings
+from infrastructure.vector_store.lexical_index import BM25Index
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = Path(__file__).resolve().parents[2]
+
+VECTORS_FILE = "vectors.npy"
+SCALES_FILE = "scales.npy"
+METADATA_FILE = "metadata.json"
+
+# 한 번에 점수를 계산할 블록의 float32 임시 배열 크기 상한 (행 수는 차원으로 환산)
+_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def _resolve(path: str | Path) -> Path:
+    path = Path(path)
+    return path if path.is_absolute() else _BASE_DIR / path
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _atomic_save_npy(path: Path, array: np.ndarray) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def export_collection(
+    collection: Any,
+    index_dir: str | Path,
+    quantize: bool = False,
+    model: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Chroma 컬렉션을 메모리 매핑용 파일로 내보내기
+
+    Args:
+        collection: chromadb Collection
+        index_dir: 출력 디렉토리
+        quantize: int8 양자화 여부 (파일 크기 1/4, 정확도 약간 손실)
+        model: 임베딩 모델명 (쿼리 임베딩과 일치 확인용)
+
+    Returns:
+        내보낸 인덱스 정보 (metadata.json 중 ids/documents/metadatas 제외)
+    """
+    data = collection.get(include=["embeddings", "documents", "metadatas"])
+    ids: List[str] = list(data["ids"])
+    embeddings = data["embeddings"]
+
+    if not ids:
+        raise ValueError(f"내보낼 문서가 없습니다: {collection.name}")
+
+    vectors = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+
+    out_dir = _resolve(index_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if quantize:
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+        _atomic_save_npy(out_dir / VECTORS_FILE, quantized)
+        _atomic_save_npy(out_dir / SCALES_FILE, scales.astype(np.float32))
+    else:
+        _atomic_save_npy(out_dir / VECTORS_FILE, vectors)
+        (out_dir / SCALES_FILE).unlink(missing_ok=True)
+
+    info = {
+        "collection": collection.name,
+        "model": model,
+        "count": len(ids),
+        "dim": int(vectors.shape[1]),
+        "dtype": "int8" if quantize else "float32",
+        "exported_at": datetime.now().isoformat(),
+    }
+
+    # 메타데이터는 마지막에 교체 (로더는 metadata.json 기준으로 파일을 검증)
+    meta_path = out_dir / METADATA_FILE
+    tmp = meta_path.with_name(METADATA_FILE + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                **info,
+                "ids": ids,
+                "documents": data["documents"],
+                "metadatas": data["metadatas"],
+            },
+            f,
+            ensure_ascii=False,
+        )
+    os.replace(tmp, meta_path)
+
+    return info
+
+
+class MmapVectorIndex:
+    """
+    읽기 전용 메모리 매핑 벡터 인덱스
+
+    Example:
+        index = MmapVectorIndex("data/vector_index")
+        for idx, score in index.search_vector(query_vector, k=5):
+            doc = index.document(idx)
+    """
+
+    def __init__(self, index_dir: str | Path) -> None:
+        self.index_dir = _resolve(index_dir)
+
+        with open(self.index_dir / METADATA_FILE, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        self.info: Dict[str, Any] = {
+            k: v for k, v in meta.items() if k not in ("ids", "documents", "metadatas")
+        }
+        self.ids: List[str] = meta["ids"]
+        self._documents: List[Optional[str]] = meta["documents"]
+        self._metadatas: List[Optional[Dict[str, Any]]] = meta["metadatas"]
+
+        self.vectors: np.ndarray = np.load(self.index_dir / VECTORS_FILE, mmap_mode="r")
+        self.scales: Optional[np.ndarray] = None
+        if self.vectors.dtype == np.int8:
+            self.scales = np.load(self.index_dir / SCALES_FILE, mmap_mode="r")
+
+        if self.vectors.shape[0] != len(self.ids):
+            raise ValueError(
+                f"벡터 수({self.vectors.shape[0]})와 메타데이터 수({len(self.ids)}) 불일치"
+            )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    def document(self, idx: int) -> Document:
+        return Document(
+            page_content=self._documents[idx] or "",
+            metadata=self._metadatas[idx] or {},
+        )
+
+    def documents(self) -> List[Document]:
+        return [self.document(i) for i in range(len(self.ids))]
+
+    def search_vector(self, vector: List[float], k: int = 5) -> List[Tuple[int, float]]:
+        """
+        코사인 유사도 top-k
+
+        Args:
+            vector: 쿼리 임베딩
+            k: 결과 수
+
+        Returns:
+            (행 번호, 유사도) 리스트 (유사도 내림차순)
+        """
+        return self.search_vectors([vector], k=k)[0]
+
+    def search_vectors(
+        self, vectors: List[List[float]], k: int = 5
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        여러 쿼리 top-k (인덱스를 한 번만 순회하는 행렬 곱)
+
+        Args:
+            vectors: 쿼리 임베딩 리스트
+            k: 쿼리당 결과 수
+
+        Returns:
+            쿼리별 (행 번호, 유사도) 리스트
+        """
+        n = len(self.ids)
+        if n == 0 or k <= 0 or not len(vectors):
+            return [[] for _ in vectors]
+
+        queries = np.asarray(vectors, dtype=np.float32)
+        if queries.ndim != 2 or queries.shape[1] != self.dim:
+            raise ValueError(f"쿼리 차원 불일치: {queries.shape[-1]} != {self.dim}")
+        queries = _normalize_rows(queries)
+
+        # int8 블록은 astype에서 항상 float32로 복사되므로 블록 크기를 바이트로 제한
+        block_rows = max(1, _BLOCK_BYTES // (self.dim * 4))
+        scores = np.empty((n, len(queries)), dtype=np.float32)
+        for start in range(0, n, block_rows):
+            block = self.vectors[start : start + block_rows]
+            block_scores = block.astype(np.float32, copy=False) @ queries.T
+            if self.scales is not None:
+                block_scores *= self.scales[start : start + block_rows, None]
+            scores[start : start + len(block)] = block_scores
+
+        k = min(k, n)
+        results: List[List[Tuple[int, float]]] = []
+        for column in scores.T:
+            top = np.argpartition(-column, k - 1)[:k]
+            top = top[np.argsort(-column[top])]
+            results.append([(int(i), float(column[i])) for i in top])
+        return results
+
+
+class MmapScamRepository:
+    """
+    메모리 매핑 인덱스 기반 검색 리포지토리 (읽기 전용)
+
+    ScamPatternRepository와 같은 검색 인터페이스 제공
+    (search / search_batch / lexical_search / warmup / ready / close)
+    문서 추가는 Chroma에 한 뒤 scripts/export_vector_index.py로 다시 내보냄
+    """
+
+    def __init__(self, index_dir: Optional[str] = None) -> None:
+        from app.config import settings
+
+        self.index = MmapVectorIndex(index_dir or settings.VECTOR_INDEX_PATH)
+        self.embeddings = get_embeddings()
+
+        model = self.index.info.get("model")
+        if model and model != settings.EMBEDDING_MODEL:
+            logger.warning(
+                "벡터 인덱스 모델(%s)과 쿼리 임베딩 모델(%s) 불일치", model, settings.EMBEDDING_MODEL
+            )
+
+        logger.info(
+            "벡터 인덱스 로드: %s (%s개 문서, %s, mmap)",
+            self.index.info.get("collection"),
+            len(self.index),
+            self.index.info.get("dtype"),
+        )
+
+        self._lexical_index: Optional[BM25Index] = None
+        self._lexical_lock = threading.Lock()
+        self.ready = False
+
+    def warmup(self, query: str = "금융감독원 안전계좌 이체") -> bool:
+        """BM25 구성 + 임베딩 연결 / 페이지 캐시 예열"""
+        self.build_lexical_index()
+        try:
+            self._search_vectors(query, k=1)
+            self.ready = True
+        except Exception as e:
+            logger.warning("벡터 인덱스 예열 실패: %s", e)
+            self.ready = False
+        return self.ready
+
+    def _search_vectors(self, query: str, k: int = 5) -> List[Document]:
+        """쿼리 임베딩 → top-k (실패 시 예외 전파)"""
+        vector = self.embeddings.embed_query(query)
+        return [self.index.document(i) for i, _ in self.index.search_vector(vector, k=k)]
+
+    def search(self, query: str, k: int = 5) -> List[Document]:
+        """유사 문서 검색"""
+        try:
+            return self._search_vectors(query, k=k)
+        except Exception as e:
+            logger.warning("검색 실패: %s", e)
+            return []
+
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Document]]:
+        """
+        여러 쿼리 동시 검색 (임베딩 1회 배치 호출 + 행렬 곱 1회)
+
+        Raises:
+            Exception: 임베딩 실패 (호출 측에서 BM25로 대체)
+        """
+        if not queries:
+            return []
+        vectors = embed_queries(self.embeddings, queries)
+        return [
+            [self.index.document(i) for i, _ in hits]
+            for hits in self.index.search_vectors(vectors, k=k)
+        ]
+
+    def build_lexical_index(self) -> BM25Index:
+        """인덱스 문서로 BM25 인덱스 구성"""
+        with self._lexical_lock:
+            if self._lexical_index is None:
+                self._lexical_index = BM25Index(
+                    [doc for doc in self.index.documents() if doc.page_content]
+                )
+            return self._lexical_index
+
+    def lexical_search(self, query: str, k: int = 5) -> List[Document]:
+        """BM25 어휘 검색 (임베딩 지연/장애와 무관)"""
+        return [doc for doc, _ in self.build_lexical_index().search(query, k=k)]
+
+    def add_documents(self, documents: List[Document]) -> None:
+        """
+        문서 추가 불가 (읽기 전용 인덱스)
+
+        Raises:
+            RuntimeError: 항상 (Chroma에 추가한 뒤 scripts/export_vector_index.py로 다시 내보내야 함)
+        """
+        raise RuntimeError(
+            "메모리 매핑 인덱스는 읽기 전용입니다. "
+            "Chroma 벡터스토어에 문서를 추가한 뒤 scripts/export_vector_index.py로 인덱스를 다시 생성하세요."
+        )
+
+    def close(self) -> None:
+        """리포지토리 종료 (매핑은 참조가 사라질 때 해제)"""
+        self.ready = False
@@ -0,0 +1,106 @@
+"""
+프로세스 전역 벡터 리포지토리
+
+역할:
+- 워커 시작 시 리포지토리를 한 번만 생성 + 예열
+  (VECTOR_BACKEND: chroma → ScamPatternRepository, mmap → MmapScamRepository)
+- 모든 요청이 같은 Chroma 클라이언트 / 임베딩 클라이언트 재사용
+- 종료 시 정리
+
+앱 lifespan 밖(스크립트 등)에서는 최초 호출 시 지연 생성
+백엔드 모듈(chromadb 등)은 생성 시점에 import (모듈 import만으로 로드하지 않음)
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from infrastructure.vector_store.mmap_index import MmapScamRepository
+    from infrastructure.vector_store.scam_repository import ScamPatternRepository
+
+VectorRepository = Union["ScamPatternRepository", "MmapScamRepository"]
+
+# 초기화 실패 후 재시도까지 대기 시간 (요청마다 재생성 시도 방지)
+_RETRY_INTERVAL = 30.0
+
+_repository: Optional[VectorRepository] = None
+_lock = threading.Lock()
+_last_failure: float = 0.0
+
+
+def _create_repository() -> VectorRepository:
+    from app.config import settings
+
+    if settings.VECTOR_BACKEND == "mmap":
+        from infrastructure.vector_store.mmap_index import MmapScamRepository
+
+        return MmapScamRepository(settings.VECTOR_INDEX_PATH)
+
+    from infrastructure.vector_store.scam_repository import ScamPatternRepository
+
+    return ScamPatternRepository(
+        collection_name=settings.CHROMA_COLLECTION,
+        persist_directory=settings.CHROMA_PATH,
+    )
+
+
+def init_vector_repository(warmup: bool = True) -> VectorRepository:
+    """
+    전역 리포지토리 생성 (이미 있으면 그대로 반환)
+
+    Args:
+        warmup: 더미 쿼리로 예열 여부
+
+    Returns:
+        ScamPatternRepository 또는 MmapScamRepository
+    """
+    global _repository, _last_failure
+
+    with _lock:
+        if _repository is None:
+            try:
+                _repository = _create_repository()
+            except Exception:
+                _last_failure = time.monotonic()
+                raise
+
+        repo = _repository
+
+    if warmup and not repo.ready:
+        repo.warmup()
+    return repo
+
+
+def get_vector_repository() -> VectorRepository:
+    """
+    전역 리포지토리 반환
+
+    Raises:
+        RuntimeError: 최근 초기화 실패 후 재시도 대기 중
+    """
+    repo = _repository
+    if repo is not None:
+        return repo
+
+    if time.monotonic() - _last_failure < _RETRY_INTERVAL:
+        raise RuntimeError("벡터 리포지토리 초기화 실패 (재시도 대기 중)")
+
+    return init_vector_repository(warmup=False)
+
+
+def is_vector_repository_ready() -> bool:
+    """리포지토리 생성 + 예열 완료 여부"""
+    repo = _repository
+    return bool(repo is not None and repo.ready)
+
+
+def close_vector_repository() -> None:
+    """전역 리포지토리 종료"""
+    global _repository
+
+    with _lock:
+        repo, _repository = _repository, None
+
+    if repo is not None:
+        repo.close()
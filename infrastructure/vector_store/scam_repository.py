@@ -11,38 +11,47 @@ from pathlib import Path
 from typing import Optional, List, Dict
 import hashlib
 import asyncio
+import logging
+import threading
 
 import chromadb
+from chromadb.api.client import SharedSystemClient
 from chromadb.config import Settings as ChromaSettings
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
-from langchain_upstage import UpstageEmbeddings
 from functools import lru_cache
 
+from infrastructure.cache import LRUCache
+from infrastructure.vector_store.embedding_cache import embed_queries, get_embeddings
+from infrastructure.vector_store.lexical_index import BM25Index
+
+logger = logging.getLogger(__name__)
+
 
 class ScamPatternRepository:
     """
     사기 패턴 검색 리포지토리 (기본 버전)
+
+    워커당 한 번만 생성하여 재사용 (infrastructure.vector_store.provider)
     """
     def __init__(
         self,
-        collection_name: str = "scam_defense",
+        collection_name: Optional[str] = None,
         persist_directory: Optional[str] = None,
     ) -> None:
-        self.collection_name = collection_name
+        from app.config import settings
+
+        self.collection_name = collection_name or settings.CHROMA_COLLECTION
 
         if persist_directory:
-            self.persist_directory = Path
+            self.persist_directory = Path(persist_directory)
+        else:
             self.persist_directory = Path("data/chroma_scam_defense")
 
         self.persist_directory.mkdir(parents=True, exist_ok=True)
 
-        from app.config import settings
-
-        self.embeddings = UpstageEmbeddings(
-            api_key=settings.UPSTAGE_API_KEY,
-            model="solar-embedding-1-large",
-        )
+        # 프로세스 전역 임베딩 함수 (쿼리 임베딩 캐시 포함)
+        self.embeddings = get_embeddings()
 
         self.client = chromadb.PersistentClient(
             path=str(self.persist_directory.absolute()),
@@ -51,9 +60,9 @@ class ScamPatternRepository:
 
         try:
             self.collection = self.client.get_or_create_collection(self.collection_name)
-            print(f"[INFO] 컬렉션 로드: {self.collection_name} ({self.collection.count()}개 문서)")
+            logger.info("컬렉션 로드: %s (%s개 문서)", self.collection_name, self.collection.count())
         except Exception as e:
-            print(f"[WARNING] 컬렉션 생성/로드: {e}")
+            logger.warning("컬렉션 생성/로드: %s", e)
             self.collection = self.client.create_collection(self.collection_name)
 
         self.vectorstore = Chroma(
@@ -61,17 +70,98 @@ class ScamPatternRepository:
             collection_name=self.collection_name,
             embedding_function=self.embeddings,
         )
+        self.ready = False
+
+        # 컬렉션 문서 기반 BM25 인덱스 (임베딩 없이 검색, 문서 추가 시 재구성)
+        self._lexical_index: Optional[BM25Index] = None
+        self._lexical_lock = threading.Lock()
+
+    def warmup(self, query: str = "금융감독원 안전계좌 이체") -> bool:
+        """
+        더미 쿼리로 임베딩 연결 / HNSW 인덱스 예열
+
+        Returns:
+            예열 성공 여부
+        """
+        self.build_lexical_index()
+        try:
+            self.vectorstore.similarity_search(query, k=1)
+            self.ready = True
+        except Exception as e:
+            logger.warning("벡터스토어 예열 실패: %s", e)
+            self.ready = False
+        return self.ready
+
     def search(self, query: str, k: int = 5) -> List[Document]:
         """유사 문서 검색"""
         try:
             results = self.vectorstore.similarity_search(query, k=k)
             return results
         except Exception as e:
-            print(f"  ⚠️ 검색 실패: {e}")
+            logger.warning("검색 실패: %s", e)
+            return []
+
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Document]]:
+        """
+        여러 쿼리 동시 검색 (임베딩 1회 배치 호출 + Chroma query 1회)
+
+        Raises:
+            Exception: 임베딩 / 검색 실패 (호출 측에서 BM25로 대체)
+        """
+        if not queries:
             return []
+
+        vectors = embed_queries(self.embeddings, queries)
+        results = self.collection.query(
+            query_embeddings=vectors,
+            n_results=k,
+            include=["documents", "metadatas"],
+        )
+        return [
+            [
+                Document(page_content=text, metadata=meta or {})
+                for text, meta in zip(texts, metas)
+                if text is not None
+            ]
+            for texts, metas in zip(results["documents"], results["metadatas"])
+        ]
+
+    def build_lexical_index(self) -> BM25Index:
+        """컬렉션 전체 문서로 BM25 인덱스 구성 (임베딩 호출 없음)"""
+        with self._lexical_lock:
+            if self._lexical_index is None:
+                try:
+                    data = self.collection.get(include=["documents", "metadatas"])
+                    documents = [
+                        Document(page_content=text, metadata=meta or {})
+                        for text, meta in zip(data["documents"], data["metadatas"])
+                        if text
+                    ]
+                except Exception as e:
+                    logger.warning("BM25 인덱스 구성 실패: %s", e)
+                    return BM25Index([])
+                self._lexical_index = BM25Index(documents)
+                logger.info("BM25 인덱스 구성: %s개 문서", len(documents))
+            return self._lexical_index
+
+    def lexical_search(self, query: str, k: int = 5) -> List[Document]:
+        """BM25 어휘 검색 (임베딩 지연/장애와 무관)"""
+        return [doc for doc, _ in self.build_lexical_index().search(query, k=k)]
+
     def add_documents(self, documents: List[Document]) -> None:
         """문서 추가"""
         self.vectorstore.add_documents(documents)
+        with self._lexical_lock:
+            self._lexical_index = None
+
+    def close(self) -> None:
+        """ChromaDB 클라이언트 종료"""
+        self.ready = False
+        try:
+            self.client._system.stop()
+        except Exception as e:
+            logger.warning("ChromaDB 종료 실패: %s", e)
+        SharedSystemClient.clear_system_cache()
 
 
 class FastScamRepository:
@@ -100,12 +190,8 @@ class FastScamRepository:
 
         self.persist_directory.mkdir(parents=True, exist_ok=True)
 
-        from app.config import settings
-
-        self.embeddings = UpstageEmbeddings(
-            api_key=settings.UPSTAGE_API_KEY,
-            model="solar-embedding-1-large",
-        )
+        # 프로세스 전역 임베딩 함수 (쿼리 임베딩 캐시 포함)
+        self.embeddings = get_embeddings()
 
         # ChromaDB 클라이언트
         self.client = chromadb.PersistentClient(
@@ -116,9 +202,9 @@ class FastScamRepository:
         # 컬렉션 로드
         try:
             self.collection = self.client.get_or_create_collection(self.collection_name)
-            print(f"[INFO] 컬렉션 로드: {self.collection_name} ({self.collection.count()}개 문서)")
+            logger.info("컬렉션 로드: %s (%s개 문서)", self.collection_name, self.collection.count())
         except Exception as e:
-            print(f"[WARNING] 컬렉션 생성/로드: {e}")
+            logger.warning("컬렉션 생성/로드: %s", e)
             self.collection = self.client.create_collection(self.collection_name)
 
         self.vectorstore = Chroma(
@@ -127,7 +213,9 @@ class FastScamRepository:
             embedding_function=self.embeddings,
         )
 
-        self._embedding_cache: Dict[str, List[Document]] = {}
+        self._embedding_cache: LRUCache[List[Document]] = LRUCache(
+            maxsize=1000, name="fast_repository.search"
+        )
 
     @lru_cache(maxsize=1000)
     def _get_cache_key(self, text: str) -> str:
@@ -154,17 +242,18 @@ class FastScamRepository:
         #캐시확인
         if use_cache:
             cache_key = self._get_cache_key(query)
-            if cache_key in self._embedding_cache:
-                print(f"  ✓ 캐시에서 로드")
-                return self._embedding_cache[cache_key][:k]
+            cached = self._embedding_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("캐시에서 로드")
+                return cached[:k]
 
         try:    
             results = self.vectorstore.similarity_search(query, k=k)
             if use_cache:
-                self._embedding_cache[cache_key] = results
+                self._embedding_cache.set(cache_key, results)
             return results
         except Exception as e:
-            print(f"  ⚠️ 검색 실패: {e}")
+            logger.warning("검색 실패: %s", e)
             return []
     
     async def search_async(
@@ -0,0 +1,132 @@
+"""
+import 시간 벤치마크 스크립트
+
+역할:
+1. 새 파이썬 프로세스에서 대상 모듈(기본 app.main)을 import하는 시간을 N회 측정
+   (워커 부팅 시간 = 오토스케일링 시 새 워커가 요청을 받기까지 걸리는 시간의 하한)
+2. python -X importtime 출력으로 누적 시간이 큰 모듈 상위 목록 출력
+3. --max-seconds 지정 시 중앙값이 예산을 넘으면 종료 코드 1 (CI에서 회귀 감지)
+
+사용법:
+    python scripts/benchmark_import.py [--module app.main] [--runs 5] [--top 15] [--max-seconds 1.5]
+
+무거운 의존성(langgraph / chromadb / langchain_upstage)은 시작 예열(app.startup)에서
+백그라운드로 import되므로 app.main import에 포함되면 안 됨 (--forbid로 확인)
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# app.main import 시 로드되면 안 되는 패키지 (시작 예열에서 import)
+DEFAULT_FORBIDDEN = ("langgraph", "chromadb", "langchain_upstage")
+
+
+def _measure(module: str) -> Tuple[float, Dict[str, int]]:
+    """
+    새 프로세스에서 1회 import
+
+    Returns:
+        (import 시간 초, {모듈명: 누적 import 시간 μs})
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - start)"
+    )
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+    # 설정 검증만 통과하면 되므로 API 키가 없으면 더미 값 (외부 호출 없음)
+    env.setdefault("UPSTAGE_API_KEY", "benchmark")
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(total)
+
+    elapsed = float(result.stdout.strip().splitlines()[-1])
+    return elapsed, cumulative
+
+
+def main() -> bool:
+    parser = argparse.ArgumentParser(description="모듈 import 시간 측정 (워커 부팅 시간)")
+    parser.add_argument("--module", default="app.main", help="측정 대상 모듈")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (새 프로세스)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 수")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None, help="import 시간 예산 (중앙값 기준, 초)"
+    )
+    parser.add_argument(
+        "--forbid",
+        nargs="*",
+        default=list(DEFAULT_FORBIDDEN),
+        help="import되면 실패로 처리할 최상위 패키지",
+    )
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print(f"⏱️  import 시간 벤치마크: {args.module}")
+    print("=" * 60)
+
+    try:
+        # 첫 실행은 .pyc 생성 / 파일 캐시 예열용 (측정 제외)
+        _measure(args.module)
+        runs: List[float] = []
+        cumulative: Dict[str, int] = {}
+        for _ in range(max(args.runs, 1)):
+            elapsed, cumulative = _measure(args.module)
+            runs.append(elapsed)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ import 실패:\n{e.stderr[-2000:]}")
+        return False
+
+    median = statistics.median(runs)
+    print(f"\n[import 시간] {len(runs)}회")
+    print(f"  중앙값: {median:.3f}초")
+    print(f"  최소 / 최대: {min(runs):.3f}초 / {max(runs):.3f}초")
+
+    # 최상위 패키지 단위 누적 시간 (중첩 import는 부모에 포함되므로 최상위만 합산)
+    packages: Dict[str, int] = {}
+    for name, total in cumulative.items():
+        top_level = name.split(".")[0]
+        packages[top_level] = max(packages.get(top_level, 0), total)
+
+    print(f"\n[누적 import 시간 상위 {args.top}개 패키지] (마지막 실행 기준)")
+    for name, total in sorted(packages.items(), key=lambda x: x[1], reverse=True)[: args.top]:
+        print(f"  {total / 1000:8.1f}ms  {name}")
+
+    ok = True
+    loaded = sorted(set(args.forbid) & set(packages))
+    if loaded:
+        print(f"\n❌ 시작 시 import되면 안 되는 패키지: {', '.join(loaded)}")
+        ok = False
+
+    if args.max_seconds is not None:
+        if median > args.max_seconds:
+            print(f"\n❌ 예산 초과: {median:.3f}초 > {args.max_seconds:.3f}초")
+            ok = False
+        else:
+            print(f"\n✅ 예산 이내: {median:.3f}초 ≤ {args.max_seconds:.3f}초")
+
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
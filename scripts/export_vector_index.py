@@ -0,0 +1,64 @@
+"""
+벡터 인덱스 내보내기 스크립트
+
+역할:
+1. ChromaDB 컬렉션의 임베딩 / 문서 / 메타데이터 로드
+2. 연속된 NumPy 파일 (float32 또는 int8) + metadata.json으로 저장
+3. VECTOR_BACKEND=mmap 으로 실행하면 모든 워커가 이 파일을 메모리 매핑해 공유
+
+사용법:
+    python scripts/export_vector_index.py [--quantize] [--out data/vector_index]
+
+벡터 DB를 갱신한 뒤(update_vectorstore_with_web.py) 다시 실행하고 워커를 재시작
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import chromadb
+from chromadb.config import Settings as ChromaSettings
+
+from app.config import settings
+from infrastructure.vector_store.mmap_index import MmapVectorIndex, export_collection
+
+
+def main() -> bool:
+    parser = argparse.ArgumentParser(description="ChromaDB → 메모리 매핑 벡터 인덱스")
+    parser.add_argument("--out", default=settings.VECTOR_INDEX_PATH, help="출력 디렉토리")
+    parser.add_argument("--quantize", action="store_true", help="int8 양자화")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("📦 벡터 인덱스 내보내기")
+    print("=" * 60)
+
+    try:
+        client = chromadb.PersistentClient(
+            path=str((PROJECT_ROOT / settings.CHROMA_PATH).absolute()),
+            settings=ChromaSettings(anonymized_telemetry=False),
+        )
+        collection = client.get_collection(settings.CHROMA_COLLECTION)
+
+        info = export_collection(
+            collection, args.out, quantize=args.quantize, model=settings.EMBEDDING_MODEL
+        )
+
+        # 내보낸 파일 검증 (자기 자신이 top-1)
+        index = MmapVectorIndex(args.out)
+        top = index.search_vector(index.vectors[0].astype("float32"), k=1)
+        assert top and top[0][0] == 0, "검증 실패: 첫 문서가 자기 자신을 찾지 못함"
+    except Exception as e:
+        print(f"❌ 내보내기 실패: {e}")
+        return False
+
+    print(f"✅ {info['count']}개 문서 ({info['dim']}차원, {info['dtype']})")
+    print(f"   출력: {index.index_dir}")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -16,6 +16,10 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from agent.graph import get_graph
 from agent.state import AgentState
+from infrastructure.log import setup_logging
+
+# 노드별 상세 로그(DEBUG)를 사람이 읽는 형식으로 출력
+setup_logging(level="DEBUG", fmt="text")
 
 
 # ========== 테스트 케이스 ========== #
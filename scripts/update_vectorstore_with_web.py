@@ -9,12 +9,16 @@
 
 import hashlib
 import json
+import os
 import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# 문서 배치 임베딩은 요청 경로의 RAG 데드라인(기본 1초)보다 오래 걸림
+os.environ.setdefault("EMBEDDING_TIMEOUT", "60")
+
 from scripts.web_crawler import ScamNewsCrawler
 from infrastructure.vector_store.scam_repository import FastScamRepository
 from datetime import datetime